@@ -97,6 +97,15 @@ class ResourceManager:
             logger.error("Failed to load sound %s: %s", path, e)
             return None
 
+    def unload_sound(self, path: str) -> None:
+        """
+        Drop a sound from the cache so its decoded samples can be freed.
+
+        Args:
+            path: Path the sound was loaded from.
+        """
+        self._sound_cache.pop(path, None)
+
     def load_font(self, path: Optional[str], size: int) -> pygame.font.Font:
         """
         Load a font with caching.
@@ -127,6 +136,7 @@ class ResourceManager:
         self._sound_cache.clear()
         self._font_cache.clear()
         self._animation_cache.clear()
+        SpriteLoader.clear_cache()
         logger.info("Resource cache cleared")
 
     def load_animations(
@@ -12,27 +12,44 @@ MAX_FALL_SPEED = 15.0
 JUMP_FORCE = -16.0
 WALL_SLIDE_SPEED = 2.0
 FRICTION_STOP_THRESHOLD = 0.1
-RAYCAST_STEP_SIZE = 4
+COLLISION_CELL_SIZE = 64  # Broad-phase grid cell for tile collisions (about 2 tiles)
 
 # Player
 PLAYER_SPEED = 5.0
 DASH_SPEED = 15.0
 DASH_DURATION = 0.2
+DASH_DURATION_TICKS = round(DASH_DURATION * FPS)  # Dash length in frames
 ATTACK_COMBO_WINDOW = 0.5
 INVULNERABILITY_DURATION = 0.5
 
+# Input
+INPUT_EVENT_QUEUE_SIZE = 32  # Key-down events buffered between input updates
+
 # Enemy
 ENEMY_SPEED = 2.0
 ENEMY_DETECTION_RANGE = 200.0
 ENEMY_ATTACK_RANGE = 50.0
 ENEMY_ATTACK_DAMAGE = 10
 ENEMY_ATTACK_COOLDOWN = 1.0
+# Farthest an enemy's attack hitbox reaches past its own hitbox; enemies
+# farther than this from the player skip attack checks entirely
+ENEMY_ATTACK_REACH = 96
 ENEMY_PATROL_PAUSE = 1.0
+ENEMY_PATROL_ARRIVAL_DISTANCE = 5.0  # Waypoint reached within this many pixels
 
 # AI Decision Making
 AI_DECISION_COOLDOWN = 0.2
 AI_DECISION_INTERVAL = 0.3
 AI_TARGET_SPEED_THRESHOLD = 0.5
+AI_LOD_MID_DISTANCE = 640.0  # Beyond this, patrol AI ticks at reduced rate
+AI_LOD_MID_INTERVAL = 4  # Frames between patrol ticks in the mid band
+AI_CULL_DISTANCE = 1280.0  # Beyond this, patrol AI is paused entirely
+AI_RECHECK_DISTANCE_BUCKET = 32.0  # Re-decide only when distance crosses a bucket
+AI_RECHECK_HEALTH_BUCKET = 10  # ...or health crosses a bucket
+AI_RECHECK_TIME_BUCKET = 0.25  # ...or time since attack crosses a bucket
+AI_FAST_RETREAT_HEALTH = 0.2  # Health ratio below which cautious AI retreats outright
+AI_FAST_RETREAT_MAX_AGGRESSION = 0.7  # Aggression at or above this never fast-retreats
+AI_FAST_ATTACK_READY_TIME = 0.5  # Time since last attack before an in-range attack is certain
 
 # Colors
 BLACK = (0, 0, 0)
@@ -50,7 +67,15 @@ SHOW_FPS = True
 MUSIC_VOLUME = 0.7
 SFX_VOLUME = 0.8
 AUDIO_FREQUENCY = 44100
-AUDIO_BUFFER_SIZE = 512
+AUDIO_BUFFER_SIZE = 512  # Small buffer keeps SFX latency low
+AUDIO_FALLBACK_BUFFER_SIZE = 1024  # Retried if the device rejects the small buffer
+# Mono halves mixer buffer memory and mixdown work; stereo panning needs False
+MONO_AUDIO = False
+AUDIO_MIXER_CHANNELS = 16  # Simultaneous SFX before sounds cut each other off
+SFX_MAX_FILE_BYTES = 2_000_000  # Larger files belong to pygame.mixer.music (streamed)
+SFX_CACHE_LIMIT = 64  # Decoded sound effects kept in memory (least recently used evicted)
+# Sound effects decoded while the game screen loads, so first plays don't stall
+GAMEPLAY_SFX = ("jump", "land", "dash", "56_Attack_03", "61_Hit_03", "enemy_hurt")
 
 # Paths
 ASSETS_PATH = "assets"
@@ -223,7 +223,7 @@ class Boss(Entity):
                 self.change_behavior(next_behavior)
 
         # Apply physics
-        self.physics.apply_gravity(dt)
+        self.physics.step(dt)
         self.apply_velocity(dt)
 
         # Update animation
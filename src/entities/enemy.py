@@ -5,12 +5,16 @@ Implements enemy entities with patrol, chase, and attack behaviors.
 Includes SmartEnemy with utility-based AI for intelligent decision making.
 """
 
+import itertools
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import pygame
 
 from src.core.settings import (
+    AI_CULL_DISTANCE,
+    AI_LOD_MID_DISTANCE,
+    AI_LOD_MID_INTERVAL,
     ENEMY_ATTACK_DAMAGE,
     ENEMY_ATTACK_RANGE,
     ENEMY_DETECTION_RANGE,
@@ -33,10 +37,32 @@ from src.systems.ai import (
 from src.systems.animation import Animation, AnimationController, create_placeholder_frames
 from src.systems.audio import AudioManager
 from src.systems.physics import PhysicsBody
+from src.systems.timers import Timer, TimerSystem
 
 logger = logging.getLogger(__name__)
 
 
+# Behavior name -> animation name, shared by every enemy instead of being
+# rebuilt on each transition (Enemy) or each frame (SmartEnemy)
+ENEMY_BEHAVIOR_ANIMATIONS: Dict[str, str] = {
+    "patrol": "walk",
+    "chase": "walk",
+    "attack": "attack",
+    "hurt": "hurt",
+    "death": "death",
+}
+
+# Staggers reduced-rate AI ticks so mid-range enemies don't all run together
+_LOD_STAGGER = itertools.count()
+
+SMART_ENEMY_BEHAVIOR_ANIMATIONS: Dict[str, str] = {
+    **ENEMY_BEHAVIOR_ANIMATIONS,
+    "smart_chase": "walk",
+    "flank": "flank",
+    "retreat": "retreat",
+}
+
+
 class Enemy(Entity):
     """
     Enemy entity with AI-driven behavior.
@@ -89,6 +115,14 @@ class Enemy(Entity):
         self.current_behavior: Optional[AIBehavior] = None
         self.target: Optional[Entity] = None
 
+        # Hurt/death timeouts are scheduled here when a timer system is set
+        self.timers: Optional[TimerSystem] = None
+        self._pending_timer: Optional[Timer] = None
+
+        # Level-of-detail state for patrol AI far from the target
+        self._lod_frame = next(_LOD_STAGGER) % AI_LOD_MID_INTERVAL
+        self._lod_pending_dt = 0.0
+
         self._setup_animations()
         self._setup_behaviors()
         self.change_behavior("patrol")
@@ -169,22 +203,19 @@ class Enemy(Entity):
         Args:
             behavior_name: Name of the behavior to change to.
         """
-        if behavior_name not in self.behaviors:
+        behavior = self.behaviors.get(behavior_name)
+        if behavior is None:
             logger.warning("Unknown behavior: %s", behavior_name)
             return
 
-        self.current_behavior = self.behaviors[behavior_name]
-        logger.debug("Behavior changed to: %s", behavior_name)
+        self._cancel_timeout()
+
+        self.current_behavior = behavior
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Behavior changed to: %s", behavior_name)
 
         # Update animation based on behavior
-        animation_map = {
-            "patrol": "walk",
-            "chase": "walk",
-            "attack": "attack",
-            "hurt": "hurt",
-            "death": "death",
-        }
-        anim_name = animation_map.get(behavior_name, "idle")
+        anim_name = ENEMY_BEHAVIOR_ANIMATIONS.get(behavior_name, "idle")
         self.animation.play(anim_name)
 
     def set_target(self, target: Optional[Entity]) -> None:
@@ -196,6 +227,54 @@ class Enemy(Entity):
         """
         self.target = target
 
+    def set_timer_system(self, timers: Optional[TimerSystem]) -> None:
+        """
+        Drive hurt and death timeouts from a shared timer system.
+
+        While a timeout is pending the behavior is not ticked at all.
+
+        A timeout pending on the previous system is cancelled; the current
+        behavior then counts down in update() as usual.
+
+        Args:
+            timers: Timer system advanced once per frame, or None to fall
+                back to the behaviors counting down in update().
+        """
+        self._cancel_timeout()
+        self.timers = timers
+
+    def _schedule_timeout(self, delay: float, callback: Callable[[], None]) -> None:
+        """
+        Schedule the end of the current hurt/death behavior.
+
+        Until it fires, update_body() holds the enemy still as the
+        behavior's own update() would. Does nothing without a timer system.
+
+        Args:
+            delay: Seconds until the callback fires.
+            callback: Function to call on expiry.
+        """
+        if self.timers is not None:
+            self._pending_timer = self.timers.schedule(delay, callback)
+
+    def _cancel_timeout(self) -> None:
+        """Cancel the pending hurt/death timeout, if any."""
+        timer = self._pending_timer
+        if timer is not None:
+            self._pending_timer = None
+            if self.timers is not None:
+                self.timers.cancel(timer)
+
+    def _end_stun(self) -> None:
+        """Return to patrol once the hurt stun expires."""
+        self._pending_timer = None
+        self.change_behavior("patrol")
+
+    def _end_death(self) -> None:
+        """Remove the enemy once the death timeout expires."""
+        self._pending_timer = None
+        self.kill()
+
     def update(self, dt: float) -> None:
         """
         Update enemy state.
@@ -203,14 +282,43 @@ class Enemy(Entity):
         Args:
             dt: Delta time in seconds.
         """
-        # Update current behavior
-        if self.current_behavior:
-            next_behavior = self.current_behavior.update(self, dt, self.target)
-            if next_behavior:
-                self.change_behavior(next_behavior)
+        self.update_ai(dt)
+        self.update_body(dt)
+
+    def update_ai(self, dt: float) -> None:
+        """
+        Tick the current behavior.
+
+        Split from update_body() so callers can run the AI pass for every
+        enemy before moving any of them.
+
+        Args:
+            dt: Delta time in seconds.
+        """
+        # Patrol may be throttled by distance; hurt/death are skipped while
+        # their timeout is scheduled
+        if self.current_behavior and self._pending_timer is None:
+            ai_dt = self._get_ai_step_dt(dt)
+            if ai_dt is not None:
+                next_behavior = self.current_behavior.update(self, ai_dt, self.target)
+                if next_behavior:
+                    self.change_behavior(next_behavior)
+
+    def update_body(self, dt: float) -> None:
+        """
+        Apply physics, animation and invulnerability for this frame.
+
+        Args:
+            dt: Delta time in seconds.
+        """
+        # Hold still while a hurt/death timeout stands in for the behavior
+        if self._pending_timer is not None:
+            self.velocity.x = 0
+            if isinstance(self.current_behavior, DeathBehavior):
+                self.velocity.y = 0
 
         # Apply physics
-        self.physics.apply_gravity(dt)
+        self.physics.step(dt)
         self.apply_velocity(dt)
 
         # Update animation
@@ -222,6 +330,51 @@ class Enemy(Entity):
         # Update invulnerability
         self.update_invulnerability(dt)
 
+    def _get_ai_step_dt(
+        self,
+        dt: float,
+        _cull_sq: float = AI_CULL_DISTANCE * AI_CULL_DISTANCE,
+        _mid_sq: float = AI_LOD_MID_DISTANCE * AI_LOD_MID_DISTANCE,
+        _interval: int = AI_LOD_MID_INTERVAL,
+    ) -> Optional[float]:
+        """
+        Level-of-detail gate for the behavior tick.
+
+        Only patrolling enemies are throttled: beyond AI_CULL_DISTANCE the
+        patrol is paused in place, beyond AI_LOD_MID_DISTANCE it runs every
+        AI_LOD_MID_INTERVAL frames with the skipped time carried over.
+
+        Args:
+            dt: Delta time in seconds.
+
+        Returns:
+            Delta time to tick the behavior with, or None to skip this frame.
+        """
+        target = self.target
+        if target is None or self.current_behavior is not self.behaviors.get("patrol"):
+            step = self._lod_pending_dt + dt
+            self._lod_pending_dt = 0.0
+            return step
+
+        dx = target.pos.x - self.pos.x
+        dy = target.pos.y - self.pos.y
+        distance_sq = dx * dx + dy * dy
+
+        if distance_sq > _cull_sq:
+            self._lod_pending_dt = 0.0
+            self.velocity.x = 0
+            return None
+
+        step = self._lod_pending_dt + dt
+        if distance_sq > _mid_sq:
+            self._lod_frame += 1
+            if self._lod_frame % _interval:
+                self._lod_pending_dt = step
+                return None
+
+        self._lod_pending_dt = 0.0
+        return step
+
     def take_damage(self, amount: int) -> None:
         """
         Apply damage to enemy.
@@ -244,6 +397,7 @@ class Enemy(Entity):
             death_behavior = self.behaviors.get("death")
             if isinstance(death_behavior, DeathBehavior):
                 death_behavior.start_death()
+                self._schedule_timeout(death_behavior.death_duration, self._end_death)
         else:
             # Play hurt sound
             AudioManager().play_sfx("enemy_hurt")
@@ -253,6 +407,7 @@ class Enemy(Entity):
             hurt_behavior = self.behaviors.get("hurt")
             if isinstance(hurt_behavior, HurtBehavior):
                 hurt_behavior.start_hurt()
+                self._schedule_timeout(hurt_behavior.stun_duration, self._end_stun)
 
     def get_attack_hitbox(self) -> Optional[pygame.Rect]:
         """
@@ -296,6 +451,24 @@ class Enemy(Entity):
         """
         return self.health <= 0
 
+    def get_blit_pair(
+        self, offset: pygame.math.Vector2
+    ) -> Optional[Tuple[pygame.Surface, pygame.math.Vector2]]:
+        """
+        Get the current frame and screen position for batched drawing.
+
+        Args:
+            offset: Camera offset to apply.
+
+        Returns:
+            (image, screen_pos) for Surface.blits, or None without a frame.
+        """
+        current_frame = self.animation.get_current_frame()
+        if not current_frame:
+            return None
+        self.image = current_frame
+        return current_frame, self.pos - offset
+
     def render(self, surface: pygame.Surface, offset: pygame.math.Vector2) -> None:
         """
         Render enemy to surface with camera offset.
@@ -304,11 +477,9 @@ class Enemy(Entity):
             surface: Surface to render on.
             offset: Camera offset to apply.
         """
-        screen_pos = self.pos - offset
-        current_frame = self.animation.get_current_frame()
-        if current_frame:
-            self.image = current_frame
-            surface.blit(self.image, screen_pos)
+        pair = self.get_blit_pair(offset)
+        if pair is not None:
+            surface.blit(*pair)
 
 
 class SmartEnemy(Entity):
@@ -503,7 +674,7 @@ class SmartEnemy(Entity):
         self.ai_controller.update(self, dt, self.target)
 
         # Apply physics
-        self.physics.apply_gravity(dt)
+        self.physics.step(dt)
         self.apply_velocity(dt)
 
         # Update animation based on current behavior
@@ -522,17 +693,7 @@ class SmartEnemy(Entity):
         if behavior is None:
             return
 
-        animation_map = {
-            "patrol": "walk",
-            "chase": "walk",
-            "smart_chase": "walk",
-            "attack": "attack",
-            "flank": "flank",
-            "retreat": "retreat",
-            "hurt": "hurt",
-            "death": "death",
-        }
-        anim_name = animation_map.get(behavior.name, "idle")
+        anim_name = SMART_ENEMY_BEHAVIOR_ANIMATIONS.get(behavior.name, "idle")
         self.animation.play(anim_name)
 
     def take_damage(self, amount: int) -> None:
@@ -620,6 +781,24 @@ class SmartEnemy(Entity):
         """
         return self.aggression
 
+    def get_blit_pair(
+        self, offset: pygame.math.Vector2
+    ) -> Optional[Tuple[pygame.Surface, pygame.math.Vector2]]:
+        """
+        Get the current frame and screen position for batched drawing.
+
+        Args:
+            offset: Camera offset to apply.
+
+        Returns:
+            (image, screen_pos) for Surface.blits, or None without a frame.
+        """
+        current_frame = self.animation.get_current_frame()
+        if not current_frame:
+            return None
+        self.image = current_frame
+        return current_frame, self.pos - offset
+
     def render(self, surface: pygame.Surface, offset: pygame.math.Vector2) -> None:
         """
         Render smart enemy to surface with camera offset.
@@ -628,8 +807,6 @@ class SmartEnemy(Entity):
             surface: Surface to render on.
             offset: Camera offset to apply.
         """
-        screen_pos = self.pos - offset
-        current_frame = self.animation.get_current_frame()
-        if current_frame:
-            self.image = current_frame
-            surface.blit(self.image, screen_pos)
+        pair = self.get_blit_pair(offset)
+        if pair is not None:
+            surface.blit(*pair)
@@ -25,6 +25,8 @@ class Entity(pygame.sprite.Sprite, ABC):
         health: Current health points.
         max_health: Maximum health points.
         invulnerable: Whether entity can take damage.
+        last_hit_generation: attack_generation of the last player attack
+            that hit this entity, or -1.
     """
 
     def __init__(
@@ -57,6 +59,7 @@ class Entity(pygame.sprite.Sprite, ABC):
         self.max_health = 100
         self.invulnerable = False
         self._invulnerable_timer = 0.0
+        self.last_hit_generation = -1
 
     @abstractmethod
     def update(self, dt: float) -> None:
@@ -83,13 +83,15 @@ class Player(Entity):
     def _register_states(self) -> None:
         """Register all player states."""
         from src.states.attack_state import AttackState
-        from src.states.dash_state import DashState
-        from src.states.fall_state import FallState
-        from src.states.idle_state import IdleState
-        from src.states.jump_state import JumpState
-        from src.states.run_state import RunState
-        from src.states.wall_climb_state import WallClimbState
-        from src.states.wall_slide_state import WallSlideState
+        from src.states.player_states import (
+            DashState,
+            FallState,
+            IdleState,
+            JumpState,
+            RunState,
+            WallClimbState,
+            WallSlideState,
+        )
 
         state_classes: List[Type[State]] = [
             IdleState,
@@ -102,9 +104,8 @@ class Player(Entity):
             AttackState,
         ]
 
-        for state_class in state_classes:
-            state = state_class(self)
-            self.states[state.name] = state
+        # Each state is built exactly once and reused for every transition
+        self.states = {state.name: state for state in (cls(self) for cls in state_classes)}
 
     def change_state(self, state_name: str) -> None:
         """
@@ -113,15 +114,16 @@ class Player(Entity):
         Args:
             state_name: Name of the state to change to.
         """
-        if state_name not in self.states:
+        next_state = self.states.get(state_name)
+        if next_state is None:
             logger.warning("Unknown state: %s", state_name)
             return
 
         if self.current_state:
             self.current_state.exit()
 
-        self.current_state = self.states[state_name]
-        self.current_state.enter()
+        self.current_state = next_state
+        next_state.enter()
         logger.debug("State changed to: %s", state_name)
 
     def update(self, dt: float) -> None:
@@ -138,7 +140,7 @@ class Player(Entity):
                 self.change_state(next_state)
 
         # Apply physics (gravity, etc.) AFTER state transitions
-        self.physics.apply_gravity(dt)
+        self.physics.step(dt)
         self.animation.update(dt)
         self.update_invulnerability(dt)
 
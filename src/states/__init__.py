@@ -1,16 +1,19 @@
 """FSM States."""
 
-from src.states.state import State
-from src.states.idle_state import IdleState
-from src.states.run_state import RunState
-from src.states.jump_state import JumpState
-from src.states.fall_state import FallState
-from src.states.wall_slide_state import WallSlideState
-from src.states.wall_climb_state import WallClimbState
-from src.states.dash_state import DashState
+from src.states.state import State, StateProtocol
+from src.states.player_states import (
+    DashState,
+    FallState,
+    IdleState,
+    JumpState,
+    RunState,
+    WallClimbState,
+    WallSlideState,
+)
 
 __all__ = [
     "State",
+    "StateProtocol",
     "IdleState",
     "RunState",
     "JumpState",
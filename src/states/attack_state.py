@@ -4,6 +4,7 @@ Attack state with combo system.
 Manages attack chains and hitbox generation.
 """
 
+import itertools
 import logging
 from typing import Any, Dict, TYPE_CHECKING, Optional
 
@@ -11,12 +12,17 @@ import pygame
 
 from src.states.state import State
 from src.systems.audio import AudioManager
+from src.systems.input_handler import ATTACK_BIT
 
 if TYPE_CHECKING:
     from src.entities.player import Player
 
 logger = logging.getLogger(__name__)
 
+# Shared by every AttackState so generations are unique across players and
+# restarts, and an entity's last_hit_generation can never match by accident
+_attack_generations = itertools.count()
+
 
 class AttackState(State):
     """
@@ -30,9 +36,19 @@ class AttackState(State):
         can_combo: Whether combo input is accepted.
         combo_buffered: Whether next attack was buffered.
         current_hitbox: Active attack hitbox.
-        hit_targets: Set of entities already hit by this attack.
+        attack_generation: Id of the current swing; a target whose
+            last_hit_generation equals it was already hit by this swing.
     """
 
+    __slots__ = (
+        "attack_number",
+        "attack_timer",
+        "can_combo",
+        "combo_buffered",
+        "current_hitbox",
+        "attack_generation",
+    )
+
     name = "attack"
 
     ATTACKS: Dict[int, Dict[str, Any]] = {
@@ -54,14 +70,14 @@ class AttackState(State):
         self.can_combo = False
         self.combo_buffered = False
         self.current_hitbox: Optional[pygame.Rect] = None
-        self.hit_targets: set = set()
+        self.attack_generation = next(_attack_generations)
 
     def enter(self) -> None:
         """Enter attack state."""
         self.attack_timer = 0.0
         self.can_combo = False
         self.combo_buffered = False
-        self.hit_targets.clear()
+        self.attack_generation = next(_attack_generations)
         self._create_attack_hitbox()
 
         attack = self.ATTACKS[self.attack_number]
@@ -95,7 +111,7 @@ class AttackState(State):
             self.can_combo = True
 
         # Check for combo input
-        if self.can_combo and self.player.input_handler.is_action_just_pressed("attack"):
+        if self.can_combo and self.player.input_handler.consume_just_pressed(ATTACK_BIT):
             self.combo_buffered = True
 
         # Attack finished
@@ -0,0 +1,596 @@
+"""
+Player FSM states.
+
+All locomotion states live in one module so they share a single set of
+imports, logger and module-level constants. The per-state modules
+(idle_state.py, run_state.py, ...) re-export from here for compatibility.
+"""
+
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from src.core.settings import (
+    DASH_DURATION_TICKS,
+    DASH_SPEED,
+    FPS,
+    INVULNERABILITY_DURATION,
+    JUMP_FORCE,
+    PLAYER_SPEED,
+    WALL_SLIDE_SPEED,
+)
+from src.states.state import STATE_FALL, STATE_IDLE, STATE_RUN, State, ground_transition
+from src.systems.audio import AudioManager
+from src.systems.input_handler import ATTACK_BIT, DASH_BIT, JUMP_BIT
+
+if TYPE_CHECKING:
+    from src.entities.player import Player
+
+logger = logging.getLogger(__name__)
+
+
+# Wall climb speed (climbing up is slower than sliding down)
+WALL_CLIMB_SPEED = -WALL_SLIDE_SPEED * 1.5
+
+
+class IdleState(State):
+    """
+    Idle state - player standing still.
+
+    Transitions to:
+        - run: on horizontal input
+        - jump: on jump input while on ground
+        - fall: when not on ground
+        - dash: on dash input
+        - attack: on attack input
+    """
+
+    __slots__ = ()
+
+    name = "idle"
+
+    _TRANSITION_TABLE = ((DASH_BIT, "dash"), (ATTACK_BIT, "attack"), (JUMP_BIT, "jump"))
+
+    def enter(self) -> None:
+        """Enter idle state, stop horizontal movement."""
+        self.player.physics.velocity.x = 0
+        self.player.animation.play("idle")
+        logger.debug("Entered idle state")
+
+    def update(self, dt: float) -> Optional[str]:
+        """
+        Update idle state.
+
+        Args:
+            dt: Delta time in seconds.
+
+        Returns:
+            Next state name or None.
+        """
+        # Check for transitions
+        return self.handle_input()
+
+    def exit(self) -> None:
+        """Exit idle state."""
+        logger.debug("Exiting idle state")
+
+    def handle_input(self) -> Optional[str]:
+        """
+        Handle input for state transitions.
+
+        Returns:
+            Next state name or None.
+        """
+        next_state = self._match_transition_table()
+        if next_state is not None:
+            return next_state
+
+        # Check movement or falling
+        next_state = ground_transition(
+            self.player.physics.on_ground, self.player.input_handler.get_horizontal_axis()
+        )
+        if next_state is STATE_IDLE:
+            return None
+        return next_state
+
+
+class RunState(State):
+    """
+    Run state - player moving horizontally.
+
+    Transitions to:
+        - idle: no horizontal input while on ground
+        - jump: on jump input while on ground
+        - fall: when not on ground
+        - dash: on dash input
+        - attack: on attack input
+    """
+
+    __slots__ = ()
+
+    name = "run"
+
+    _TRANSITION_TABLE = ((DASH_BIT, "dash"), (ATTACK_BIT, "attack"), (JUMP_BIT, "jump"))
+
+    def enter(self) -> None:
+        """Enter run state, start run animation."""
+        self.player.animation.play("run")
+        logger.debug("Entered run state")
+
+    def update(self, dt: float, _pspeed: float = PLAYER_SPEED) -> Optional[str]:
+        """
+        Update run state.
+
+        Args:
+            dt: Delta time in seconds.
+            _pspeed: Player speed bound at definition time for fast local access.
+
+        Returns:
+            Next state name or None.
+        """
+        # Apply horizontal movement
+        horizontal = self.player.input_handler.get_horizontal_axis()
+
+        if horizontal != 0:
+            self.player.physics.velocity.x = horizontal * _pspeed
+            self.player.facing_right = horizontal > 0
+            self.player.animation.set_facing(self.player.facing_right)
+
+        # Check for transitions, reusing the axis read above
+        return self._transition(horizontal)
+
+    def exit(self) -> None:
+        """Exit run state."""
+        logger.debug("Exiting run state")
+
+    def handle_input(self) -> Optional[str]:
+        """
+        Handle input for state transitions.
+
+        Returns:
+            Next state name or None.
+        """
+        return self._transition(self.player.input_handler.get_horizontal_axis())
+
+    def _transition(self, horizontal: int) -> Optional[str]:
+        """
+        Pick the next state given this frame's horizontal input.
+
+        Args:
+            horizontal: Horizontal input axis (-1, 0 or 1).
+
+        Returns:
+            Next state name or None.
+        """
+        next_state = self._match_transition_table()
+        if next_state is not None:
+            return next_state
+
+        # Check if no horizontal input (return to idle) or falling
+        next_state = ground_transition(self.player.physics.on_ground, horizontal)
+        if next_state is STATE_RUN:
+            return None
+        return next_state
+
+
+class JumpState(State):
+    """
+    Jump state - player ascending.
+
+    Transitions to:
+        - fall: when vertical velocity becomes positive (descending)
+        - wall_slide: on wall contact while airborne
+        - dash: on dash input
+    """
+
+    __slots__ = ()
+
+    name = "jump"
+
+    _TRANSITION_TABLE = ((DASH_BIT, "dash"),)
+
+    def enter(self, _jf: float = JUMP_FORCE) -> None:
+        """
+        Enter jump state, apply jump force.
+
+        Args:
+            _jf: Jump force bound at definition time for fast local access.
+        """
+        self.player.physics.velocity.y = _jf
+        self.player.physics.on_ground = False
+        self.player.animation.play("jump")
+        # Play jump sound
+        AudioManager().play_sfx("jump")
+        logger.debug("Entered jump state")
+
+    def update(self, dt: float, _pspeed: float = PLAYER_SPEED) -> Optional[str]:
+        """
+        Update jump state.
+
+        Args:
+            dt: Delta time in seconds.
+            _pspeed: Player speed bound at definition time for fast local access.
+
+        Returns:
+            Next state name or None.
+        """
+        # Allow horizontal control while jumping
+        horizontal = self.player.input_handler.get_horizontal_axis()
+        if horizontal != 0:
+            self.player.physics.velocity.x = horizontal * _pspeed
+            self.player.facing_right = horizontal > 0
+            self.player.animation.set_facing(self.player.facing_right)
+
+        # Check for transitions, reusing the axis read above
+        return self._transition(horizontal)
+
+    def exit(self) -> None:
+        """Exit jump state."""
+        logger.debug("Exiting jump state")
+
+    def handle_input(self) -> Optional[str]:
+        """
+        Handle input for state transitions.
+
+        Returns:
+            Next state name or None.
+        """
+        return self._transition(self.player.input_handler.get_horizontal_axis())
+
+    def _transition(self, horizontal: int) -> Optional[str]:
+        """
+        Pick the next state given this frame's horizontal input.
+
+        Args:
+            horizontal: Horizontal input axis (-1, 0 or 1).
+
+        Returns:
+            Next state name or None.
+        """
+        physics = self.player.physics
+
+        # Check dash first (highest priority)
+        next_state = self._match_transition_table()
+        if next_state is not None:
+            return next_state
+
+        # Check for wall contact while airborne
+        if physics.on_wall:
+            return "wall_slide"
+
+        # Transition to fall when velocity becomes positive (descending)
+        if physics.velocity.y > 0:
+            return "fall"
+
+        # Check if somehow landed
+        next_state = ground_transition(physics.on_ground, horizontal)
+        if next_state is STATE_FALL:
+            return None
+        return next_state
+
+
+class FallState(State):
+    """
+    Fall state - player descending.
+
+    Transitions to:
+        - idle: when landing with no input
+        - run: when landing with horizontal input
+        - wall_slide: on wall contact while airborne
+    """
+
+    __slots__ = ()
+
+    name = "fall"
+
+    def enter(self) -> None:
+        """Enter fall state, start fall animation."""
+        self.player.animation.play("fall")
+        logger.debug("Entered fall state")
+
+    def update(self, dt: float, _pspeed: float = PLAYER_SPEED) -> Optional[str]:
+        """
+        Update fall state.
+
+        Args:
+            dt: Delta time in seconds.
+            _pspeed: Player speed bound at definition time for fast local access.
+
+        Returns:
+            Next state name or None.
+        """
+        # Allow horizontal control while falling
+        horizontal = self.player.input_handler.get_horizontal_axis()
+        if horizontal != 0:
+            self.player.physics.velocity.x = horizontal * _pspeed
+            self.player.facing_right = horizontal > 0
+            self.player.animation.set_facing(self.player.facing_right)
+
+        # Check for transitions, reusing the axis read above
+        return self._transition(horizontal)
+
+    def exit(self) -> None:
+        """Exit fall state."""
+        logger.debug("Exiting fall state")
+
+    def handle_input(self) -> Optional[str]:
+        """
+        Handle input for state transitions.
+
+        Returns:
+            Next state name or None.
+        """
+        return self._transition(self.player.input_handler.get_horizontal_axis())
+
+    def _transition(self, horizontal: int) -> Optional[str]:
+        """
+        Pick the next state given this frame's horizontal input.
+
+        Args:
+            horizontal: Horizontal input axis (-1, 0 or 1).
+
+        Returns:
+            Next state name or None.
+        """
+        physics = self.player.physics
+
+        # Check for wall contact while airborne
+        if physics.on_wall:
+            return "wall_slide"
+
+        # Check if landed
+        next_state = ground_transition(physics.on_ground, horizontal)
+        if next_state is STATE_FALL:
+            return None
+
+        # Play landing sound
+        AudioManager().play_sfx("land")
+        return next_state
+
+
+class WallSlideState(State):
+    """
+    Wall slide state - player sliding down a wall.
+
+    Transitions to:
+        - wall_climb: on jump input held
+        - jump: on jump input (wall jump)
+        - fall: when no longer touching wall
+        - idle: when landing
+    """
+
+    __slots__ = ()
+
+    name = "wall_slide"
+
+    def enter(self) -> None:
+        """Enter wall slide state, reduce fall speed."""
+        self.player.physics.velocity.y = WALL_SLIDE_SPEED
+        self.player.animation.play("wall_slide")
+        logger.debug("Entered wall slide state")
+
+    def update(self, dt: float, _speed: float = WALL_SLIDE_SPEED) -> Optional[str]:
+        """
+        Update wall slide state.
+
+        Args:
+            dt: Delta time in seconds.
+            _speed: Slide speed bound at definition time for fast local access.
+
+        Returns:
+            Next state name or None.
+        """
+        # Limit fall speed while wall sliding
+        if self.player.physics.velocity.y > _speed:
+            self.player.physics.velocity.y = _speed
+
+        # Check for transitions
+        return self.handle_input()
+
+    def exit(self) -> None:
+        """Exit wall slide state."""
+        logger.debug("Exiting wall slide state")
+
+    def handle_input(self) -> Optional[str]:
+        """
+        Handle input for state transitions.
+
+        Returns:
+            Next state name or None.
+        """
+        input_handler = self.player.input_handler
+        physics = self.player.physics
+
+        # Check wall jump (pressing jump while wall sliding)
+        if input_handler.consume_just_pressed(JUMP_BIT):
+            return "jump"
+
+        # Check wall climb (holding jump while wall sliding)
+        if input_handler.is_action_pressed(JUMP_BIT):
+            return "wall_climb"
+
+        # Check if no longer on wall
+        if not physics.on_wall:
+            return "fall"
+
+        # Check if landed
+        if physics.on_ground:
+            return "idle"
+
+        return None
+
+
+class WallClimbState(State):
+    """
+    Wall climb state - player climbing a wall.
+
+    Transitions to:
+        - wall_slide: when jump released
+        - fall: when no longer touching wall
+        - idle: when reaching top (landing)
+    """
+
+    __slots__ = ()
+
+    name = "wall_climb"
+
+    def enter(self) -> None:
+        """Enter wall climb state, start climbing animation."""
+        self.player.animation.play("wall_climb")
+        logger.debug("Entered wall climb state")
+
+    def update(self, dt: float, _speed: float = WALL_CLIMB_SPEED) -> Optional[str]:
+        """
+        Update wall climb state.
+
+        Args:
+            dt: Delta time in seconds.
+            _speed: Climb speed bound at definition time for fast local access.
+
+        Returns:
+            Next state name or None.
+        """
+        # Apply upward velocity while climbing
+        self.player.physics.velocity.y = _speed
+
+        # Check for transitions
+        return self.handle_input()
+
+    def exit(self) -> None:
+        """Exit wall climb state."""
+        logger.debug("Exiting wall climb state")
+
+    def handle_input(self) -> Optional[str]:
+        """
+        Handle input for state transitions.
+
+        Returns:
+            Next state name or None.
+        """
+        input_handler = self.player.input_handler
+        physics = self.player.physics
+
+        # Check if jump released (transition to wall slide)
+        if not input_handler.is_action_pressed(JUMP_BIT):
+            return "wall_slide"
+
+        # Check if no longer on wall
+        if not physics.on_wall:
+            return "fall"
+
+        # Check if reached top (landed)
+        if physics.on_ground:
+            return "idle"
+
+        return None
+
+
+class DashState(State):
+    """
+    Dash state - player dashing with invulnerability.
+
+    Transitions to:
+        - idle: when dash ends and on ground with no input
+        - run: when dash ends and on ground with input
+        - fall: when dash ends and airborne
+    """
+
+    __slots__ = ("_dash_ticks", "_dash_direction", "_dash_vx")
+
+    name = "dash"
+
+    def __init__(self, player: "Player") -> None:
+        """
+        Initialize dash state.
+
+        Args:
+            player: Reference to player entity.
+        """
+        super().__init__(player)
+        self._dash_ticks: int = 0
+        self._dash_direction: int = 1
+        self._dash_vx: float = 0.0
+
+    def enter(
+        self,
+        _dspeed: float = DASH_SPEED,
+        _dticks: int = DASH_DURATION_TICKS,
+        _inv: float = INVULNERABILITY_DURATION,
+    ) -> None:
+        """
+        Enter dash state, apply dash velocity and invulnerability.
+
+        Args:
+            _dspeed: Dash speed bound at definition time for fast local access.
+            _dticks: Dash duration in frames bound at definition time.
+            _inv: Invulnerability duration bound at definition time.
+        """
+        self._dash_ticks = _dticks
+
+        # Determine dash direction (+1 right, -1 left) without branching
+        self._dash_direction = (bool(self.player.facing_right) << 1) - 1
+        self._dash_vx = self._dash_direction * _dspeed
+
+        # Apply dash velocity once; gravity is off and input is locked, so
+        # nothing else changes it until the dash ends
+        self.player.physics.velocity.x = self._dash_vx
+        self.player.physics.velocity.y = 0  # Dash is horizontal
+
+        # Grant invulnerability during dash
+        self.player.set_invulnerable(_inv)
+
+        # Disable gravity during dash
+        self.player.physics.gravity_enabled = False
+
+        # Play dash sound
+        AudioManager().play_sfx("dash")
+
+        self.player.animation.play("dash")
+        logger.debug("Entered dash state, direction: %d", self._dash_direction)
+
+    def update(self, dt: float, _fps: int = FPS) -> Optional[str]:
+        """
+        Update dash state.
+
+        Counts down whole frames so the dash length never drifts with
+        float rounding; a long frame consumes as many ticks as it spans.
+
+        Args:
+            dt: Delta time in seconds.
+            _fps: Frame rate bound at definition time for fast local access.
+
+        Returns:
+            Next state name or None.
+        """
+        self._dash_ticks -= round(dt * _fps) or 1
+
+        # Check if dash is complete
+        if self._dash_ticks <= 0:
+            return self._get_exit_state()
+
+        return None
+
+    def exit(self) -> None:
+        """Exit dash state, re-enable gravity."""
+        self.player.physics.gravity_enabled = True
+        logger.debug("Exiting dash state")
+
+    def _get_exit_state(self) -> str:
+        """
+        Determine which state to transition to after dash.
+
+        Returns:
+            Name of the next state.
+        """
+        return ground_transition(
+            self.player.physics.on_ground, self.player.input_handler.get_horizontal_axis()
+        )
+
+    def handle_input(self) -> Optional[str]:
+        """
+        Handle input during dash (mostly locked).
+
+        Returns:
+            None (input is locked during dash).
+        """
+        # Input is locked during dash
+        return None
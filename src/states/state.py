@@ -1,28 +1,82 @@
 """
-Abstract base class for FSM states.
+Base class for FSM states.
 
 All player states inherit from this class and implement
 the state lifecycle methods.
 """
 
-from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Protocol, Tuple
+
+from src.systems.input_handler import JUMP_BIT
 
 if TYPE_CHECKING:
     from src.entities.player import Player
 
 
-class State(ABC):
+# Shared state names returned by ground_transition
+STATE_IDLE = "idle"
+STATE_RUN = "run"
+STATE_FALL = "fall"
+
+
+def ground_transition(
+    on_ground: bool,
+    horizontal: int,
+    _idle: str = STATE_IDLE,
+    _run: str = STATE_RUN,
+    _fall: str = STATE_FALL,
+) -> str:
+    """
+    Classify the player's grounded situation into a locomotion state.
+
+    Shared by every state that needs the "airborne -> fall, grounded with
+    input -> run, grounded without input -> idle" decision. Takes plain
+    scalars so callers can pass the horizontal axis they already read this
+    frame instead of querying the input handler again.
+
+    Args:
+        on_ground: Whether the player is standing on ground.
+        horizontal: Horizontal input axis (-1, 0 or 1).
+
+    Returns:
+        STATE_FALL, STATE_RUN or STATE_IDLE.
+    """
+    if not on_ground:
+        return _fall
+    return _run if horizontal else _idle
+
+
+class StateProtocol(Protocol):
+    """Structural interface every FSM state satisfies (for static checking)."""
+
+    name: str
+
+    def enter(self) -> None: ...
+
+    def update(self, dt: float) -> Optional[str]: ...
+
+    def exit(self) -> None: ...
+
+
+class State:
     """
-    Abstract base state for FSM.
+    Base state for FSM.
+
+    Plain (non-ABC) base class so state creation and isinstance checks
+    skip ABCMeta bookkeeping; StateProtocol documents the interface.
 
     Attributes:
         name: State identifier.
         player: Reference to player entity.
     """
 
+    __slots__ = ("player",)
+
     name: str = "base"
 
+    # (action bit, next state) pairs checked in priority order
+    _TRANSITION_TABLE: Tuple[Tuple[int, str], ...] = ()
+
     def __init__(self, player: "Player") -> None:
         """
         Initialize state with player reference.
@@ -32,12 +86,10 @@ class State(ABC):
         """
         self.player = player
 
-    @abstractmethod
     def enter(self) -> None:
         """Called when entering this state."""
         pass
 
-    @abstractmethod
     def update(self, dt: float) -> Optional[str]:
         """
         Update state logic.
@@ -48,9 +100,8 @@ class State(ABC):
         Returns:
             Next state name or None to stay in current state.
         """
-        pass
+        return None
 
-    @abstractmethod
     def exit(self) -> None:
         """Called when exiting this state."""
         pass
@@ -63,3 +114,24 @@ class State(ABC):
             Next state name or None.
         """
         return None
+
+    def _match_transition_table(self, _jump_bit: int = JUMP_BIT) -> Optional[str]:
+        """
+        Look up the highest-priority action pressed this frame.
+
+        Jump entries only fire while the player is on the ground. The
+        matched action is consumed so it cannot trigger a second transition.
+
+        Returns:
+            Next state name from _TRANSITION_TABLE or None.
+        """
+        input_handler = self.player.input_handler
+        mask = input_handler.just_pressed_mask
+        if not mask:
+            return None
+        for bit, next_state in self._TRANSITION_TABLE:
+            if mask & bit:
+                if bit != _jump_bit or self.player.physics.on_ground:
+                    input_handler.consume_just_pressed(bit)
+                    return next_state
+        return None
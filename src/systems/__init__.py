@@ -7,6 +7,7 @@ from src.systems.ai import (
     AIController,
     AIDecisionMaker,
     AttackBehavior,
+    BehaviorProtocol,
     ChaseBehavior,
     DeathBehavior,
     FlankBehavior,
@@ -24,6 +25,7 @@ from src.systems.collision import (
 )
 from src.systems.input_handler import InputHandler
 from src.systems.physics import PhysicsBody
+from src.systems.timers import Timer, TimerSystem
 
 __all__ = [
     "AIAction",
@@ -34,6 +36,7 @@ __all__ = [
     "Animation",
     "AnimationController",
     "AttackBehavior",
+    "BehaviorProtocol",
     "ChaseBehavior",
     "CollisionManager",
     "DeathBehavior",
@@ -44,6 +47,8 @@ __all__ = [
     "PhysicsBody",
     "RetreatBehavior",
     "SmartChaseBehavior",
+    "Timer",
+    "TimerSystem",
     "UtilityScore",
     "check_aabb_collision",
     "create_placeholder_frames",
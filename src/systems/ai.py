@@ -8,42 +8,92 @@ Includes utility-based AI decision making for intelligent enemy behavior.
 import logging
 import math
 import random
-from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Optional, Protocol, Tuple
 
 import pygame
 
 from src.core.settings import (
     AI_DECISION_COOLDOWN,
     AI_DECISION_INTERVAL,
-    AI_TARGET_SPEED_THRESHOLD,
+    AI_FAST_ATTACK_READY_TIME,
+    AI_FAST_RETREAT_HEALTH,
+    AI_FAST_RETREAT_MAX_AGGRESSION,
+    AI_RECHECK_DISTANCE_BUCKET,
+    AI_RECHECK_HEALTH_BUCKET,
+    AI_RECHECK_TIME_BUCKET,
     ENEMY_ATTACK_COOLDOWN,
     ENEMY_ATTACK_DAMAGE,
     ENEMY_ATTACK_RANGE,
     ENEMY_DETECTION_RANGE,
+    ENEMY_PATROL_ARRIVAL_DISTANCE,
     ENEMY_PATROL_PAUSE,
     ENEMY_SPEED,
 )
+from src.systems import ai_utility
 
 if TYPE_CHECKING:
     from src.entities.entity import Entity
 
 logger = logging.getLogger(__name__)
 
+# Bound once so hot paths do a single global lookup instead of an attribute chain
+_Rect = pygame.Rect
+_copysign = math.copysign
+_hypot = math.hypot
+_sqrt = math.sqrt
+_random = random.random
+_choice = random.choice
 
-class AIBehavior(ABC):
+
+def _dist_sq_xy(ax: float, ay: float, bx: float, by: float) -> float:
+    """Squared distance between two points given as scalar coordinates."""
+    dx = ax - bx
+    dy = ay - by
+    return dx * dx + dy * dy
+
+
+# Behavior names returned by update() and used as registry keys
+BEHAVIOR_PATROL = "patrol"
+BEHAVIOR_CHASE = "chase"
+BEHAVIOR_ATTACK = "attack"
+BEHAVIOR_HURT = "hurt"
+BEHAVIOR_DEATH = "death"
+BEHAVIOR_SMART_CHASE = "smart_chase"
+BEHAVIOR_FLANK = "flank"
+BEHAVIOR_RETREAT = "retreat"
+
+
+class BehaviorProtocol(Protocol):
+    """Structural interface every AI behavior satisfies (for static checking)."""
+
+    name: str
+
+    def update(
+        self,
+        entity: "Entity",
+        dt: float,
+        target: Optional["Entity"] = None,
+    ) -> Optional[str]: ...
+
+
+class AIBehavior:
     """
-    Abstract base class for AI behaviors.
+    Base class for AI behaviors.
+
+    Plain (non-ABC) base class so behavior creation skips ABCMeta
+    bookkeeping; subclasses must override update().
 
     Attributes:
         name: Behavior identifier.
     """
 
+    __slots__ = ()
+
     name: str = "base"
 
-    @abstractmethod
     def update(
         self,
         entity: "Entity",
@@ -60,8 +110,11 @@ class AIBehavior(ABC):
 
         Returns:
             Next behavior name or None to stay in current behavior.
+
+        Raises:
+            NotImplementedError: If a subclass does not override update().
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement update()")
 
 
 class PatrolBehavior(AIBehavior):
@@ -77,7 +130,20 @@ class PatrolBehavior(AIBehavior):
         detection_range: Range to detect target entity.
     """
 
-    name = "patrol"
+    __slots__ = (
+        "patrol_points",
+        "_patrol_x",
+        "_num_points",
+        "current_point_index",
+        "speed",
+        "pause_timer",
+        "pause_duration",
+        "detection_range",
+        "_detection_range_sq",
+        "_is_paused",
+    )
+
+    name = BEHAVIOR_PATROL
 
     def __init__(
         self,
@@ -96,11 +162,15 @@ class PatrolBehavior(AIBehavior):
             detection_range: Range to detect player.
         """
         self.patrol_points = patrol_points
+        # Only waypoint x is used on the hot path; keep a flat copy
+        self._patrol_x = tuple(float(point[0]) for point in patrol_points)
+        self._num_points = len(patrol_points)
         self.current_point_index = 0
         self.speed = speed
         self.pause_timer = 0.0
         self.pause_duration = pause_duration
         self.detection_range = detection_range
+        self._detection_range_sq = detection_range * detection_range
         self._is_paused = False
 
     def update(
@@ -108,6 +178,7 @@ class PatrolBehavior(AIBehavior):
         entity: "Entity",
         dt: float,
         target: Optional["Entity"] = None,
+        _arrive: float = ENEMY_PATROL_ARRIVAL_DISTANCE,
     ) -> Optional[str]:
         """
         Update patrol behavior.
@@ -116,14 +187,22 @@ class PatrolBehavior(AIBehavior):
             entity: Enemy entity being controlled.
             dt: Delta time in seconds.
             target: Optional player entity to detect.
+            _arrive: Waypoint arrival distance bound at definition time.
 
         Returns:
             'chase' if target detected, None otherwise.
         """
-        # Check for target detection
-        if target and self._is_target_in_range(entity, target):
-            logger.debug("Target detected, transitioning to chase")
-            return "chase"
+        entity_pos = entity.pos
+        velocity = entity.velocity
+
+        # Check for target detection (inlined squared-distance test)
+        if target:
+            dx = target.pos.x - entity_pos.x
+            dy = target.pos.y - entity_pos.y
+            if dx * dx + dy * dy <= self._detection_range_sq:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Target detected, transitioning to chase")
+                return BEHAVIOR_CHASE
 
         # Handle pause at waypoints
         if self._is_paused:
@@ -131,45 +210,32 @@ class PatrolBehavior(AIBehavior):
             if self.pause_timer <= 0:
                 self._is_paused = False
                 self._advance_to_next_point()
-            entity.velocity.x = 0
+            velocity.x = 0
             return None
 
         # Move toward current waypoint
-        if not self.patrol_points:
-            entity.velocity.x = 0
+        if not self._num_points:
+            velocity.x = 0
             return None
 
-        target_pos = self.patrol_points[self.current_point_index]
-        direction = target_pos[0] - entity.pos.x
+        direction = self._patrol_x[self.current_point_index] - entity_pos.x
 
-        if abs(direction) < 5.0:
+        if -_arrive < direction < _arrive:
             # Reached waypoint
             self._is_paused = True
             self.pause_timer = self.pause_duration
-            entity.velocity.x = 0
+            velocity.x = 0
         else:
             # Move toward waypoint
-            if direction > 0:
-                entity.velocity.x = self.speed
-                entity.facing_right = True
-            else:
-                entity.velocity.x = -self.speed
-                entity.facing_right = False
+            velocity.x = _copysign(self.speed, direction)
+            entity.facing_right = direction > 0
 
         return None
 
-    def _is_target_in_range(self, entity: "Entity", target: "Entity") -> bool:
-        """Check if target is within detection range."""
-        distance = pygame.math.Vector2(
-            target.pos.x - entity.pos.x,
-            target.pos.y - entity.pos.y,
-        ).length()
-        return distance <= self.detection_range
-
     def _advance_to_next_point(self) -> None:
         """Advance to the next patrol point."""
-        if self.patrol_points:
-            self.current_point_index = (self.current_point_index + 1) % len(self.patrol_points)
+        if self._num_points:
+            self.current_point_index = (self.current_point_index + 1) % self._num_points
 
 
 class ChaseBehavior(AIBehavior):
@@ -182,7 +248,9 @@ class ChaseBehavior(AIBehavior):
         detection_range: Range to maintain chase.
     """
 
-    name = "chase"
+    __slots__ = ("speed", "attack_range", "detection_range", "_attack_range_sq", "_lost_range_sq")
+
+    name = BEHAVIOR_CHASE
 
     def __init__(
         self,
@@ -201,6 +269,8 @@ class ChaseBehavior(AIBehavior):
         self.speed = speed
         self.attack_range = attack_range
         self.detection_range = detection_range
+        self._attack_range_sq = attack_range * attack_range
+        self._lost_range_sq = (detection_range * 1.5) ** 2
 
     def update(
         self,
@@ -220,41 +290,39 @@ class ChaseBehavior(AIBehavior):
             'attack' if in attack range, 'patrol' if lost target, None otherwise.
         """
         if not target:
-            logger.debug("No target, returning to patrol")
-            return "patrol"
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("No target, returning to patrol")
+            return BEHAVIOR_PATROL
 
-        distance = self._get_distance_to_target(entity, target)
+        # Single pass over positions; dx is reused for facing below
+        entity_pos = entity.pos
+        target_pos = target.pos
+        dx = target_pos.x - entity_pos.x
+        dy = target_pos.y - entity_pos.y
+        distance_sq = dx * dx + dy * dy
 
         # Check if target is out of detection range
-        if distance > self.detection_range * 1.5:
-            logger.debug("Target out of range, returning to patrol")
-            return "patrol"
+        if distance_sq > self._lost_range_sq:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Target out of range, returning to patrol")
+            return BEHAVIOR_PATROL
 
         # Check if in attack range
-        if distance <= self.attack_range:
-            logger.debug("Target in attack range, transitioning to attack")
-            return "attack"
+        if distance_sq <= self._attack_range_sq:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Target in attack range, transitioning to attack")
+            return BEHAVIOR_ATTACK
 
         # Move toward target
-        direction = target.pos.x - entity.pos.x
-        if direction > 0:
-            entity.velocity.x = self.speed
-            entity.facing_right = True
-        elif direction < 0:
-            entity.velocity.x = -self.speed
-            entity.facing_right = False
+        velocity = entity.velocity
+        if dx:
+            velocity.x = _copysign(self.speed, dx)
+            entity.facing_right = dx > 0
         else:
-            entity.velocity.x = 0
+            velocity.x = 0
 
         return None
 
-    def _get_distance_to_target(self, entity: "Entity", target: "Entity") -> float:
-        """Calculate distance to target."""
-        return pygame.math.Vector2(
-            target.pos.x - entity.pos.x,
-            target.pos.y - entity.pos.y,
-        ).length()
-
 
 class AttackBehavior(AIBehavior):
     """
@@ -266,7 +334,17 @@ class AttackBehavior(AIBehavior):
         attack_range: Range to maintain attack state.
     """
 
-    name = "attack"
+    __slots__ = (
+        "damage",
+        "cooldown",
+        "attack_range",
+        "_lost_range_sq",
+        "_cooldown_timer",
+        "_is_attacking",
+        "_attack_hitbox",
+    )
+
+    name = BEHAVIOR_ATTACK
 
     def __init__(
         self,
@@ -285,9 +363,11 @@ class AttackBehavior(AIBehavior):
         self.damage = damage
         self.cooldown = cooldown
         self.attack_range = attack_range
+        self._lost_range_sq = (attack_range * 1.5) ** 2
         self._cooldown_timer = 0.0
         self._is_attacking = False
-        self._attack_hitbox: Optional[pygame.Rect] = None
+        # Reused for every attack; only valid while _is_attacking is True
+        self._attack_hitbox = _Rect(0, 0, 40, 30)
 
     def update(
         self,
@@ -310,58 +390,42 @@ class AttackBehavior(AIBehavior):
 
         if not target:
             self._is_attacking = False
-            self._attack_hitbox = None
-            return "patrol"
+            return BEHAVIOR_PATROL
 
-        distance = self._get_distance_to_target(entity, target)
+        entity_pos = entity.pos
+        target_pos = target.pos
+        dx = target_pos.x - entity_pos.x
+        dy = target_pos.y - entity_pos.y
+        distance_sq = dx * dx + dy * dy
 
         # Check if target moved out of attack range
-        if distance > self.attack_range * 1.5:
+        if distance_sq > self._lost_range_sq:
             self._is_attacking = False
-            self._attack_hitbox = None
-            return "chase"
+            return BEHAVIOR_CHASE
 
         # Update cooldown timer
         if self._cooldown_timer > 0:
             self._cooldown_timer -= dt
             self._is_attacking = False
-            self._attack_hitbox = None
             return None
 
         # Perform attack
         self._is_attacking = True
         self._create_attack_hitbox(entity)
         self._cooldown_timer = self.cooldown
-        logger.debug("Enemy attacking")
 
         return None
 
-    def _get_distance_to_target(self, entity: "Entity", target: "Entity") -> float:
-        """Calculate distance to target."""
-        return pygame.math.Vector2(
-            target.pos.x - entity.pos.x,
-            target.pos.y - entity.pos.y,
-        ).length()
-
     def _create_attack_hitbox(self, entity: "Entity") -> None:
-        """Create attack hitbox based on facing direction."""
-        hitbox_width = 40
-        hitbox_height = 30
+        """Position the cached attack hitbox based on facing direction."""
+        hitbox = self._attack_hitbox
+        entity_hitbox = entity.hitbox
 
         if entity.facing_right:
-            self._attack_hitbox = pygame.Rect(
-                entity.hitbox.right,
-                entity.hitbox.centery - hitbox_height // 2,
-                hitbox_width,
-                hitbox_height,
-            )
+            hitbox.x = entity_hitbox.right
         else:
-            self._attack_hitbox = pygame.Rect(
-                entity.hitbox.left - hitbox_width,
-                entity.hitbox.centery - hitbox_height // 2,
-                hitbox_width,
-                hitbox_height,
-            )
+            hitbox.x = entity_hitbox.left - hitbox.width
+        hitbox.y = entity_hitbox.centery - hitbox.height // 2
 
     def get_attack_hitbox(self) -> Optional[pygame.Rect]:
         """
@@ -392,7 +456,9 @@ class HurtBehavior(AIBehavior):
         stun_duration: How long the entity is stunned.
     """
 
-    name = "hurt"
+    __slots__ = ("stun_duration", "_stun_timer")
+
+    name = BEHAVIOR_HURT
 
     def __init__(self, stun_duration: float = 0.3) -> None:
         """
@@ -429,7 +495,7 @@ class HurtBehavior(AIBehavior):
 
         self._stun_timer -= dt
         if self._stun_timer <= 0:
-            return "patrol"
+            return BEHAVIOR_PATROL
 
         return None
 
@@ -442,7 +508,9 @@ class DeathBehavior(AIBehavior):
         death_duration: Time before entity is removed.
     """
 
-    name = "death"
+    __slots__ = ("death_duration", "_death_timer", "_started")
+
+    name = BEHAVIOR_DEATH
 
     def __init__(self, death_duration: float = 0.5) -> None:
         """
@@ -477,8 +545,9 @@ class DeathBehavior(AIBehavior):
         Returns:
             None (entity will be killed).
         """
-        entity.velocity.x = 0
-        entity.velocity.y = 0
+        velocity = entity.velocity
+        velocity.x = 0
+        velocity.y = 0
 
         if not self._started:
             self.start_death()
@@ -507,20 +576,21 @@ class AIAction(Enum):
     IDLE = "idle"
 
 
-@dataclass
+@dataclass(slots=True)
 class AIContext:
     """
     Context data for AI decision making.
 
     Contains all relevant information about the current game state
-    that the AI needs to make intelligent decisions.
+    that the AI needs to make intelligent decisions. Positions and
+    velocities are plain (x, y) tuples snapshotted when the context is built.
     """
 
-    entity_pos: pygame.math.Vector2
+    entity_pos: Tuple[float, float]
     entity_health: int
     entity_max_health: int
-    target_pos: Optional[pygame.math.Vector2]
-    target_velocity: Optional[pygame.math.Vector2]
+    target_pos: Optional[Tuple[float, float]]
+    target_velocity: Optional[Tuple[float, float]]
     target_health: Optional[int]
     distance_to_target: float
     detection_range: float
@@ -534,74 +604,14 @@ class UtilityScore:
     Utility score calculator for AI actions.
 
     Uses response curves to calculate utility values for different actions
-    based on the current game context.
+    based on the current game context. The curves live in ai_utility as
+    plain float functions; this class keeps them under one namespace.
     """
 
-    @staticmethod
-    def linear(value: float, min_val: float, max_val: float) -> float:
-        """
-        Linear response curve.
-
-        Args:
-            value: Input value.
-            min_val: Minimum value (maps to 0).
-            max_val: Maximum value (maps to 1).
-
-        Returns:
-            Utility score between 0 and 1.
-        """
-        if max_val <= min_val:
-            return 0.0
-        normalized = (value - min_val) / (max_val - min_val)
-        return max(0.0, min(1.0, normalized))
-
-    @staticmethod
-    def inverse_linear(value: float, min_val: float, max_val: float) -> float:
-        """
-        Inverse linear response curve (higher value = lower score).
-
-        Args:
-            value: Input value.
-            min_val: Minimum value (maps to 1).
-            max_val: Maximum value (maps to 0).
-
-        Returns:
-            Utility score between 0 and 1.
-        """
-        return 1.0 - UtilityScore.linear(value, min_val, max_val)
-
-    @staticmethod
-    def exponential(value: float, exponent: float = 2.0) -> float:
-        """
-        Exponential response curve.
-
-        Args:
-            value: Input value between 0 and 1.
-            exponent: Power to raise value to.
-
-        Returns:
-            Utility score.
-        """
-        result: float = max(0.0, min(1.0, value**exponent))
-        return result
-
-    @staticmethod
-    def logistic(value: float, steepness: float = 10.0, midpoint: float = 0.5) -> float:
-        """
-        Logistic (S-curve) response curve.
-
-        Args:
-            value: Input value between 0 and 1.
-            steepness: How steep the transition is.
-            midpoint: Value at which output is 0.5.
-
-        Returns:
-            Utility score between 0 and 1.
-        """
-        try:
-            return 1.0 / (1.0 + math.exp(-steepness * (value - midpoint)))
-        except OverflowError:
-            return 0.0 if value < midpoint else 1.0
+    linear = staticmethod(ai_utility.linear)
+    inverse_linear = staticmethod(ai_utility.inverse_linear)
+    exponential = staticmethod(ai_utility.exponential)
+    logistic = staticmethod(ai_utility.logistic)
 
 
 class AIDecisionMaker:
@@ -612,11 +622,14 @@ class AIDecisionMaker:
     utility score based on the current context.
 
     Attributes:
-        action_evaluators: Dictionary mapping actions to their evaluator functions.
-        action_weights: Weight multipliers for each action.
         randomness: Amount of randomness to add to decisions (0-1).
+        aggression: How aggressive the AI is (0-1).
     """
 
+    # Actions in evaluation order; index into _evaluators
+    _ACTIONS: Tuple[AIAction, ...] = tuple(AIAction)
+    _ACTION_INDEX: Dict[AIAction, int] = {action: i for i, action in enumerate(AIAction)}
+
     def __init__(
         self,
         randomness: float = 0.1,
@@ -631,10 +644,22 @@ class AIDecisionMaker:
         """
         self.randomness = max(0.0, min(1.0, randomness))
         self.aggression = max(0.0, min(1.0, aggression))
-        self._action_history: List[AIAction] = []
+        self._action_history: Deque[AIAction] = deque(maxlen=10)
         self._last_decision_time = 0.0
         self._decision_cooldown = AI_DECISION_COOLDOWN
 
+        # Bound once, in _ACTIONS order
+        self._evaluators: Tuple[Callable[[AIContext], float], ...] = (
+            self._evaluate_patrol,
+            self._evaluate_chase,
+            self._evaluate_attack,
+            self._evaluate_retreat,
+            self._evaluate_flank,
+            self._evaluate_predict,
+            self._evaluate_idle,
+        )
+        self._scores: List[float] = [0.0] * len(self._ACTIONS)
+
     def evaluate_action(self, action: AIAction, context: AIContext) -> float:
         """
         Evaluate utility score for an action.
@@ -646,54 +671,94 @@ class AIDecisionMaker:
         Returns:
             Utility score between 0 and 1.
         """
-        evaluators: Dict[AIAction, Callable[[AIContext], float]] = {
-            AIAction.PATROL: self._evaluate_patrol,
-            AIAction.CHASE: self._evaluate_chase,
-            AIAction.ATTACK: self._evaluate_attack,
-            AIAction.RETREAT: self._evaluate_retreat,
-            AIAction.FLANK: self._evaluate_flank,
-            AIAction.PREDICT: self._evaluate_predict,
-            AIAction.IDLE: self._evaluate_idle,
-        }
+        base_score = self._evaluators[self._ACTION_INDEX[action]](context)
+        return self._add_noise(base_score)
 
-        evaluator = evaluators.get(action, lambda _: 0.0)
-        base_score: float = evaluator(context)
+    def _add_noise(self, base_score: float) -> float:
+        """
+        Apply the configured randomness to a utility score.
 
-        # Add controlled randomness
+        Args:
+            base_score: Score from an evaluator.
+
+        Returns:
+            Score with noise added, clamped to 0-1.
+        """
         if self.randomness > 0:
-            noise = (random.random() - 0.5) * 2 * self.randomness
+            noise = (_random() - 0.5) * 2 * self.randomness
             base_score = max(0.0, min(1.0, base_score + noise * 0.2))
 
         return base_score
 
-    def decide(self, context: AIContext) -> AIAction:
+    def _fast_decision(self, context: AIContext) -> Optional[AIAction]:
         """
-        Make a decision based on current context.
+        Resolve clear-cut situations without running the evaluators.
 
         Args:
             context: Current AI context.
 
         Returns:
-            Best action to take.
+            The obvious action, or None if the utility scorer must decide.
+        """
+        if context.target_pos is None:
+            return AIAction.PATROL
+        if (
+            context.entity_health / max(1, context.entity_max_health) < AI_FAST_RETREAT_HEALTH
+            and self.aggression < AI_FAST_RETREAT_MAX_AGGRESSION
+        ):
+            return AIAction.RETREAT
+        distance = context.distance_to_target
+        if distance > context.detection_range:
+            return AIAction.PATROL
+        if (
+            distance <= context.attack_range
+            and context.time_since_last_attack > AI_FAST_ATTACK_READY_TIME
+        ):
+            return AIAction.ATTACK
+        return None
+
+    def decide(self, context: AIContext) -> AIAction:
         """
-        scores: Dict[AIAction, float] = {}
+        Make a decision based on current context.
 
-        for action in AIAction:
-            scores[action] = self.evaluate_action(action, context)
+        Clear-cut contexts are settled by _fast_decision(); the rest go
+        through the utility scorer.
 
-        # Select action with highest score
-        best_action = max(scores, key=lambda a: scores[a])
+        Args:
+            context: Current AI context.
 
-        # Track history for combo detection
+        Returns:
+            Best action to take.
+        """
+        fast_action = self._fast_decision(context)
+        if fast_action is not None:
+            self._action_history.append(fast_action)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("AI decision [fast-path]: %s", fast_action.value)
+            return fast_action
+
+        scores = self._scores
+        for i, evaluator in enumerate(self._evaluators):
+            scores[i] = evaluator(context)
+
+        noise_scale = self.randomness * 0.4
+        if noise_scale > 0:
+            rand = _random
+            for i, score in enumerate(scores):
+                scores[i] = max(0.0, min(1.0, score + (rand() - 0.5) * noise_scale))
+
+        # Select action with highest score (earliest action wins ties)
+        best_action = self._ACTIONS[max(range(len(scores)), key=scores.__getitem__)]
+
+        # Track history for combo detection (deque drops the oldest entry)
         self._action_history.append(best_action)
-        if len(self._action_history) > 10:
-            self._action_history.pop(0)
 
-        logger.debug(
-            "AI decision: %s (scores: %s)",
-            best_action.value,
-            {a.value: f"{s:.2f}" for a, s in scores.items()},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "AI decision: %s (scores: %s)",
+                best_action.value,
+                {a.value: f"{s:.2f}" for a, s in zip(self._ACTIONS, scores)},
+            )
 
         return best_action
 
@@ -702,106 +767,60 @@ class AIDecisionMaker:
         # Patrol when no target or target very far away
         if context.target_pos is None:
             return 0.9
-
-        distance_score = UtilityScore.linear(
-            context.distance_to_target,
-            context.detection_range,
-            context.detection_range * 2,
-        )
-
-        return distance_score * 0.8
+        return ai_utility.eval_patrol(context.distance_to_target, context.detection_range)
 
     def _evaluate_chase(self, context: AIContext) -> float:
         """Evaluate utility of chase action."""
         if context.target_pos is None:
             return 0.0
-
-        # Chase when target is detected but not in attack range
-        in_detection = context.distance_to_target <= context.detection_range
-        not_in_attack = context.distance_to_target > context.attack_range
-
-        if not in_detection:
-            return 0.0
-
-        if not_in_attack:
-            # Higher score when closer to attack range
-            proximity_score = UtilityScore.inverse_linear(
-                context.distance_to_target,
-                context.attack_range,
-                context.detection_range,
-            )
-            return 0.7 + (proximity_score * 0.2) + (self.aggression * 0.1)
-
-        return 0.3  # Low score when already in attack range
+        return ai_utility.eval_chase(
+            context.distance_to_target,
+            context.detection_range,
+            context.attack_range,
+            self.aggression,
+        )
 
     def _evaluate_attack(self, context: AIContext) -> float:
         """Evaluate utility of attack action."""
         if context.target_pos is None:
             return 0.0
-
-        # Attack when in attack range
-        if context.distance_to_target > context.attack_range:
-            return 0.0
-
-        # Base attack score
-        base_score = 0.8
-
-        # Increase score based on aggression
-        aggression_bonus = self.aggression * 0.2
-
-        # Decrease score if recently attacked (prevent spamming)
-        cooldown_penalty = UtilityScore.linear(
+        return ai_utility.eval_attack(
+            context.distance_to_target,
+            context.attack_range,
+            self.aggression,
             context.time_since_last_attack,
-            0.0,
-            0.5,
         )
 
-        return base_score + aggression_bonus - (1.0 - cooldown_penalty) * 0.3
-
     def _evaluate_retreat(self, context: AIContext) -> float:
         """Evaluate utility of retreat action."""
-        # Retreat when low on health
-        health_ratio = context.entity_health / max(1, context.entity_max_health)
-
-        # Low health increases retreat utility
-        low_health_score = UtilityScore.inverse_linear(health_ratio, 0.2, 0.5)
-
-        # Aggression reduces retreat tendency
-        aggression_penalty = self.aggression * 0.4
-
-        return max(0.0, low_health_score * 0.9 - aggression_penalty)
+        return ai_utility.eval_retreat(
+            context.entity_health,
+            context.entity_max_health,
+            self.aggression,
+        )
 
     def _evaluate_flank(self, context: AIContext) -> float:
         """Evaluate utility of flanking action."""
         if context.target_pos is None:
             return 0.0
-
-        # Flank when at medium range and target is facing us
-        if (
-            context.distance_to_target > context.attack_range
-            and context.distance_to_target < context.detection_range * 0.7
-        ):
-            return 0.5 + (self.aggression * 0.2)
-
-        return 0.2
+        return ai_utility.eval_flank(
+            context.distance_to_target,
+            context.detection_range,
+            context.attack_range,
+            self.aggression,
+        )
 
     def _evaluate_predict(self, context: AIContext) -> float:
         """Evaluate utility of predictive movement."""
-        if context.target_pos is None or context.target_velocity is None:
+        target_velocity = context.target_velocity
+        if context.target_pos is None or target_velocity is None:
             return 0.0
-
-        # Predict when target is moving and at medium range
-        target_speed = context.target_velocity.length()
-        if target_speed < AI_TARGET_SPEED_THRESHOLD:
-            return 0.1  # Target not moving much
-
-        if (
-            context.distance_to_target > context.attack_range * 1.5
-            and context.distance_to_target < context.detection_range
-        ):
-            return 0.6 + (target_speed * 0.05)
-
-        return 0.2
+        return ai_utility.eval_predict(
+            _hypot(target_velocity[0], target_velocity[1]),
+            context.distance_to_target,
+            context.detection_range,
+            context.attack_range,
+        )
 
     def _evaluate_idle(self, context: AIContext) -> float:
         """Evaluate utility of idle action."""
@@ -817,7 +836,18 @@ class SmartChaseBehavior(AIBehavior):
     intercepts accordingly.
     """
 
-    name = "smart_chase"
+    __slots__ = (
+        "speed",
+        "attack_range",
+        "detection_range",
+        "prediction_factor",
+        "_attack_range_sq",
+        "_lost_range_sq",
+        "_last_target_x",
+        "_target_vx",
+    )
+
+    name = BEHAVIOR_SMART_CHASE
 
     def __init__(
         self,
@@ -839,8 +869,11 @@ class SmartChaseBehavior(AIBehavior):
         self.attack_range = attack_range
         self.detection_range = detection_range
         self.prediction_factor = prediction_factor
-        self._last_target_pos: Optional[pygame.math.Vector2] = None
-        self._target_velocity: pygame.math.Vector2 = pygame.math.Vector2(0, 0)
+        self._attack_range_sq = attack_range * attack_range
+        self._lost_range_sq = (detection_range * 1.5) ** 2
+        # Chasers only steer horizontally, so only the x axis is tracked
+        self._last_target_x: Optional[float] = None
+        self._target_vx = 0.0
 
     def update(
         self,
@@ -850,54 +883,59 @@ class SmartChaseBehavior(AIBehavior):
     ) -> Optional[str]:
         """Update smart chase behavior with prediction."""
         if not target:
-            return "patrol"
-
-        # Calculate target velocity
-        current_target_pos = pygame.math.Vector2(target.pos)
-        if self._last_target_pos is not None:
-            self._target_velocity = (current_target_pos - self._last_target_pos) / max(dt, 0.001)
-        self._last_target_pos = current_target_pos.copy()
-
-        distance = self._get_distance_to_target(entity, target)
-
-        if distance > self.detection_range * 1.5:
-            return "patrol"
-
-        if distance <= self.attack_range:
-            return "attack"
-
-        # Predict target position
-        prediction_time = distance / max(self.speed, 1.0) * self.prediction_factor
-        predicted_pos = current_target_pos + self._target_velocity * prediction_time
-
-        # Move toward predicted position
-        direction = predicted_pos.x - entity.pos.x
-        if abs(direction) > 5:
-            if direction > 0:
-                entity.velocity.x = self.speed
-                entity.facing_right = True
-            else:
-                entity.velocity.x = -self.speed
-                entity.facing_right = False
-        else:
-            entity.velocity.x = 0
+            return BEHAVIOR_PATROL
+
+        target_pos = target.pos
+        target_x = target_pos.x
+        entity_pos = entity.pos
+        entity_x = entity_pos.x
+
+        # Estimate target speed from the previous sample
+        last_x = self._last_target_x
+        if last_x is not None:
+            self._target_vx = (target_x - last_x) / max(dt, 0.001)
+        self._last_target_x = target_x
+
+        dist_sq = _dist_sq_xy(entity_x, entity_pos.y, target_x, target_pos.y)
+
+        if dist_sq > self._lost_range_sq:
+            return BEHAVIOR_PATROL
+
+        if dist_sq <= self._attack_range_sq:
+            return BEHAVIOR_ATTACK
+
+        # Predict and steer in one scalar expression: lead the target by its
+        # speed times the time needed to close the distance
+        speed = self.speed
+        direction = (
+            target_x
+            + self._target_vx * _sqrt(dist_sq) / max(speed, 1.0) * self.prediction_factor
+            - entity_x
+        )
+        moving = abs(direction) > 5
+        entity.velocity.x = _copysign(speed, direction) if moving else 0.0
+        if moving:
+            entity.facing_right = direction > 0
 
         return None
 
-    def _get_distance_to_target(self, entity: "Entity", target: "Entity") -> float:
-        """Calculate distance to target."""
-        return pygame.math.Vector2(
-            target.pos.x - entity.pos.x,
-            target.pos.y - entity.pos.y,
-        ).length()
-
 
 class FlankBehavior(AIBehavior):
     """
     Flanking behavior: circle around target to attack from side/behind.
     """
 
-    name = "flank"
+    __slots__ = (
+        "speed",
+        "preferred_distance",
+        "_flank_direction",
+        "_flank_timer",
+        "_max_flank_time",
+        "_attack_range_sq",
+        "_far_distance_sq",
+    )
+
+    name = BEHAVIOR_FLANK
 
     def __init__(
         self,
@@ -913,9 +951,11 @@ class FlankBehavior(AIBehavior):
         """
         self.speed = speed
         self.preferred_distance = preferred_distance
-        self._flank_direction = random.choice([-1, 1])  # Left or right
+        self._flank_direction = _choice((-1, 1))  # Left or right
         self._flank_timer = 0.0
         self._max_flank_time = 2.0
+        self._attack_range_sq = ENEMY_ATTACK_RANGE * ENEMY_ATTACK_RANGE
+        self._far_distance_sq = (preferred_distance * 1.5) ** 2
 
     def update(
         self,
@@ -925,45 +965,43 @@ class FlankBehavior(AIBehavior):
     ) -> Optional[str]:
         """Update flank behavior."""
         if not target:
-            return "patrol"
+            return BEHAVIOR_PATROL
 
         self._flank_timer += dt
 
         # Stop flanking after max time
         if self._flank_timer >= self._max_flank_time:
             self._flank_timer = 0.0
-            return "chase"
+            return BEHAVIOR_CHASE
 
-        distance = pygame.math.Vector2(
-            target.pos.x - entity.pos.x,
-            target.pos.y - entity.pos.y,
-        ).length()
+        entity_pos = entity.pos
+        target_pos = target.pos
+        dx = target_pos.x - entity_pos.x
+        dy = target_pos.y - entity_pos.y
+        dist_sq = dx * dx + dy * dy
 
         # If too close, attack
-        if distance <= ENEMY_ATTACK_RANGE:
-            return "attack"
-
-        # Move perpendicular to target
-        to_target = pygame.math.Vector2(
-            target.pos.x - entity.pos.x,
-            target.pos.y - entity.pos.y,
-        )
-
-        if to_target.length() > 0:
-            to_target.normalize_ip()
+        if dist_sq <= self._attack_range_sq:
+            return BEHAVIOR_ATTACK
+
+        # Unit vector toward target from the one sqrt; a degenerate
+        # direction stays (0, 0) so the flank stalls instead of dividing by ~0
+        if dist_sq > 1e-8:
+            inv_len = 1.0 / _sqrt(dist_sq)
+            dx *= inv_len
+            dy *= inv_len
+        else:
+            dx = dy = 0.0
 
-        # Perpendicular direction (flanking)
-        flank_dir = pygame.math.Vector2(
-            -to_target.y * self._flank_direction,
-            to_target.x * self._flank_direction,
-        )
+        # Perpendicular direction (flanking); only the x component drives movement
+        flank_x = -dy * self._flank_direction
 
         # Add slight movement toward target if too far
-        if distance > self.preferred_distance * 1.5:
-            flank_dir = flank_dir * 0.5 + to_target * 0.5
+        if dist_sq > self._far_distance_sq:
+            flank_x = flank_x * 0.5 + dx * 0.5
 
-        entity.velocity.x = flank_dir.x * self.speed
-        entity.facing_right = target.pos.x > entity.pos.x
+        entity.velocity.x = flank_x * self.speed
+        entity.facing_right = target_pos.x > entity_pos.x
 
         return None
 
@@ -973,7 +1011,9 @@ class RetreatBehavior(AIBehavior):
     Retreat behavior: move away from target when low on health.
     """
 
-    name = "retreat"
+    __slots__ = ("speed", "safe_distance", "_safe_distance_sq")
+
+    name = BEHAVIOR_RETREAT
 
     def __init__(
         self,
@@ -989,6 +1029,7 @@ class RetreatBehavior(AIBehavior):
         """
         self.speed = speed
         self.safe_distance = safe_distance
+        self._safe_distance_sq = safe_distance * safe_distance
 
     def update(
         self,
@@ -998,24 +1039,24 @@ class RetreatBehavior(AIBehavior):
     ) -> Optional[str]:
         """Update retreat behavior."""
         if not target:
-            return "patrol"
+            return BEHAVIOR_PATROL
 
-        distance = pygame.math.Vector2(
-            target.pos.x - entity.pos.x,
-            target.pos.y - entity.pos.y,
-        ).length()
+        entity_pos = entity.pos
+        target_pos = target.pos
+        dist_sq = _dist_sq_xy(entity_pos.x, entity_pos.y, target_pos.x, target_pos.y)
 
         # Stop retreating when safe
-        if distance >= self.safe_distance:
-            return "patrol"
+        if dist_sq >= self._safe_distance_sq:
+            return BEHAVIOR_PATROL
 
         # Move away from target
-        direction = entity.pos.x - target.pos.x
+        velocity = entity.velocity
+        direction = entity_pos.x - target_pos.x
         if direction >= 0:
-            entity.velocity.x = self.speed
+            velocity.x = self.speed
             entity.facing_right = False  # Face target while retreating
         else:
-            entity.velocity.x = -self.speed
+            velocity.x = -self.speed
             entity.facing_right = True
 
         return None
@@ -1055,6 +1096,9 @@ class AIController:
         self._time_since_attack = 0.0
         self._decision_timer = 0.0
         self._decision_interval = AI_DECISION_INTERVAL
+        self._last_context_key: Optional[Tuple[bool, int, int, int]] = None
+        self._action_to_behavior: Tuple[str, ...] = ()
+        self._rebuild_action_table()
 
     def register_behavior(self, behavior: AIBehavior) -> None:
         """
@@ -1064,6 +1108,25 @@ class AIController:
             behavior: Behavior to register.
         """
         self.behaviors[behavior.name] = behavior
+        self._rebuild_action_table()
+
+    def _rebuild_action_table(self) -> None:
+        """Resolve each action's behavior name, with fallbacks, in action order."""
+        behaviors = self.behaviors
+        chase = BEHAVIOR_SMART_CHASE if BEHAVIOR_SMART_CHASE in behaviors else BEHAVIOR_CHASE
+        retreat = BEHAVIOR_RETREAT if BEHAVIOR_RETREAT in behaviors else BEHAVIOR_PATROL
+        action_to_behavior: Dict[AIAction, str] = {
+            AIAction.PATROL: BEHAVIOR_PATROL,
+            AIAction.CHASE: chase,
+            AIAction.ATTACK: BEHAVIOR_ATTACK,
+            AIAction.RETREAT: retreat,
+            AIAction.FLANK: BEHAVIOR_FLANK if BEHAVIOR_FLANK in behaviors else BEHAVIOR_CHASE,
+            AIAction.PREDICT: chase,
+            AIAction.IDLE: BEHAVIOR_PATROL,
+        }
+        self._action_to_behavior = tuple(
+            action_to_behavior[action] for action in AIDecisionMaker._ACTIONS
+        )
 
     def set_behavior(self, behavior_name: str) -> None:
         """
@@ -1072,9 +1135,11 @@ class AIController:
         Args:
             behavior_name: Name of behavior to activate.
         """
-        if behavior_name in self.behaviors:
-            self.current_behavior = self.behaviors[behavior_name]
-            logger.debug("AI behavior set to: %s", behavior_name)
+        behavior = self.behaviors.get(behavior_name)
+        if behavior is not None:
+            self.current_behavior = behavior
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("AI behavior set to: %s", behavior_name)
 
     def update(
         self,
@@ -1116,21 +1181,27 @@ class AIController:
         target: Optional["Entity"],
     ) -> None:
         """Make a smart decision based on context."""
+        # Skip the full evaluation while the coarse situation is unchanged
+        if target is not None:
+            distance = _hypot(target.pos.x - entity.pos.x, target.pos.y - entity.pos.y)
+            distance_bucket = int(distance / AI_RECHECK_DISTANCE_BUCKET)
+        else:
+            distance_bucket = -1
+        key = (
+            target is not None,
+            distance_bucket,
+            entity.health // AI_RECHECK_HEALTH_BUCKET,
+            # Attack utility saturates at 0.5s, so later times share a bucket
+            int(min(self._time_since_attack, 0.5) / AI_RECHECK_TIME_BUCKET),
+        )
+        if key == self._last_context_key:
+            return
+        self._last_context_key = key
+
         context = self._build_context(entity, target)
         action = self.decision_maker.decide(context)
 
-        # Map action to behavior
-        action_to_behavior: Dict[AIAction, str] = {
-            AIAction.PATROL: "patrol",
-            AIAction.CHASE: "smart_chase" if "smart_chase" in self.behaviors else "chase",
-            AIAction.ATTACK: "attack",
-            AIAction.RETREAT: "retreat" if "retreat" in self.behaviors else "patrol",
-            AIAction.FLANK: "flank" if "flank" in self.behaviors else "chase",
-            AIAction.PREDICT: "smart_chase" if "smart_chase" in self.behaviors else "chase",
-            AIAction.IDLE: "patrol",
-        }
-
-        behavior_name = action_to_behavior.get(action, "patrol")
+        behavior_name = self._action_to_behavior[AIDecisionMaker._ACTION_INDEX[action]]
         if behavior_name in self.behaviors:
             if self.current_behavior is None or self.current_behavior.name != behavior_name:
                 self.set_behavior(behavior_name)
@@ -1141,22 +1212,22 @@ class AIController:
         target: Optional["Entity"],
     ) -> AIContext:
         """Build AI context from current state."""
+        pos = entity.pos
         target_pos = None
         target_velocity = None
         target_health = None
         distance = float("inf")
 
         if target:
-            target_pos = pygame.math.Vector2(target.pos)
-            target_velocity = pygame.math.Vector2(target.velocity)
+            tpos = target.pos
+            tvel = target.velocity
+            target_pos = (tpos.x, tpos.y)
+            target_velocity = (tvel.x, tvel.y)
             target_health = getattr(target, "health", 100)
-            distance = pygame.math.Vector2(
-                target.pos.x - entity.pos.x,
-                target.pos.y - entity.pos.y,
-            ).length()
+            distance = _hypot(tpos.x - pos.x, tpos.y - pos.y)
 
         return AIContext(
-            entity_pos=pygame.math.Vector2(entity.pos),
+            entity_pos=(pos.x, pos.y),
             entity_health=entity.health,
             entity_max_health=entity.max_health,
             target_pos=target_pos,
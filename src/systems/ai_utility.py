@@ -0,0 +1,231 @@
+"""
+Utility response curves and action evaluators as plain float functions.
+
+Kept free of pygame types and the AIContext dataclass so each function
+takes and returns primitive floats only; AIDecisionMaker unpacks the
+context and forwards here.
+"""
+
+import math
+
+from src.core.settings import AI_TARGET_SPEED_THRESHOLD
+
+# Bound once so hot paths skip the module attribute lookup
+_exp = math.exp
+
+
+# =============================================================================
+# Response curves
+# =============================================================================
+
+
+def linear(value: float, min_val: float, max_val: float) -> float:
+    """
+    Linear response curve.
+
+    Args:
+        value: Input value.
+        min_val: Minimum value (maps to 0).
+        max_val: Maximum value (maps to 1).
+
+    Returns:
+        Utility score between 0 and 1.
+    """
+    if max_val <= min_val:
+        return 0.0
+    normalized = (value - min_val) / (max_val - min_val)
+    return max(0.0, min(1.0, normalized))
+
+
+def inverse_linear(value: float, min_val: float, max_val: float) -> float:
+    """
+    Inverse linear response curve (higher value = lower score).
+
+    Args:
+        value: Input value.
+        min_val: Minimum value (maps to 1).
+        max_val: Maximum value (maps to 0).
+
+    Returns:
+        Utility score between 0 and 1.
+    """
+    return 1.0 - linear(value, min_val, max_val)
+
+
+def exponential(value: float, exponent: float = 2.0) -> float:
+    """
+    Exponential response curve.
+
+    Args:
+        value: Input value between 0 and 1.
+        exponent: Power to raise value to.
+
+    Returns:
+        Utility score.
+    """
+    result: float = max(0.0, min(1.0, value**exponent))
+    return result
+
+
+def logistic(value: float, steepness: float = 10.0, midpoint: float = 0.5) -> float:
+    """
+    Logistic (S-curve) response curve.
+
+    Args:
+        value: Input value between 0 and 1.
+        steepness: How steep the transition is.
+        midpoint: Value at which output is 0.5.
+
+    Returns:
+        Utility score between 0 and 1.
+    """
+    # Beyond +/-50 the curve is flat to double precision, so clamp
+    # instead of guarding math.exp against overflow
+    x = -steepness * (value - midpoint)
+    if x > 50.0:
+        return 0.0
+    if x < -50.0:
+        return 1.0
+    return 1.0 / (1.0 + _exp(x))
+
+
+# =============================================================================
+# Action evaluators (target-dependent ones assume a target exists)
+# =============================================================================
+
+
+def eval_patrol(distance: float, detection_range: float) -> float:
+    """
+    Score patrolling given a visible target.
+
+    Args:
+        distance: Distance to target.
+        detection_range: Detection range.
+
+    Returns:
+        Utility score; grows as the target drifts beyond detection range.
+    """
+    return linear(distance, detection_range, detection_range * 2) * 0.8
+
+
+def eval_chase(
+    distance: float,
+    detection_range: float,
+    attack_range: float,
+    aggression: float,
+) -> float:
+    """
+    Score chasing a target.
+
+    Args:
+        distance: Distance to target.
+        detection_range: Detection range.
+        attack_range: Attack range.
+        aggression: Aggression factor (0-1).
+
+    Returns:
+        High score between the two ranges, low inside attack range.
+    """
+    if distance > detection_range:
+        return 0.0
+
+    if distance > attack_range:
+        # Higher score when closer to attack range
+        proximity_score = inverse_linear(distance, attack_range, detection_range)
+        return 0.7 + (proximity_score * 0.2) + (aggression * 0.1)
+
+    return 0.3  # Low score when already in attack range
+
+
+def eval_attack(
+    distance: float,
+    attack_range: float,
+    aggression: float,
+    time_since_attack: float,
+) -> float:
+    """
+    Score attacking a target.
+
+    Args:
+        distance: Distance to target.
+        attack_range: Attack range.
+        aggression: Aggression factor (0-1).
+        time_since_attack: Seconds since the last attack.
+
+    Returns:
+        Score inside attack range, penalized right after an attack.
+    """
+    if distance > attack_range:
+        return 0.0
+
+    # Decrease score if recently attacked (prevent spamming)
+    cooldown_penalty = linear(time_since_attack, 0.0, 0.5)
+
+    return 0.8 + aggression * 0.2 - (1.0 - cooldown_penalty) * 0.3
+
+
+def eval_retreat(health: float, max_health: float, aggression: float) -> float:
+    """
+    Score retreating.
+
+    Args:
+        health: Current health.
+        max_health: Maximum health.
+        aggression: Aggression factor (0-1); reduces retreat tendency.
+
+    Returns:
+        Score that rises as health drops below half.
+    """
+    health_ratio = health / max(1, max_health)
+    low_health_score = inverse_linear(health_ratio, 0.2, 0.5)
+    return max(0.0, low_health_score * 0.9 - aggression * 0.4)
+
+
+def eval_flank(
+    distance: float,
+    detection_range: float,
+    attack_range: float,
+    aggression: float,
+) -> float:
+    """
+    Score flanking a target.
+
+    Args:
+        distance: Distance to target.
+        detection_range: Detection range.
+        attack_range: Attack range.
+        aggression: Aggression factor (0-1).
+
+    Returns:
+        Higher score at medium range.
+    """
+    if attack_range < distance < detection_range * 0.7:
+        return 0.5 + (aggression * 0.2)
+    return 0.2
+
+
+def eval_predict(
+    target_speed: float,
+    distance: float,
+    detection_range: float,
+    attack_range: float,
+) -> float:
+    """
+    Score predictive movement toward a moving target.
+
+    Args:
+        target_speed: Target speed.
+        distance: Distance to target.
+        detection_range: Detection range.
+        attack_range: Attack range.
+
+    Returns:
+        Higher score for a moving target at medium range.
+    """
+    if target_speed < AI_TARGET_SPEED_THRESHOLD:
+        return 0.1  # Target not moving much
+
+    if attack_range * 1.5 < distance < detection_range:
+        return 0.6 + (target_speed * 0.05)
+
+    return 0.2
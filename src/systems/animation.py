@@ -5,7 +5,7 @@ Manages animation states, frame timing, and sprite flipping.
 """
 
 import logging
-from typing import Dict, List, Optional, Callable, Tuple
+from typing import Dict, List, Optional, Callable, Sequence, Tuple
 
 import pygame
 
@@ -18,6 +18,10 @@ class Animation:
 
     Attributes:
         frames: List of pygame surfaces.
+        frames_left: Horizontally flipped frames, or None until first needed
+            when precompute_flip is False.
+        frames_by_facing: (frames, frames_left), indexed by
+            AnimationController.facing_index.
         frame_duration: Time per frame in seconds.
         loop: Whether animation loops.
     """
@@ -27,6 +31,7 @@ class Animation:
         frames: List[pygame.Surface],
         frame_duration: float = 0.1,
         loop: bool = True,
+        precompute_flip: bool = True,
     ) -> None:
         """
         Initialize animation with frames.
@@ -35,11 +40,73 @@ class Animation:
             frames: List of pygame surfaces for animation.
             frame_duration: Time per frame in seconds.
             loop: Whether animation loops.
+            precompute_flip: Build the left-facing frames now instead of on
+                first use, so no flip ever happens while rendering.
         """
         self.frames = frames
         self.frame_duration = frame_duration
         self.loop = loop
 
+        # Frame index for every millisecond of one loop period
+        self._index_table = self._build_index_table()
+        self._table_len = len(self._index_table)
+
+        self.frames_left: Optional[List[pygame.Surface]] = (
+            self._flip_frames() if precompute_flip else None
+        )
+        self.frames_by_facing: Tuple[List[pygame.Surface], Optional[List[pygame.Surface]]] = (
+            frames,
+            self.frames_left,
+        )
+
+    def _flip_frames(self) -> List[pygame.Surface]:
+        """
+        Mirror every frame horizontally.
+
+        Frames that share a surface (e.g. placeholders) share its mirror too.
+
+        Returns:
+            Flipped surfaces in frame order.
+        """
+        flipped: Dict[int, pygame.Surface] = {}
+        frames_left = []
+        for frame in self.frames:
+            mirror = flipped.get(id(frame))
+            if mirror is None:
+                mirror = flipped[id(frame)] = pygame.transform.flip(frame, True, False)
+            frames_left.append(mirror)
+        return frames_left
+
+    def _build_index_table(self) -> Sequence[int]:
+        """
+        Precompute the frame index at 1 ms resolution over one loop period.
+
+        Returns:
+            Frame index per millisecond (bytes when every index fits).
+        """
+        num_frames = len(self.frames)
+        step_ms = self.frame_duration * 1000
+        if not num_frames or step_ms <= 0:
+            return b"\x00"
+        table_len = max(1, round(num_frames * step_ms))
+        # Small epsilon so exact frame boundaries don't round down
+        indices = [min(int(i / step_ms + 1e-9), num_frames - 1) for i in range(table_len)]
+        return bytes(indices) if num_frames <= 256 else tuple(indices)
+
+    def frame_index(self, time: float) -> int:
+        """
+        Get the frame index at given time.
+
+        Args:
+            time: Animation time in seconds.
+
+        Returns:
+            Index into frames.
+        """
+        if self.loop:
+            return self._index_table[int(time * 1000) % self._table_len]
+        return min(int(time / self.frame_duration), len(self.frames) - 1)
+
     def get_frame(self, time: float) -> pygame.Surface:
         """
         Get frame at given time.
@@ -50,10 +117,25 @@ class Animation:
         Returns:
             Surface for the current frame.
         """
-        if self.loop:
-            time = time % (len(self.frames) * self.frame_duration)
-        frame_index = int(time / self.frame_duration)
-        return self.frames[min(frame_index, len(self.frames) - 1)]
+        return self.frames[self.frame_index(time)]
+
+    def get_flipped_frame(self, time: float) -> pygame.Surface:
+        """
+        Get the horizontally flipped frame at given time.
+
+        Flipped surfaces are created once and reused; treat them as read-only.
+
+        Args:
+            time: Animation time in seconds.
+
+        Returns:
+            Mirrored surface for the current frame.
+        """
+        frames_left = self.frames_left
+        if frames_left is None:
+            frames_left = self.frames_left = self._flip_frames()
+            self.frames_by_facing = (self.frames, frames_left)
+        return frames_left[self.frame_index(time)]
 
     def is_finished(self, time: float) -> bool:
         """
@@ -71,16 +153,32 @@ class Animation:
 
 
 class AnimationController:
-    """Manages multiple animations for an entity."""
+    """
+    Manages multiple animations for an entity.
+
+    Attributes:
+        facing_index: 0 when facing right, 1 when facing left; indexes
+            Animation.frames_by_facing.
+    """
 
     def __init__(self) -> None:
         """Initialize animation controller."""
         self.animations: Dict[str, Animation] = {}
         self.current_animation: Optional[str] = None
         self.animation_time: float = 0.0
-        self.facing_right: bool = True
+        self.facing_index: int = 0
         self.on_animation_end: Optional[Callable[[str], None]] = None
 
+    @property
+    def facing_right(self) -> bool:
+        """Whether the entity faces right."""
+        return self.facing_index == 0
+
+    @facing_right.setter
+    def facing_right(self, right: bool) -> None:
+        """Set facing direction from a bool."""
+        self.facing_index = 0 if right else 1
+
     def add_animation(self, name: str, animation: Animation) -> None:
         """
         Add animation to controller.
@@ -138,13 +236,12 @@ class AnimationController:
         if animation is None:
             return None
 
-        frame = animation.get_frame(self.animation_time)
-
-        # Flip if facing left
-        if not self.facing_right:
-            frame = pygame.transform.flip(frame, True, False)
-
-        return frame
+        # Pick the right/left frame list by index; left frames are pre-flipped
+        frames = animation.frames_by_facing[self.facing_index]
+        if frames is None:
+            # Lazy animation whose flipped frames are not built yet
+            return animation.get_flipped_frame(self.animation_time)
+        return frames[animation.frame_index(self.animation_time)]
 
     def set_facing(self, right: bool) -> None:
         """
@@ -153,13 +250,14 @@ class AnimationController:
         Args:
             right: True if facing right, False if facing left.
         """
-        self.facing_right = right
+        self.facing_index = 0 if right else 1
 
 
 def create_placeholder_frames(
     color: Tuple[int, int, int],
     size: Tuple[int, int] = (32, 32),
     num_frames: int = 4,
+    share: bool = True,
 ) -> List[pygame.Surface]:
     """
     Create placeholder animation frames for testing.
@@ -168,14 +266,21 @@ def create_placeholder_frames(
         color: RGB color tuple.
         size: Frame size.
         num_frames: Number of frames to create.
+        share: Reuse one surface for every frame. Shared frames are
+            read-only; pass False if the caller draws on frames individually.
 
     Returns:
         List of surfaces with full opacity for better visibility.
     """
-    frames = []
-    for i in range(num_frames):
+    if share:
         surface = pygame.Surface(size, pygame.SRCALPHA)
         # Use full opacity (255) to make player clearly visible
         surface.fill((*color, 255))
+        return [surface] * num_frames
+
+    frames = []
+    for _ in range(num_frames):
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill((*color, 255))
         frames.append(surface)
     return frames
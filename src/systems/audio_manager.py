@@ -1,17 +1,27 @@
 """
 Audio management system for The Last Knight Path.
 
-Handles music playback, sound effects, and volume control.
+Handles music playback, sound effects, and volume control. This is the
+single AudioManager implementation; src.systems.audio re-exports it.
 """
 
 import logging
-from typing import Dict, Optional
+import os
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
 
 import pygame
 
 from src.core.settings import (
+    AUDIO_BUFFER_SIZE,
+    AUDIO_FALLBACK_BUFFER_SIZE,
+    AUDIO_FREQUENCY,
+    AUDIO_MIXER_CHANNELS,
     AUDIO_PATH,
+    MONO_AUDIO,
     MUSIC_VOLUME,
+    SFX_CACHE_LIMIT,
+    SFX_MAX_FILE_BYTES,
     SFX_VOLUME,
 )
 from src.core.resource_manager import ResourceManager
@@ -19,6 +29,30 @@ from src.core.resource_manager import ResourceManager
 logger = logging.getLogger(__name__)
 
 
+def _index_audio_dir(directory: str, extension: str) -> Dict[str, str]:
+    """
+    Map each audio file's base name to its path with a single directory scan.
+
+    Args:
+        directory: Directory to scan (not recursive).
+        extension: File extension to include, e.g. ".wav".
+
+    Returns:
+        Dictionary of name (without extension) to file path; empty if the
+        directory is missing.
+    """
+    index: Dict[str, str] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name, ext = os.path.splitext(entry.name)
+                if ext == extension and entry.is_file():
+                    index[name] = entry.path
+    except OSError as e:
+        logger.error("Failed to scan audio directory %s: %s", directory, e)
+    return index
+
+
 class AudioManager:
     """
     Manages game audio including music and sound effects.
@@ -31,7 +65,7 @@ class AudioManager:
         music_volume: Current music volume (0.0 to 1.0).
         sfx_volume: Current sound effects volume (0.0 to 1.0).
         current_music: Name of currently playing music track.
-        sfx_cache: Cache of loaded sound effects.
+        sfx_cache: Cache of loaded sound effects, least recently used first.
     """
 
     _instance: Optional["AudioManager"] = None
@@ -49,31 +83,65 @@ class AudioManager:
         if hasattr(self, "_initialized") and self._initialized:  # type: ignore[has-type]
             return
 
-        # Initialize pygame mixer if not already initialized
-        if not pygame.mixer.get_init():
-            try:
-                pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-                logger.info("Pygame mixer initialized")
-            except pygame.error as e:
-                logger.error("Failed to initialize mixer: %s", e)
-                self._initialized = True
-                return
-
         self.resource_manager = ResourceManager()
         self.music_volume = MUSIC_VOLUME
         self.sfx_volume = SFX_VOLUME
         self.current_music: Optional[str] = None
-        self.sfx_cache: Dict[str, pygame.mixer.Sound] = {}
+        self.sfx_cache: "OrderedDict[str, pygame.mixer.Sound]" = OrderedDict()
+        self._sfx_cache_limit = SFX_CACHE_LIMIT
         self._music_enabled = True
         self._sfx_enabled = True
-
-        # Set initial volumes
-        pygame.mixer.music.set_volume(self.music_volume)
-
+        self._music_paused = False
+        self._mixer_ready = False
+        # Name -> path indexes, built on first lookup; audio dirs are static
+        self._music_dir = os.path.join(AUDIO_PATH, "music")
+        self._sfx_dir = os.path.join(AUDIO_PATH, "sfx")
+        self._music_index: Optional[Dict[str, str]] = None
+        self._sfx_index: Optional[Dict[str, str]] = None
+
+        # The mixer itself is opened on first playback (see _ensure_mixer)
         self._initialized = True  # type: ignore[has-type]
         logger.info("AudioManager initialized")
 
-    def play_music(self, music_name: str, loops: int = -1, fade_ms: int = 1000) -> None:
+    def _ensure_mixer(self) -> bool:
+        """
+        Initialize the pygame mixer on first use.
+
+        Returns:
+            True if the mixer is available.
+        """
+        if self._mixer_ready:
+            return True
+
+        if not pygame.mixer.get_init():
+            for buffer in (AUDIO_BUFFER_SIZE, AUDIO_FALLBACK_BUFFER_SIZE):
+                try:
+                    pygame.mixer.init(
+                        frequency=AUDIO_FREQUENCY,
+                        size=-16,
+                        channels=1 if MONO_AUDIO else 2,
+                        buffer=buffer,
+                    )
+                    logger.info("Pygame mixer initialized (buffer=%d)", buffer)
+                    break
+                except pygame.error as e:
+                    logger.error("Failed to initialize mixer (buffer=%d): %s", buffer, e)
+            else:
+                return False
+            pygame.mixer.set_num_channels(AUDIO_MIXER_CHANNELS)
+
+        # Apply volumes chosen before the mixer existed
+        pygame.mixer.music.set_volume(self.music_volume)
+        self._mixer_ready = True
+        return True
+
+    def play_music(
+        self,
+        music_name: str,
+        loops: int = -1,
+        fade_ms: int = 1000,
+        loop: Optional[bool] = None,
+    ) -> None:
         """
         Play background music.
 
@@ -81,24 +149,41 @@ class AudioManager:
             music_name: Name of music file (without path, e.g., "menu", "gameplay", "boss").
             loops: Number of loops (-1 for infinite).
             fade_ms: Fade-in time in milliseconds.
+            loop: Shorthand overriding loops: True loops forever, False plays once.
         """
-        if not self._music_enabled:
-            return
+        if loop is not None:
+            loops = -1 if loop else 0
 
-        # Stop current music if different
-        if self.current_music == music_name and pygame.mixer.music.get_busy():
+        if not self._music_enabled or not self._ensure_mixer():
             return
 
-        music_path = f"{AUDIO_PATH}/music/{music_name}.mp3"
+        # Keep the current track going instead of reloading it; a paused
+        # track (get_busy() is False while paused) is resumed
+        if self.current_music == music_name:
+            if self._music_paused:
+                self.unpause_music()
+                return
+            if pygame.mixer.music.get_busy():
+                return
+
+        if self._music_index is None:
+            self._music_index = _index_audio_dir(self._music_dir, ".mp3")
+        music_path = self._music_index.get(music_name)
+        if music_path is None:
+            logger.error("Music track not found: %s", music_name)
+            self.current_music = None
+            return
 
         try:
             pygame.mixer.music.load(music_path)
             pygame.mixer.music.set_volume(self.music_volume)
             pygame.mixer.music.play(loops=loops, fade_ms=fade_ms)
             self.current_music = music_name
+            self._music_paused = False
             logger.info("Playing music: %s", music_name)
-        except pygame.error as e:
+        except (pygame.error, FileNotFoundError) as e:
             logger.error("Failed to play music %s: %s", music_name, e)
+            self.current_music = None
 
     def stop_music(self, fade_ms: int = 1000) -> None:
         """
@@ -107,47 +192,45 @@ class AudioManager:
         Args:
             fade_ms: Fade-out time in milliseconds.
         """
-        if pygame.mixer.music.get_busy():
+        if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
             pygame.mixer.music.fadeout(fade_ms)
-            self.current_music = None
             logger.debug("Music stopped")
+        self.current_music = None
+        self._music_paused = False
 
     def pause_music(self) -> None:
         """Pause background music."""
-        if pygame.mixer.music.get_busy():
+        if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
             pygame.mixer.music.pause()
+            self._music_paused = True
             logger.debug("Music paused")
 
     def unpause_music(self) -> None:
         """Resume paused background music."""
+        if not pygame.mixer.get_init():
+            return
+
         pygame.mixer.music.unpause()
+        self._music_paused = False
         logger.debug("Music unpaused")
 
     def play_sfx(self, sfx_name: str, volume: Optional[float] = None) -> None:
         """
         Play sound effect.
 
+        Effects are fully decoded into memory, so files over
+        SFX_MAX_FILE_BYTES are refused; stream those with play_music().
+
         Args:
             sfx_name: Name of sound file (without path or extension).
             volume: Optional volume override (0.0 to 1.0).
         """
-        if not self._sfx_enabled:
+        if not self._sfx_enabled or not self._ensure_mixer():
             return
 
-        # Check cache first
-        sound: Optional[pygame.mixer.Sound] = None
-        if sfx_name in self.sfx_cache:
-            sound = self.sfx_cache[sfx_name]
-        else:
-            # Try to load from sfx directory
-            sfx_path = f"{AUDIO_PATH}/sfx/{sfx_name}.wav"
-            sound = self.resource_manager.load_sound(sfx_path)
-
-            if sound is None:
-                logger.warning("Sound effect not found: %s", sfx_name)
-                return
-
-            self.sfx_cache[sfx_name] = sound
+        sound = self._load_sfx(sfx_name)
+        if sound is None:
+            return
 
         # Set volume
         final_volume = volume if volume is not None else self.sfx_volume
@@ -157,6 +240,84 @@ class AudioManager:
         sound.play()
         logger.debug("Playing SFX: %s", sfx_name)
 
+    def preload_sfx(self, sfx_names: Iterable[str]) -> int:
+        """
+        Decode sound effects into the cache ahead of time.
+
+        Call while a screen is loading so the first play of each sound does
+        not stall a gameplay frame on file I/O and WAV decoding.
+
+        Args:
+            sfx_names: Names of sound files (without path or extension).
+
+        Returns:
+            Number of sounds now cached out of those requested.
+        """
+        if not self._ensure_mixer():
+            return 0
+
+        loaded = 0
+        for sfx_name in sfx_names:
+            if self._load_sfx(sfx_name) is not None:
+                loaded += 1
+        logger.debug("Preloaded %d SFX", loaded)
+        return loaded
+
+    def _load_sfx(self, sfx_name: str) -> Optional[pygame.mixer.Sound]:
+        """
+        Get a sound effect from the cache, loading it on a miss.
+
+        Args:
+            sfx_name: Name of sound file (without path or extension).
+
+        Returns:
+            The Sound, or None if it could not be loaded.
+        """
+        cache = self.sfx_cache
+        sound = cache.get(sfx_name)
+        if sound is not None:
+            cache.move_to_end(sfx_name)
+            return sound
+
+        if self._sfx_index is None:
+            self._sfx_index = _index_audio_dir(self._sfx_dir, ".wav")
+        sfx_path = self._sfx_index.get(sfx_name)
+        if sfx_path is not None:
+            # Sound decodes the whole file into memory; long tracks must be
+            # streamed through play_music() instead
+            if os.path.getsize(sfx_path) > SFX_MAX_FILE_BYTES:
+                logger.warning("SFX '%s' is too large to decode; play it as music", sfx_name)
+                return None
+            sound = self.resource_manager.load_sound(sfx_path)
+
+        if sound is None:
+            logger.warning("Sound effect not found: %s", sfx_name)
+            return None
+
+        cache[sfx_name] = sound
+        self._trim_sfx_cache()
+        return sound
+
+    def set_cache_limit(self, limit: int) -> None:
+        """
+        Set how many decoded sound effects stay cached.
+
+        Args:
+            limit: Maximum number of cached sounds (at least 1).
+        """
+        self._sfx_cache_limit = max(1, limit)
+        self._trim_sfx_cache()
+
+    def _trim_sfx_cache(self) -> None:
+        """Evict least recently used sounds beyond the cache limit."""
+        cache = self.sfx_cache
+        while len(cache) > self._sfx_cache_limit:
+            name, _ = cache.popitem(last=False)
+            # The resource manager holds the same Sound; release it there too
+            if self._sfx_index is not None and name in self._sfx_index:
+                self.resource_manager.unload_sound(self._sfx_index[name])
+            logger.debug("Evicted SFX from cache: %s", name)
+
     def set_music_volume(self, volume: float) -> None:
         """
         Set music volume.
@@ -165,7 +326,8 @@ class AudioManager:
             volume: Volume level (0.0 to 1.0).
         """
         self.music_volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(self.music_volume)
+        if pygame.mixer.get_init():
+            pygame.mixer.music.set_volume(self.music_volume)
         logger.debug("Music volume set to: %.2f", self.music_volume)
 
     def set_sfx_volume(self, volume: float) -> None:
@@ -175,9 +337,37 @@ class AudioManager:
         Args:
             volume: Volume level (0.0 to 1.0).
         """
+        # Applied per play in play_sfx(), so slider drags stay O(1)
         self.sfx_volume = max(0.0, min(1.0, volume))
         logger.debug("SFX volume set to: %.2f", self.sfx_volume)
 
+    def get_music_volume(self) -> float:
+        """
+        Get current music volume.
+
+        Returns:
+            Current music volume (0.0-1.0).
+        """
+        return self.music_volume
+
+    def get_sfx_volume(self) -> float:
+        """
+        Get current sound effects volume.
+
+        Returns:
+            Current SFX volume (0.0-1.0).
+        """
+        return self.sfx_volume
+
+    def get_current_music(self) -> Optional[str]:
+        """
+        Get currently playing music track name.
+
+        Returns:
+            Current music track name or None if no music is playing.
+        """
+        return self.current_music
+
     def toggle_music(self) -> bool:
         """
         Toggle music on/off.
@@ -209,7 +399,33 @@ class AudioManager:
         Returns:
             True if music is playing, False otherwise.
         """
-        return pygame.mixer.music.get_busy()
+        return bool(pygame.mixer.get_init()) and pygame.mixer.music.get_busy()
+
+    def is_sfx_cached(self, sound_name: str) -> bool:
+        """
+        Check if a sound effect is in the cache.
+
+        Args:
+            sound_name: Name of the sound effect to check.
+
+        Returns:
+            True if sound is cached, False otherwise.
+        """
+        return sound_name in self.sfx_cache
+
+    def get_cache_size(self) -> int:
+        """
+        Get the number of cached sound effects.
+
+        Returns:
+            Number of sounds in the cache.
+        """
+        return len(self.sfx_cache)
+
+    def clear_cache(self) -> None:
+        """Clear the sound effects cache."""
+        self.sfx_cache.clear()
+        logger.info("SFX cache cleared")
 
     def cleanup(self) -> None:
         """Clean up audio resources."""
@@ -5,7 +5,9 @@ Handles camera following, smoothing, bounds clamping, and screen shake effects.
 """
 
 import logging
+import math
 import random
+from typing import List, Sequence, Tuple
 
 import pygame
 
@@ -13,6 +15,32 @@ from src.core.settings import FPS
 
 logger = logging.getLogger(__name__)
 
+_exp = math.exp
+_INF = math.inf
+
+
+def _follow_axis(offset: float, target: float, alpha: float, low: float, high: float) -> float:
+    """
+    Ease one offset axis toward its target, then clamp it to [low, high].
+
+    Scalar floats only, so the step has no attribute access or allocation.
+    The upper edge is applied first so that when low > high (a level
+    smaller than the viewport) the camera pins to low.
+
+    Args:
+        offset: Current offset.
+        target: Offset being followed.
+        alpha: Lerp coefficient for this frame (0-1).
+        low: Smallest allowed offset (-inf when unbounded).
+        high: Largest allowed offset (+inf when unbounded).
+
+    Returns:
+        New offset.
+    """
+    value = offset + (target - offset) * alpha
+    value = high if value > high else value
+    return low if value < low else value
+
 
 class Camera:
     """
@@ -41,24 +69,39 @@ class Camera:
             screen_width: Width of screen viewport.
             screen_height: Height of screen viewport.
         """
-        self.screen_width = screen_width
-        self.screen_height = screen_height
+        # Viewport size and the half-sizes update() centers with; kept in
+        # sync by the screen_width/screen_height setters
+        self._screen_width = screen_width
+        self._screen_height = screen_height
+        self._half_width = screen_width // 2
+        self._half_height = screen_height // 2
 
         # Camera offset (negative values move camera left/up)
         self.offset = pygame.math.Vector2(0, 0)
         self.target_offset = pygame.math.Vector2(0, 0)
 
-        # Level bounds (0 means no bounds)
+        # Level bounds (0 means no bounds) and the offset limits they imply
         self.bounds_width = 0
         self.bounds_height = 0
+        self._max_ox = -_INF
+        self._max_oy = -_INF
+        self._edge_ox = _INF
+        self._edge_oy = _INF
 
         # Smoothing factor for camera movement
         self.lerp_factor = 0.1
+        # Last dt and its lerp coefficient; dt is nearly constant frame to frame
+        self._alpha_dt = -1.0
+        self._alpha = 0.0
 
         # Screen shake
         self.shake_timer = 0.0
         self.shake_intensity = 0.0
-        self._shake_offset = pygame.math.Vector2(0, 0)
+        self._shake_ox = 0.0
+        self._shake_oy = 0.0
+        # Unit noise drawn once per shake, consumed as a ring buffer
+        self._shake_samples: List[Tuple[float, float]] = [(0.0, 0.0)]
+        self._shake_index = 0
 
         logger.info("Camera initialized: %dx%d viewport", screen_width, screen_height)
 
@@ -73,32 +116,63 @@ class Camera:
             dt: Delta time in seconds.
         """
         # Calculate target offset to center target on screen
-        self.target_offset.x = -target_pos.x + self.screen_width // 2
-        self.target_offset.y = -target_pos.y + self.screen_height // 2
-
-        # Smooth lerp to target offset
-        lerp_speed = self.lerp_factor * dt * FPS
-        self.offset.x += (self.target_offset.x - self.offset.x) * lerp_speed
-        self.offset.y += (self.target_offset.y - self.offset.y) * lerp_speed
-
-        # Clamp to bounds if set
-        if self.bounds_width > 0:
-            # Don't let camera show beyond left edge
-            self.offset.x = min(self.offset.x, 0)
-            # Don't let camera show beyond right edge
-            max_offset_x = -(self.bounds_width - self.screen_width)
-            self.offset.x = max(self.offset.x, max_offset_x)
-
-        if self.bounds_height > 0:
-            # Don't let camera show beyond top edge
-            self.offset.y = min(self.offset.y, 0)
-            # Don't let camera show beyond bottom edge
-            max_offset_y = -(self.bounds_height - self.screen_height)
-            self.offset.y = max(self.offset.y, max_offset_y)
+        tx = self._half_width - target_pos.x
+        ty = self._half_height - target_pos.y
+        self.target_offset.update(tx, ty)
+
+        # Framerate-independent lerp; lerp_factor is the fraction covered per
+        # frame at the target FPS
+        if dt != self._alpha_dt:
+            self._alpha_dt = dt
+            self._alpha = 1.0 - _exp(-self.lerp_factor * FPS * dt)
+        alpha = self._alpha
+
+        # Lerp and clamp to bounds on scalars (limits precomputed by set_bounds),
+        # then write the Vector2 back once
+        offset = self.offset
+        offset.update(
+            _follow_axis(offset.x, tx, alpha, self._max_ox, self._edge_ox),
+            _follow_axis(offset.y, ty, alpha, self._max_oy, self._edge_oy),
+        )
 
         # Update screen shake
         self._update_shake(dt)
 
+    @property
+    def screen_width(self) -> int:
+        """Width of the screen viewport."""
+        return self._screen_width
+
+    @screen_width.setter
+    def screen_width(self, value: int) -> None:
+        """Resize the viewport width, refreshing centering and bound limits."""
+        self.set_screen_size(value, self._screen_height)
+
+    @property
+    def screen_height(self) -> int:
+        """Height of the screen viewport."""
+        return self._screen_height
+
+    @screen_height.setter
+    def screen_height(self, value: int) -> None:
+        """Resize the viewport height, refreshing centering and bound limits."""
+        self.set_screen_size(self._screen_width, value)
+
+    def set_screen_size(self, screen_width: int, screen_height: int) -> None:
+        """
+        Resize the viewport, e.g. after a window resize.
+
+        Args:
+            screen_width: New viewport width.
+            screen_height: New viewport height.
+        """
+        self._screen_width = screen_width
+        self._screen_height = screen_height
+        self._half_width = screen_width // 2
+        self._half_height = screen_height // 2
+        # Bound limits depend on the viewport size
+        self.set_bounds(self.bounds_width, self.bounds_height)
+
     def set_bounds(self, width: int, height: int) -> None:
         """
         Set level bounds for camera clamping.
@@ -109,6 +183,12 @@ class Camera:
         """
         self.bounds_width = width
         self.bounds_height = height
+        # Offsets run from 0 (left/top edge) down to -(level - screen);
+        # unbounded axes get infinite limits so the clamp is a no-op
+        self._max_ox = float(-(width - self._screen_width)) if width > 0 else -_INF
+        self._max_oy = float(-(height - self._screen_height)) if height > 0 else -_INF
+        self._edge_ox = 0.0 if width > 0 else _INF
+        self._edge_oy = 0.0 if height > 0 else _INF
         logger.debug("Camera bounds set to %dx%d", width, height)
 
     def screen_shake(self, duration: float, intensity: float) -> None:
@@ -121,6 +201,18 @@ class Camera:
         """
         self.shake_timer = duration
         self.shake_intensity = intensity
+
+        # Pre-draw one sample pair per expected frame so the per-frame update
+        # is an index; each pair comes from one 32-bit draw split into two
+        # 16-bit halves mapped to [-1, 1]
+        getrandbits = random.getrandbits
+        count = max(1, int(duration * FPS)) + 1
+        samples = []
+        for _ in range(count):
+            bits = getrandbits(32)
+            samples.append(((bits & 0xFFFF) / 32767.5 - 1.0, (bits >> 16) / 32767.5 - 1.0))
+        self._shake_samples = samples
+        self._shake_index = 0
         logger.debug("Screen shake triggered: duration=%f, intensity=%f", duration, intensity)
 
     def _update_shake(self, dt: float) -> None:
@@ -133,17 +225,22 @@ class Camera:
         if self.shake_timer > 0:
             self.shake_timer -= dt
 
-            # Generate random offset within intensity bounds
-            self._shake_offset.x = random.uniform(-self.shake_intensity, self.shake_intensity)
-            self._shake_offset.y = random.uniform(-self.shake_intensity, self.shake_intensity)
-
             if self.shake_timer <= 0:
                 self.shake_timer = 0.0
-                self._shake_offset.x = 0
-                self._shake_offset.y = 0
+                self._shake_ox = 0.0
+                self._shake_oy = 0.0
+                return
+
+            # Scale the next pre-drawn sample to the intensity bounds
+            samples = self._shake_samples
+            sx, sy = samples[self._shake_index % len(samples)]
+            self._shake_index += 1
+            intensity = self.shake_intensity
+            self._shake_ox = sx * intensity
+            self._shake_oy = sy * intensity
         else:
-            self._shake_offset.x = 0
-            self._shake_offset.y = 0
+            self._shake_ox = 0.0
+            self._shake_oy = 0.0
 
     def get_offset(self) -> pygame.math.Vector2:
         """
@@ -152,10 +249,19 @@ class Camera:
         Returns:
             Camera offset as Vector2 (includes shake offset).
         """
-        return pygame.math.Vector2(
-            self.offset.x + self._shake_offset.x,
-            self.offset.y + self._shake_offset.y,
-        )
+        return pygame.math.Vector2(self.get_offset_xy())
+
+    def get_offset_xy(self) -> Tuple[float, float]:
+        """
+        Get current camera offset including shake, without allocating a Vector2.
+
+        Prefer this in per-sprite render code that only needs the numbers.
+
+        Returns:
+            Camera offset as an (x, y) tuple (includes shake offset).
+        """
+        offset = self.offset
+        return (offset.x + self._shake_ox, offset.y + self._shake_oy)
 
     def world_to_screen(self, world_pos: pygame.math.Vector2) -> pygame.math.Vector2:
         """
@@ -167,8 +273,7 @@ class Camera:
         Returns:
             Position in screen coordinates.
         """
-        offset = self.get_offset()
-        return pygame.math.Vector2(world_pos.x + offset.x, world_pos.y + offset.y)
+        return pygame.math.Vector2(self.world_to_screen_xy(world_pos.x, world_pos.y))
 
     def screen_to_world(self, screen_pos: pygame.math.Vector2) -> pygame.math.Vector2:
         """
@@ -180,5 +285,52 @@ class Camera:
         Returns:
             Position in world coordinates.
         """
-        offset = self.get_offset()
-        return pygame.math.Vector2(screen_pos.x - offset.x, screen_pos.y - offset.y)
+        return pygame.math.Vector2(self.screen_to_world_xy(screen_pos.x, screen_pos.y))
+
+    def world_to_screen_xy(self, wx: float, wy: float) -> Tuple[float, float]:
+        """
+        Convert world coordinates to screen coordinates without allocating vectors.
+
+        Args:
+            wx: World x coordinate.
+            wy: World y coordinate.
+
+        Returns:
+            Screen (x, y) including shake.
+        """
+        offset = self.offset
+        return (wx + offset.x + self._shake_ox, wy + offset.y + self._shake_oy)
+
+    def screen_to_world_xy(self, sx: float, sy: float) -> Tuple[float, float]:
+        """
+        Convert screen coordinates to world coordinates without allocating vectors.
+
+        Args:
+            sx: Screen x coordinate.
+            sy: Screen y coordinate.
+
+        Returns:
+            World (x, y) including shake.
+        """
+        offset = self.offset
+        return (sx - offset.x - self._shake_ox, sy - offset.y - self._shake_oy)
+
+    def world_to_screen_batch(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+    ) -> Tuple[List[float], List[float]]:
+        """
+        Convert many world positions at once.
+
+        The offset is read once for the whole batch, e.g. a frame's draw list.
+
+        Args:
+            xs: World x coordinates.
+            ys: World y coordinates, same length as xs.
+
+        Returns:
+            Screen x and y coordinate lists.
+        """
+        off_x, off_y = self.get_offset_xy()
+        return [x + off_x for x in xs], [y + off_y for y in ys]
@@ -6,17 +6,21 @@ Handles collision response with proper resolution order (horizontal then vertica
 """
 
 import logging
-from typing import List, Tuple, Optional, TYPE_CHECKING
+import math
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, Tuple, Optional, TYPE_CHECKING
 
 import pygame
 
-from src.core.settings import RAYCAST_STEP_SIZE
+from src.core.settings import COLLISION_CELL_SIZE
 
 if TYPE_CHECKING:
     from src.systems.physics import PhysicsBody
 
 logger = logging.getLogger(__name__)
 
+_INF = math.inf
+
 
 def check_aabb_collision(rect1: pygame.Rect, rect2: pygame.Rect) -> bool:
     """
@@ -49,51 +53,191 @@ def get_collision_side(
         Tuple of (side, overlap) where side is 'left', 'right', 'top', 'bottom',
         or 'none' if no collision could be determined.
     """
-    overlaps = {
-        "left": moving_rect.right - static_rect.left,
-        "right": static_rect.right - moving_rect.left,
-        "top": moving_rect.bottom - static_rect.top,
-        "bottom": static_rect.bottom - moving_rect.top,
-    }
+    left = moving_rect.right - static_rect.left
+    right = static_rect.right - moving_rect.left
+    top = moving_rect.bottom - static_rect.top
+    bottom = static_rect.bottom - moving_rect.top
+    vx = velocity.x
+    vy = velocity.y
+
+    # Sides the rect cannot be approaching are skipped; ties resolve in
+    # left/right/top/bottom order
+    side = "none"
+    overlap = 0
+    best = _INF
+    if vx >= 0 and left < best:
+        side, overlap, best = "left", left, left
+    if vx <= 0 and right < best:
+        side, overlap, best = "right", right, right
+    if vy >= 0 and top < best:
+        side, overlap, best = "top", top, top
+    if vy <= 0 and bottom < best:
+        side, overlap = "bottom", bottom
+    return side, overlap
+
+
+def _ray_entry(x: float, y: float, dx: float, dy: float, rect: pygame.Rect) -> Optional[float]:
+    """
+    Find where a ray enters a rectangle (slab test).
 
-    # Filter based on velocity direction
-    if velocity.x > 0:
-        overlaps.pop("right", None)
-    elif velocity.x < 0:
-        overlaps.pop("left", None)
+    Args:
+        x: Ray origin x.
+        y: Ray origin y.
+        dx: Unit direction x.
+        dy: Unit direction y.
+        rect: Rectangle to test.
 
-    if velocity.y > 0:
-        overlaps.pop("bottom", None)
-    elif velocity.y < 0:
-        overlaps.pop("top", None)
+    Returns:
+        Distance along the ray to the entry point (0 if the origin is
+        inside), or None if the ray misses.
+    """
+    t_near = 0.0
+    t_far = _INF
+
+    if dx != 0.0:
+        t1 = (rect.left - x) / dx
+        t2 = (rect.right - x) / dx
+        if t1 > t2:
+            t1, t2 = t2, t1
+        if t1 > t_near:
+            t_near = t1
+        if t2 < t_far:
+            t_far = t2
+    elif not rect.left <= x < rect.right:
+        return None
 
-    if not overlaps:
-        return "none", 0
+    if dy != 0.0:
+        t1 = (rect.top - y) / dy
+        t2 = (rect.bottom - y) / dy
+        if t1 > t2:
+            t1, t2 = t2, t1
+        if t1 > t_near:
+            t_near = t1
+        if t2 < t_far:
+            t_far = t2
+    elif not rect.top <= y < rect.bottom:
+        return None
 
-    min_side = min(overlaps, key=lambda k: overlaps[k])
-    return min_side, overlaps[min_side]
+    if t_near >= t_far:
+        return None
+    return t_near
 
 
 class CollisionManager:
     """
     Manages collision detection and resolution.
 
+    Tiles are bucketed into a uniform grid by set_tiles() so each entity is
+    only tested against tiles in the cells its hitbox overlaps.
+
     Attributes:
         tile_rects: List of solid tile rectangles.
+        cell_size: Broad-phase grid cell size in pixels.
     """
 
-    def __init__(self) -> None:
-        """Initialize collision manager with empty tile list."""
+    __slots__ = (
+        "tile_rects",
+        "cell_size",
+        "_cell_rects",
+        "_mean_bucket",
+        "_sorted_left",
+        "_lefts",
+        "_max_tile_width",
+    )
+
+    def __init__(self, cell_size: int = COLLISION_CELL_SIZE) -> None:
+        """
+        Initialize collision manager with empty tile list.
+
+        Args:
+            cell_size: Broad-phase grid cell size in pixels.
+        """
         self.tile_rects: List[pygame.Rect] = []
+        self.cell_size = cell_size
+        # (cell_x, cell_y) -> tiles overlapping that cell, in tile_rects order
+        self._cell_rects: Dict[Tuple[int, int], List[pygame.Rect]] = {}
+        self._mean_bucket = 0.0
+        # Tiles sorted by left edge, for a bisect sweep along x
+        self._sorted_left: List[pygame.Rect] = []
+        self._lefts: List[int] = []
+        self._max_tile_width = 0
 
     def set_tiles(self, tiles: List[pygame.Rect]) -> None:
         """
-        Set collision tiles.
+        Set collision tiles and rebuild the broad-phase grid.
+
+        Tiles are treated as static; call again after changing them.
 
         Args:
             tiles: List of tile rectangles for collision detection.
         """
         self.tile_rects = tiles
+        size = self.cell_size
+        cells: Dict[Tuple[int, int], List[pygame.Rect]] = {}
+        for tile in tiles:
+            for cx in range(tile.left // size, (tile.right - 1) // size + 1):
+                for cy in range(tile.top // size, (tile.bottom - 1) // size + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket is None:
+                        cells[(cx, cy)] = [tile]
+                    else:
+                        bucket.append(tile)
+        self._cell_rects = cells
+        self._mean_bucket = sum(map(len, cells.values())) / len(cells) if cells else 0.0
+
+        self._sorted_left = sorted(tiles, key=lambda tile: tile.left)
+        self._lefts = [tile.left for tile in self._sorted_left]
+        self._max_tile_width = max((tile.width for tile in tiles), default=0)
+
+    def _overlapping(self, hitbox: pygame.Rect) -> List[pygame.Rect]:
+        """
+        Find all tiles overlapping a hitbox.
+
+        The grid lookup (or, for hitboxes spanning several cells, a bisect
+        over tiles sorted by left edge) culls distant tiles; the exact
+        overlap tests run inside Rect.collidelistall rather than one
+        colliderect call per tile.
+
+        Args:
+            hitbox: Rectangle to test.
+
+        Returns:
+            Overlapping tiles. A tile spanning several of the queried cells
+            may be listed more than once; callers only take min/max edges.
+        """
+        size = self.cell_size
+        cells = self._cell_rects
+        x0 = hitbox.left // size
+        x1 = (hitbox.right - 1) // size
+        y0 = hitbox.top // size
+        y1 = (hitbox.bottom - 1) // size
+        if x0 == x1 and y0 == y1:
+            rects = cells.get((x0, y0))
+            if not rects:
+                return []
+        else:
+            # Tiles whose x-extent can reach the hitbox form one slice of
+            # the left-sorted list; use it when it is expected to be smaller
+            # than the grid cells' contents (sparse rows, tall hitboxes)
+            lefts = self._lefts
+            lo = bisect_right(lefts, hitbox.left - self._max_tile_width)
+            hi = bisect_left(lefts, hitbox.right)
+            if hi - lo <= (x1 - x0 + 1) * (y1 - y0 + 1) * self._mean_bucket:
+                rects = self._sorted_left[lo:hi]
+            else:
+                # Concatenate buckets as-is; deduplicating costs more than
+                # the occasional repeated overlap test
+                rects = []
+                for cx in range(x0, x1 + 1):
+                    for cy in range(y0, y1 + 1):
+                        bucket = cells.get((cx, cy))
+                        if bucket:
+                            rects += bucket
+
+        hits = hitbox.collidelistall(rects)
+        if not hits:
+            return []
+        return [rects[index] for index in hits]
 
     def resolve_collisions(
         self,
@@ -105,6 +249,9 @@ class CollisionManager:
         Resolve collisions with tiles.
 
         CRITICAL: Resolves horizontal before vertical for smooth movement.
+        On each axis the hitbox snaps once, to the nearest edge among the
+        overlapping tiles in the direction of motion, so it never ends up
+        pushed into a second tile.
 
         Args:
             hitbox: Entity's collision hitbox.
@@ -114,29 +261,33 @@ class CollisionManager:
         Returns:
             Updated hitbox rectangle.
         """
+        overlapping = self._overlapping
+
         # Horizontal movement
-        hitbox.x += int(velocity.x)
-        for tile in self.tile_rects:
-            if hitbox.colliderect(tile):
-                if velocity.x > 0:
-                    hitbox.right = tile.left
-                    physics.on_wall_right = True
-                elif velocity.x < 0:
-                    hitbox.left = tile.right
-                    physics.on_wall_left = True
-                velocity.x = 0
+        vx = velocity.x  # Read once; Vector2 attribute access goes through a descriptor
+        hitbox.x += int(vx)
+        hits = overlapping(hitbox)
+        if hits:
+            if vx > 0:
+                hitbox.right = min([tile.left for tile in hits])
+                physics.on_wall_right = True
+            elif vx < 0:
+                hitbox.left = max([tile.right for tile in hits])
+                physics.on_wall_left = True
+            velocity.x = 0
 
         # Vertical movement
-        hitbox.y += int(velocity.y)
-        for tile in self.tile_rects:
-            if hitbox.colliderect(tile):
-                if velocity.y > 0:
-                    hitbox.bottom = tile.top
-                    physics.on_ground = True
-                elif velocity.y < 0:
-                    hitbox.top = tile.bottom
-                    physics.on_ceiling = True
-                velocity.y = 0
+        vy = velocity.y  # Read once, as vx
+        hitbox.y += int(vy)
+        hits = overlapping(hitbox)
+        if hits:
+            if vy > 0:
+                hitbox.bottom = min([tile.top for tile in hits])
+                physics.on_ground = True
+            elif vy < 0:
+                hitbox.top = max([tile.bottom for tile in hits])
+                physics.on_ceiling = True
+            velocity.y = 0
 
         return hitbox
 
@@ -149,27 +300,88 @@ class CollisionManager:
         """
         Cast a ray and return first collision.
 
+        Walks the broad-phase grid cell by cell (Amanatides-Woo DDA) and
+        tests only the tiles in cells the ray actually crosses.
+
         Args:
             start: Starting position of the ray.
             direction: Direction vector of the ray.
             max_distance: Maximum distance to check.
 
         Returns:
-            Tuple of (hit_point, hit_rect) or None if no collision.
+            Tuple of (hit_point, hit_rect) where hit_point is where the ray
+            enters the tile, or None if no collision.
         """
-        if direction.length() == 0:
+        length = direction.length()
+        if length == 0:
             return None
 
-        step = direction.normalize() * RAYCAST_STEP_SIZE
-        current = pygame.math.Vector2(start)
-        distance = 0.0
+        x, y = start.x, start.y
+        dx = direction.x / length
+        dy = direction.y / length
+        size = self.cell_size
+        cx = int(x // size)
+        cy = int(y // size)
+
+        # Distance to the next cell boundary on each axis, and between boundaries
+        if dx > 0:
+            step_x, t_max_x, t_delta_x = 1, ((cx + 1) * size - x) / dx, size / dx
+        elif dx < 0:
+            step_x, t_max_x, t_delta_x = -1, (cx * size - x) / dx, -size / dx
+        else:
+            step_x, t_max_x, t_delta_x = 0, _INF, _INF
+        if dy > 0:
+            step_y, t_max_y, t_delta_y = 1, ((cy + 1) * size - y) / dy, size / dy
+        elif dy < 0:
+            step_y, t_max_y, t_delta_y = -1, (cy * size - y) / dy, -size / dy
+        else:
+            step_y, t_max_y, t_delta_y = 0, _INF, _INF
+
+        # Locals for names used on every visited cell
+        get_cell = self._cell_rects.get
+        ray_entry = _ray_entry
+        best_t = _INF
+        best_tile: Optional[pygame.Rect] = None
+
+        while True:
+            t_exit = t_max_x if t_max_x < t_max_y else t_max_y
+            rects = get_cell((cx, cy))
+            if rects:
+                for tile in rects:
+                    t = ray_entry(x, y, dx, dy, tile)
+                    if t is not None and t < best_t:
+                        best_t = t
+                        best_tile = tile
+            # A tile may span cells; its hit only counts once no unvisited
+            # cell could hold a nearer one
+            if best_t <= t_exit or t_exit > max_distance:
+                break
+            if t_max_x < t_max_y:
+                cx += step_x
+                t_max_x += t_delta_x
+            else:
+                cy += step_y
+                t_max_y += t_delta_y
+
+        if best_tile is None or best_t > max_distance:
+            return None
+        return pygame.math.Vector2(x + dx * best_t, y + dy * best_t), best_tile
 
-        while distance < max_distance:
-            point = pygame.Rect(int(current.x), int(current.y), 1, 1)
-            for tile in self.tile_rects:
-                if point.colliderect(tile):
-                    return current, tile
-            current += step
-            distance += RAYCAST_STEP_SIZE
+    def iter_visible(self, view_rect: pygame.Rect) -> Iterator[pygame.Rect]:
+        """
+        Iterate over the tiles overlapping a view rectangle.
 
-        return None
+        Uses the left-sorted sweep rather than the grid, since a screen-sized
+        view spans hundreds of cells; each tile is yielded once.
+
+        Args:
+            view_rect: Visible area in world coordinates.
+
+        Returns:
+            Iterator over overlapping tiles, in left-edge order.
+        """
+        lefts = self._lefts
+        lo = bisect_right(lefts, view_rect.left - self._max_tile_width)
+        hi = bisect_left(lefts, view_rect.right)
+        candidates = self._sorted_left[lo:hi]
+        return map(candidates.__getitem__, view_rect.collidelistall(candidates))
@@ -5,7 +5,9 @@ Handles combat interactions between player and enemies.
 """
 
 import logging
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from src.core.settings import ENEMY_ATTACK_REACH
 
 if TYPE_CHECKING:
     from src.entities.entity import Entity
@@ -24,15 +26,24 @@ class CombatManager:
     Tracks player and enemy references, checking for attack
     collisions and applying damage appropriately.
 
+    Enemies are kept as keys of an insertion-ordered dict, so removal is
+    O(1) while iteration still follows the order they were added.
+
     Attributes:
         player: Reference to player entity.
-        enemies: List of enemy entities.
     """
 
+    __slots__ = ("player", "_enemies")
+
     def __init__(self) -> None:
         """Initialize combat manager."""
         self.player: Optional["Player"] = None
-        self.enemies: List["Entity"] = []
+        self._enemies: Dict["Entity", None] = {}
+
+    @property
+    def enemies(self) -> List["Entity"]:
+        """Snapshot list of tracked enemies, in insertion order."""
+        return list(self._enemies)
 
     def set_player(self, player: "Player") -> None:
         """
@@ -51,8 +62,8 @@ class CombatManager:
         Args:
             enemy: Enemy entity to track.
         """
-        self.enemies.append(enemy)
-        logger.debug("Combat manager: enemy added, total enemies: %d", len(self.enemies))
+        self._enemies[enemy] = None
+        logger.debug("Combat manager: enemy added, total enemies: %d", len(self._enemies))
 
     def remove_enemy(self, enemy: "Entity") -> None:
         """
@@ -61,13 +72,13 @@ class CombatManager:
         Args:
             enemy: Enemy entity to remove.
         """
-        if enemy in self.enemies:
-            self.enemies.remove(enemy)
-            logger.debug("Combat manager: enemy removed, total enemies: %d", len(self.enemies))
+        if enemy in self._enemies:
+            del self._enemies[enemy]
+            logger.debug("Combat manager: enemy removed, total enemies: %d", len(self._enemies))
 
     def clear_enemies(self) -> None:
         """Remove all enemies from combat system."""
-        self.enemies.clear()
+        self._enemies.clear()
         logger.debug("Combat manager: all enemies cleared")
 
     def update(self) -> None:
@@ -88,22 +99,35 @@ class CombatManager:
         if not hitbox:
             return
 
-        for enemy in self.enemies:
-            if enemy in state.hit_targets:  # type: ignore[attr-defined]
+        # One batched overlap test in C; only the hits are visited in Python
+        enemies = list(self._enemies)
+        hits = hitbox.collidelistall([enemy.hitbox for enemy in enemies])
+        if not hits:
+            return
+
+        # An int compare per hit instead of a set lookup
+        generation = state.attack_generation  # type: ignore[attr-defined]
+        for index in hits:
+            enemy = enemies[index]
+            if enemy.last_hit_generation == generation:
                 continue
 
-            if hitbox.colliderect(enemy.hitbox):
-                damage = state.get_damage()  # type: ignore[attr-defined]
-                enemy.take_damage(damage)
-                state.hit_targets.add(enemy)  # type: ignore[attr-defined]
-                logger.debug("Player hit enemy for %d damage", damage)
+            damage = state.get_damage()  # type: ignore[attr-defined]
+            enemy.take_damage(damage)
+            enemy.last_hit_generation = generation
+            logger.debug("Player hit enemy for %d damage", damage)
 
     def _check_enemy_attacks(self) -> None:
         """Check if enemy attacks hit player."""
         if not self.player or self.player.invulnerable:
             return
 
-        for enemy in self.enemies:
+        # Only enemies within attack reach of the player can hit it; find
+        # them with one batched overlap test before any per-enemy calls
+        enemies = list(self._enemies)
+        reach = self.player.hitbox.inflate(2 * ENEMY_ATTACK_REACH, 2 * ENEMY_ATTACK_REACH)
+        for index in reach.collidelistall([enemy.hitbox for enemy in enemies]):
+            enemy = enemies[index]
             if hasattr(enemy, "get_attack_hitbox"):
                 hitbox = enemy.get_attack_hitbox()
                 if hitbox and hitbox.colliderect(self.player.hitbox):
@@ -5,10 +5,14 @@ Abstracts keyboard and gamepad input into actions.
 """
 
 import logging
-from typing import Dict, List, Set
+from collections import deque
+from itertools import compress
+from typing import Deque, Dict, List, Sequence, Tuple
 
 import pygame
 
+from src.core.settings import INPUT_EVENT_QUEUE_SIZE
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +25,23 @@ DEFAULT_BINDINGS: Dict[str, List[int]] = {
     "pause": [pygame.K_ESCAPE],
 }
 
+# One bit per action so a whole frame of input fits in a single int
+MOVE_LEFT_BIT = 1 << 0
+MOVE_RIGHT_BIT = 1 << 1
+JUMP_BIT = 1 << 2
+ATTACK_BIT = 1 << 3
+DASH_BIT = 1 << 4
+PAUSE_BIT = 1 << 5
+
+ACTION_BITS: Dict[str, int] = {
+    "move_left": MOVE_LEFT_BIT,
+    "move_right": MOVE_RIGHT_BIT,
+    "jump": JUMP_BIT,
+    "attack": ATTACK_BIT,
+    "dash": DASH_BIT,
+    "pause": PAUSE_BIT,
+}
+
 
 class InputHandler:
     """
@@ -28,70 +49,138 @@ class InputHandler:
 
     Attributes:
         bindings: Mapping of action names to key codes.
+        just_pressed_mask: Bitmask (see ACTION_BITS) of actions pressed
+            this frame, recomputed on every update.
     """
 
+    __slots__ = (
+        "bindings",
+        "_pressed_mask",
+        "just_pressed_mask",
+        "_just_released_mask",
+        "_key_bits",
+        "_poll_keys",
+        "_poll_bits",
+        "_event_queue",
+    )
+
     def __init__(self) -> None:
         """Initialize input handler with default bindings."""
         self.bindings: Dict[str, List[int]] = DEFAULT_BINDINGS.copy()
-        self._pressed: Set[str] = set()
-        self._just_pressed: Set[str] = set()
-        self._just_released: Set[str] = set()
+        self._pressed_mask = 0
+        self.just_pressed_mask = 0
+        self._just_released_mask = 0
+        self._key_bits: Dict[int, int] = {}
+        # Bound key codes and their action bits, aligned, polled by update()
+        self._poll_keys: Tuple[int, ...] = ()
+        self._poll_bits: Tuple[int, ...] = ()
+        self._event_queue: Deque[int] = deque(maxlen=INPUT_EVENT_QUEUE_SIZE)
+        self._build_key_bits()
+
+    def _build_key_bits(self) -> None:
+        """Rebuild the key code -> action bit lookups from bindings."""
+        self._key_bits.clear()
+        for action, key_list in self.bindings.items():
+            bit = ACTION_BITS.get(action, 0)
+            for key in key_list:
+                self._key_bits[key] = self._key_bits.get(key, 0) | bit
+        self._poll_keys = tuple(self._key_bits)
+        self._poll_bits = tuple(self._key_bits.values())
 
-    def update(self) -> None:
-        """Update input state from pygame events."""
-        self._just_pressed.clear()
-        self._just_released.clear()
+    def rebind(self, action: str, keys: Sequence[int]) -> None:
+        """
+        Replace the keys bound to an action.
+
+        Args:
+            action: Action name (e.g. "jump").
+            keys: Key codes that trigger the action.
+        """
+        self.bindings[action] = list(keys)
+        self._build_key_bits()
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """
+        Queue key-down events so taps shorter than a frame are not lost.
 
+        Args:
+            event: Pygame event to process.
+        """
+        if event.type == pygame.KEYDOWN:
+            bit = self._key_bits.get(event.key, 0)
+            if bit:
+                self._event_queue.append(bit)
+
+    def update(self) -> None:
+        """Update input state from held keys and queued key-down events."""
         keys = pygame.key.get_pressed()
 
-        for action, key_list in self.bindings.items():
-            is_pressed = any(keys[k] for k in key_list)
+        # Key lookups run inside map/compress; Python only sees held keys
+        pressed = 0
+        for bit in compress(self._poll_bits, map(keys.__getitem__, self._poll_keys)):
+            pressed |= bit
 
-            if is_pressed and action not in self._pressed:
-                self._just_pressed.add(action)
-            elif not is_pressed and action in self._pressed:
-                self._just_released.add(action)
+        # Drain taps seen since the last update, even if already released
+        queued = 0
+        queue = self._event_queue
+        while queue:
+            queued |= queue.popleft()
 
-            if is_pressed:
-                self._pressed.add(action)
-            else:
-                self._pressed.discard(action)
+        previous = self._pressed_mask
+        self.just_pressed_mask = (pressed & ~previous) | queued
+        self._just_released_mask = previous & ~pressed
+        self._pressed_mask = pressed
 
-    def is_action_pressed(self, action: str) -> bool:
+    def is_action_pressed(self, action_bit: int) -> bool:
         """
         Check if action is currently pressed.
 
         Args:
-            action: Action name to check.
+            action_bit: Action bit to check (e.g. JUMP_BIT).
 
         Returns:
             True if action is pressed, False otherwise.
         """
-        return action in self._pressed
+        return bool(self._pressed_mask & action_bit)
 
-    def is_action_just_pressed(self, action: str) -> bool:
+    def is_action_just_pressed(self, action_bit: int) -> bool:
         """
         Check if action was just pressed this frame.
 
         Args:
-            action: Action name to check.
+            action_bit: Action bit to check (e.g. JUMP_BIT).
 
         Returns:
             True if action was just pressed, False otherwise.
         """
-        return action in self._just_pressed
+        return bool(self.just_pressed_mask & action_bit)
+
+    def consume_just_pressed(self, action_bit: int) -> bool:
+        """
+        Check and clear a just-pressed action so it fires only once.
+
+        Args:
+            action_bit: Action bit to check (e.g. JUMP_BIT).
+
+        Returns:
+            True if the action was pressed since the last update.
+        """
+        mask = self.just_pressed_mask
+        if mask & action_bit:
+            self.just_pressed_mask = mask & ~action_bit
+            return True
+        return False
 
-    def is_action_just_released(self, action: str) -> bool:
+    def is_action_just_released(self, action_bit: int) -> bool:
         """
         Check if action was just released this frame.
 
         Args:
-            action: Action name to check.
+            action_bit: Action bit to check (e.g. JUMP_BIT).
 
         Returns:
             True if action was just released, False otherwise.
         """
-        return action in self._just_released
+        return bool(self._just_released_mask & action_bit)
 
     def get_horizontal_axis(self) -> int:
         """
@@ -100,12 +189,12 @@ class InputHandler:
         Returns:
             -1 for left, 1 for right, 0 for no input.
         """
-        left = self.is_action_pressed("move_left")
-        right = self.is_action_pressed("move_right")
-        return (-1 if left else 0) + (1 if right else 0)
+        mask = self._pressed_mask
+        return (1 if mask & MOVE_RIGHT_BIT else 0) - (1 if mask & MOVE_LEFT_BIT else 0)
 
     def reset(self) -> None:
         """Reset all input state."""
-        self._pressed.clear()
-        self._just_pressed.clear()
-        self._just_released.clear()
+        self._pressed_mask = 0
+        self.just_pressed_mask = 0
+        self._just_released_mask = 0
+        self._event_queue.clear()
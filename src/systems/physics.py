@@ -24,10 +24,23 @@ class PhysicsBody:
         on_ground: Whether touching ground.
         on_wall_left: Whether touching wall on left.
         on_wall_right: Whether touching wall on right.
+        on_wall: Whether touching a wall on either side (kept in sync).
         on_ceiling: Whether touching ceiling.
         gravity_enabled: Whether gravity applies.
     """
 
+    __slots__ = (
+        "velocity",
+        "gravity",
+        "max_fall_speed",
+        "on_ground",
+        "_on_wall_left",
+        "_on_wall_right",
+        "on_wall",
+        "on_ceiling",
+        "gravity_enabled",
+    )
+
     def __init__(
         self,
         gravity: float = GRAVITY,
@@ -44,11 +57,54 @@ class PhysicsBody:
         self.gravity = gravity
         self.max_fall_speed = max_fall_speed
         self.on_ground = False
-        self.on_wall_left = False
-        self.on_wall_right = False
+        self._on_wall_left = False
+        self._on_wall_right = False
+        self.on_wall = False
         self.on_ceiling = False
         self.gravity_enabled = True
 
+    @property
+    def on_wall_left(self) -> bool:
+        """Whether touching a wall on the left."""
+        return self._on_wall_left
+
+    @on_wall_left.setter
+    def on_wall_left(self, value: bool) -> None:
+        self._on_wall_left = value
+        self.on_wall = value or self._on_wall_right
+
+    @property
+    def on_wall_right(self) -> bool:
+        """Whether touching a wall on the right."""
+        return self._on_wall_right
+
+    @on_wall_right.setter
+    def on_wall_right(self, value: bool) -> None:
+        self._on_wall_right = value
+        self.on_wall = value or self._on_wall_left
+
+    def step(self, dt: float, friction: float = 0.0) -> None:
+        """
+        Apply gravity and ground friction in one call.
+
+        Same result as apply_gravity() followed by apply_friction(), which
+        are kept for callers that need only one; entities call this once
+        per frame to save the second method call.
+
+        Args:
+            dt: Delta time in seconds.
+            friction: Friction coefficient; 0 skips friction entirely.
+        """
+        k = dt * FPS
+        velocity = self.velocity
+        if self.on_ground:
+            if friction:
+                vx = velocity.x * (1 - friction * k)
+                velocity.x = 0 if abs(vx) < FRICTION_STOP_THRESHOLD else vx
+        elif self.gravity_enabled:
+            vy = velocity.y + self.gravity * k
+            velocity.y = vy if vy < self.max_fall_speed else self.max_fall_speed
+
     def apply_gravity(self, dt: float) -> None:
         """
         Apply gravity to velocity.
@@ -77,6 +133,7 @@ class PhysicsBody:
     def reset_collision_flags(self) -> None:
         """Reset all collision flags."""
         self.on_ground = False
-        self.on_wall_left = False
-        self.on_wall_right = False
+        self._on_wall_left = False
+        self._on_wall_right = False
+        self.on_wall = False
         self.on_ceiling = False
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import os
 from pathlib import Path
 
 import pygame
@@ -12,7 +13,68 @@ logger = logging.getLogger(__name__)
 
 
 class SpriteLoader:
-    """Utility for loading sprite sheets and creating animations."""
+    """
+    Utility for loading sprite sheets and creating animations.
+
+    Decoded sheets and parsed configs are memoized at class level, so
+    entities sharing a sheet only pay for the PNG decode once.
+    """
+
+    # Image path -> converted sheet; frames are subsurfaces of these
+    _sheet_cache: dict[str, pygame.Surface] = {}
+    # Config path -> (file mtime, parsed JSON); a newer mtime forces a re-read
+    _config_cache: dict[str, tuple[float, dict]] = {}
+
+    @classmethod
+    def _load_sheet(cls, image_path: str) -> pygame.Surface:
+        """
+        Load and convert a sprite sheet, reusing an earlier decode.
+
+        Args:
+            image_path: Path to the sprite sheet image
+
+        Returns:
+            The converted sheet surface (shared; do not draw onto it)
+
+        Raises:
+            pygame.error: If the image cannot be loaded or converted.
+        """
+        sheet = cls._sheet_cache.get(image_path)
+        if sheet is None:
+            sheet = pygame.image.load(image_path).convert_alpha()
+            cls._sheet_cache[image_path] = sheet
+        return sheet
+
+    @classmethod
+    def _load_config(cls, config_path: str) -> dict:
+        """
+        Parse a JSON config, reusing the last parse while the file is unchanged.
+
+        Args:
+            config_path: Path to the JSON configuration file
+
+        Returns:
+            Parsed configuration (shared; do not mutate)
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            json.JSONDecodeError: If the file is not valid JSON.
+        """
+        mtime = os.path.getmtime(config_path)
+        cached = cls._config_cache.get(config_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(config_path, "r") as f:
+            config: dict = json.load(f)
+        cls._config_cache[config_path] = (mtime, config)
+        return config
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all memoized sheets and configs."""
+        cls._sheet_cache.clear()
+        cls._config_cache.clear()
 
     @staticmethod
     def load_sprite_sheet(
@@ -20,27 +82,42 @@ class SpriteLoader:
         frame_width: int,
         frame_height: int,
         frame_count: int,
+        copy_frames: bool = False,
     ) -> list[pygame.Surface]:
         """
         Load a sprite sheet and split it into individual frames.
 
+        Frames are subsurfaces sharing pixel memory with the sheet, so
+        splitting allocates no pixel data and does no blits. Drawing onto
+        such a frame would draw onto the sheet; pass copy_frames=True to
+        get independent surfaces instead.
+
         Args:
             image_path: Path to the sprite sheet image
             frame_width: Width of each frame in pixels
             frame_height: Height of each frame in pixels
             frame_count: Number of frames in the sprite sheet
+            copy_frames: Return standalone copies rather than views
 
         Returns:
             List of pygame.Surface objects, one per frame
         """
         try:
-            sprite_sheet = pygame.image.load(image_path).convert_alpha()
+            sprite_sheet = SpriteLoader._load_sheet(image_path)
+            sheet_rect = sprite_sheet.get_rect()
             frames = []
 
             for i in range(frame_count):
-                x = i * frame_width
-                frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                frame.blit(sprite_sheet, (0, 0), (x, 0, frame_width, frame_height))
+                area = pygame.Rect(i * frame_width, 0, frame_width, frame_height)
+                if sheet_rect.contains(area):
+                    # Subsurfaces hold a reference to the sheet, keeping it alive
+                    frame = sprite_sheet.subsurface(area)
+                    if copy_frames:
+                        frame = frame.copy()
+                else:
+                    # Sheet smaller than declared: clip onto a transparent frame
+                    frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
+                    frame.blit(sprite_sheet, (0, 0), area)
                 frames.append(frame)
 
             logger.debug(
@@ -68,8 +145,7 @@ class SpriteLoader:
             Dictionary mapping animation names to Animation objects
         """
         try:
-            with open(config_path, "r") as f:
-                config = json.load(f)
+            config = SpriteLoader._load_config(config_path)
 
             animations = {}
             frame_height = config["frame_height"]
@@ -78,10 +154,9 @@ class SpriteLoader:
             for anim_name, anim_data in config["animations"].items():
                 image_path = str(sprite_path / anim_data["file"])
 
-                # Load the image to get its width
+                # Load the image to get its width; load_sprite_sheet reuses it
                 try:
-                    sprite_sheet = pygame.image.load(image_path)
-                    sheet_width = sprite_sheet.get_width()
+                    sheet_width = SpriteLoader._load_sheet(image_path).get_width()
                     frame_count = anim_data["frames"]
 
                     # Calculate frame width based on total width and frame count
@@ -146,5 +221,6 @@ class SpriteLoader:
                 frames=flipped_frames,
                 frame_duration=animation.frame_duration,
                 loop=animation.loop,
+                precompute_flip=False,
             )
         return flipped
@@ -0,0 +1,115 @@
+"""
+Scheduled callbacks for event-driven timeouts.
+
+Instead of every stunned or dying entity counting its own timer down each
+frame, the timeout is pushed onto a heap once and fired when it expires.
+"""
+
+import heapq
+import itertools
+from typing import Callable, List, Optional, Tuple
+
+
+class Timer:
+    """
+    Handle for a scheduled callback.
+
+    Attributes:
+        fire_at: TimerSystem clock time at which the callback runs.
+        callback: Function invoked on expiry, or None once cancelled/fired.
+    """
+
+    __slots__ = ("fire_at", "callback")
+
+    def __init__(self, fire_at: float, callback: Callable[[], None]) -> None:
+        """
+        Initialize a timer handle.
+
+        Args:
+            fire_at: Clock time at which to fire.
+            callback: Function to call on expiry.
+        """
+        self.fire_at = fire_at
+        self.callback: Optional[Callable[[], None]] = callback
+
+    @property
+    def active(self) -> bool:
+        """Check if the timer is still pending."""
+        return self.callback is not None
+
+
+class TimerSystem:
+    """
+    Min-heap of pending callbacks ordered by expiry time.
+
+    Advanced once per frame with update(); the per-frame cost is a single
+    heap peek when nothing expires, regardless of how many timers are pending.
+
+    Attributes:
+        now: Elapsed clock time in seconds.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty timer system."""
+        self.now = 0.0
+        self._heap: List[Tuple[float, int, Timer]] = []
+        self._sequence = itertools.count()
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> Timer:
+        """
+        Run a callback after a delay.
+
+        Args:
+            delay: Seconds from now until the callback fires.
+            callback: Function to call on expiry.
+
+        Returns:
+            Handle that can be passed to cancel().
+        """
+        timer = Timer(self.now + delay, callback)
+        heapq.heappush(self._heap, (timer.fire_at, next(self._sequence), timer))
+        return timer
+
+    def cancel(self, timer: Timer) -> None:
+        """
+        Cancel a pending timer.
+
+        The heap entry is discarded lazily when it reaches the top.
+
+        Args:
+            timer: Handle returned by schedule().
+        """
+        timer.callback = None
+
+    def update(self, dt: float) -> int:
+        """
+        Advance the clock and fire every expired timer.
+
+        Args:
+            dt: Delta time in seconds.
+
+        Returns:
+            Number of callbacks fired.
+        """
+        self.now += dt
+        heap = self._heap
+        now = self.now
+        fired = 0
+        while heap and heap[0][0] <= now:
+            timer = heapq.heappop(heap)[2]
+            callback = timer.callback
+            if callback is not None:
+                timer.callback = None
+                callback()
+                fired += 1
+        return fired
+
+    def clear(self) -> None:
+        """Drop all pending timers without firing them."""
+        for _, _, timer in self._heap:
+            timer.callback = None
+        self._heap.clear()
+
+    def __len__(self) -> int:
+        """Return the number of heap entries, including cancelled ones."""
+        return len(self._heap)
@@ -5,7 +5,7 @@ Displays player health, score, and time during gameplay.
 """
 
 import logging
-from typing import Dict, Any
+from typing import Any, Dict, Tuple
 
 import pygame
 
@@ -27,6 +27,19 @@ class HUD:
         health_bar_height: Height of health bar.
     """
 
+    __slots__ = (
+        "font",
+        "health_bar_width",
+        "health_bar_height",
+        "health_bar_x",
+        "health_bar_y",
+        "_chrome",
+        "_chrome_pos",
+        "_text_cache",
+        "_glyphs",
+        "_use_glyphs",
+    )
+
     def __init__(self) -> None:
         """Initialize HUD."""
         # Load font
@@ -39,8 +52,102 @@ class HUD:
         self.health_bar_x = 20
         self.health_bar_y = 20
 
+        # Border and black backing never change, so they are drawn once here
+        self._chrome = self._build_chrome()
+        self._chrome_pos = (self.health_bar_x - 2, self.health_bar_y - 2)
+
+        # slot -> (text, rendered surface, blit position); rendering only
+        # happens when a slot's text differs from last frame
+        self._text_cache: Dict[str, Tuple[str, pygame.Surface, Tuple[int, int]]] = {}
+
+        # Pre-rendered glyphs, so a changed value is assembled by blitting
+        # instead of rasterizing the whole string again
+        self._glyphs: Dict[str, pygame.Surface] = {
+            char: self.font.render(char, True, WHITE) for char in set("0123456789:/-Score: Time")
+        }
+        # Only exact when glyph advances simply add up (fixed width, no
+        # kerning), as with the pixel font; other fonts render whole strings
+        sample = "Score: 0123"
+        self._use_glyphs = self.font.size(sample)[0] == sum(
+            self._glyphs[char].get_width() for char in sample
+        )
+
         logger.info("HUD initialized")
 
+    def _build_chrome(self) -> pygame.Surface:
+        """
+        Pre-render the static health bar border and background.
+
+        Returns:
+            Surface covering the bar plus its 2px border.
+        """
+        chrome = pygame.Surface((self.health_bar_width + 4, self.health_bar_height + 4))
+        chrome.fill(BLACK)
+        pygame.draw.rect(chrome, WHITE, chrome.get_rect(), 2)
+        return chrome
+
+    def _compose(self, text: str) -> pygame.Surface:
+        """
+        Build a text surface from cached glyphs.
+
+        Characters without a glyph yet are rendered once and kept.
+
+        Args:
+            text: Text to draw.
+
+        Returns:
+            Surface matching font.render(text, True, WHITE).
+        """
+        glyphs = self._glyphs
+        parts = []
+        for char in text:
+            glyph = glyphs.get(char)
+            if glyph is None:
+                glyph = glyphs[char] = self.font.render(char, True, WHITE)
+            parts.append(glyph)
+
+        width = sum(glyph.get_width() for glyph in parts)
+        height = max(glyph.get_height() for glyph in parts)
+        text_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        x = 0
+        for glyph in parts:
+            text_surface.blit(glyph, (x, 0))
+            x += glyph.get_width()
+        return text_surface
+
+    def _text(self, slot: str, text: str) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """
+        Get the rendered surface and position for a HUD text slot.
+
+        Args:
+            slot: Text slot ("health", "score" or "time").
+            text: Text to display.
+
+        Returns:
+            Tuple of (text surface, topleft blit position).
+        """
+        cached = self._text_cache.get(slot)
+        if cached is not None and cached[0] == text:
+            return cached[1], cached[2]
+
+        if self._use_glyphs and text:
+            text_surface = self._compose(text)
+        else:
+            text_surface = self.font.render(text, True, WHITE)
+        if slot == "health":
+            pos = text_surface.get_rect(
+                midleft=(
+                    self.health_bar_x + self.health_bar_width + 20,
+                    self.health_bar_y + self.health_bar_height // 2,
+                )
+            ).topleft
+        elif slot == "score":
+            pos = (self.health_bar_x, self.health_bar_y + self.health_bar_height + 20)
+        else:
+            pos = (self.health_bar_x, self.health_bar_y + self.health_bar_height + 60)
+        self._text_cache[slot] = (text, text_surface, pos)
+        return text_surface, pos
+
     def update(self, player_data: Dict[str, Any]) -> None:
         """
         Update HUD with new player data.
@@ -89,44 +196,16 @@ class HUD:
         health_percentage = max(0, min(1, health / max_health if max_health > 0 else 0))
         current_width = int(self.health_bar_width * health_percentage)
 
-        # Draw background (border)
-        border_rect = pygame.Rect(
-            self.health_bar_x - 2,
-            self.health_bar_y - 2,
-            self.health_bar_width + 4,
-            self.health_bar_height + 4,
-        )
-        pygame.draw.rect(surface, WHITE, border_rect, 2)
-
-        # Draw black background
-        bg_rect = pygame.Rect(
-            self.health_bar_x,
-            self.health_bar_y,
-            self.health_bar_width,
-            self.health_bar_height,
-        )
-        pygame.draw.rect(surface, BLACK, bg_rect)
+        surface.blit(self._chrome, self._chrome_pos)
 
-        # Draw red health fill
+        # Red health fill; a plain rect fill skips draw.rect's shape handling
         if current_width > 0:
-            health_rect = pygame.Rect(
-                self.health_bar_x,
-                self.health_bar_y,
-                current_width,
-                self.health_bar_height,
+            surface.fill(
+                RED,
+                (self.health_bar_x, self.health_bar_y, current_width, self.health_bar_height),
             )
-            pygame.draw.rect(surface, RED, health_rect)
-
-        # Render health text
-        health_text = f"{health}/{max_health}"
-        text_surface = self.font.render(health_text, True, WHITE)
-        text_rect = text_surface.get_rect(
-            midleft=(
-                self.health_bar_x + self.health_bar_width + 20,
-                self.health_bar_y + self.health_bar_height // 2,
-            )
-        )
-        surface.blit(text_surface, text_rect)
+
+        surface.blit(*self._text("health", f"{health}/{max_health}"))
 
     def _render_score(self, surface: pygame.Surface, score: int) -> None:
         """
@@ -136,12 +215,7 @@ class HUD:
             surface: Surface to render on.
             score: Current score value.
         """
-        score_text = f"Score: {score:04d}"
-        text_surface = self.font.render(score_text, True, WHITE)
-        text_rect = text_surface.get_rect(
-            topleft=(self.health_bar_x, self.health_bar_y + self.health_bar_height + 20)
-        )
-        surface.blit(text_surface, text_rect)
+        surface.blit(*self._text("score", f"Score: {score:04d}"))
 
     def _render_timer(self, surface: pygame.Surface, time_seconds: float) -> None:
         """
@@ -154,10 +228,4 @@ class HUD:
         # Convert to MM:SS format
         minutes = int(time_seconds // 60)
         seconds = int(time_seconds % 60)
-        time_text = f"Time: {minutes:02d}:{seconds:02d}"
-
-        text_surface = self.font.render(time_text, True, WHITE)
-        text_rect = text_surface.get_rect(
-            topleft=(self.health_bar_x, self.health_bar_y + self.health_bar_height + 60)
-        )
-        surface.blit(text_surface, text_rect)
+        surface.blit(*self._text("time", f"Time: {minutes:02d}:{seconds:02d}"))
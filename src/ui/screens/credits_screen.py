@@ -63,6 +63,9 @@ class CreditsScreen(BaseScreen):
             "and contributors",
         ]
 
+        # Background and credit lines never change, so they are drawn once
+        self._static_surface = self._render_static()
+
         # Create back button
         button_width = 200
         button_height = 50
@@ -76,6 +79,37 @@ class CreditsScreen(BaseScreen):
 
         logger.info("CreditsScreen initialized")
 
+    def _render_static(self) -> pygame.Surface:
+        """
+        Pre-render the background and credit lines.
+
+        Returns:
+            Opaque full-screen surface with the credits drawn on black.
+        """
+        static = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        static.fill(BLACK)
+
+        start_y = 100
+        line_height = 40
+
+        for i, line in enumerate(self.credits):
+            y_pos = start_y + i * line_height
+
+            # Use different fonts for different lines
+            if i == 0:  # Title
+                text_surface = self.title_font.render(line, True, WHITE)
+            elif line in ["Developed by:", "Special Thanks:"]:  # Headers
+                text_surface = self.text_font.render(line, True, WHITE)
+            elif line:  # Regular text
+                text_surface = self.small_font.render(line, True, WHITE)
+            else:  # Empty line
+                continue
+
+            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
+            static.blit(text_surface, text_rect)
+
+        return static
+
     def _on_back_clicked(self) -> None:
         """Handle Back button click."""
         logger.info("Back button clicked from credits")
@@ -100,28 +134,8 @@ class CreditsScreen(BaseScreen):
         Args:
             surface: Surface to render on.
         """
-        # Fill background
-        surface.fill(BLACK)
-
-        # Render credits
-        start_y = 100
-        line_height = 40
-
-        for i, line in enumerate(self.credits):
-            y_pos = start_y + i * line_height
-
-            # Use different fonts for different lines
-            if i == 0:  # Title
-                text_surface = self.title_font.render(line, True, WHITE)
-            elif line in ["Developed by:", "Special Thanks:"]:  # Headers
-                text_surface = self.text_font.render(line, True, WHITE)
-            elif line:  # Regular text
-                text_surface = self.small_font.render(line, True, WHITE)
-            else:  # Empty line
-                continue
-
-            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-            surface.blit(text_surface, text_rect)
+        # Background and credits in one blit
+        surface.blit(self._static_surface, (0, 0))
 
         # Render back button
         self.back_button.render(surface)
@@ -13,13 +13,15 @@ from typing import TYPE_CHECKING, List
 
 import pygame
 
-from src.core.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.core.settings import GAMEPLAY_SFX, SCREEN_WIDTH, SCREEN_HEIGHT
 from src.ui.screens.base_screen import BaseScreen
 from src.ui.hud import HUD
 from src.entities.player import Player
 from src.entities.enemy import Enemy
 from src.levels.level_manager import LevelManager
+from src.states.attack_state import AttackState
 from src.systems.collision import CollisionManager
+from src.systems.timers import TimerSystem
 
 if TYPE_CHECKING:
     from src.core.game import Game
@@ -57,8 +59,9 @@ class GameScreen(BaseScreen):
         """
         super().__init__(game)
 
-        # Start gameplay music
+        # Start gameplay music and decode combat/movement SFX up front
         self.game.audio_manager.play_music("gameplay", loop=True)
+        self.game.audio_manager.preload_sfx(GAMEPLAY_SFX)
 
         # Initialize HUD
         self.hud = HUD()
@@ -81,6 +84,9 @@ class GameScreen(BaseScreen):
         # Initialize player
         self.player = Player(spawn_pos)
 
+        # Scheduled hurt/death timeouts, fired once per frame before enemies update
+        self.timers = TimerSystem()
+
         # Initialize enemies
         self.enemies: List[Enemy] = []
         if self.level_manager.current_level:
@@ -88,6 +94,7 @@ class GameScreen(BaseScreen):
             for spawn in enemy_spawns:
                 enemy = Enemy(spawn)
                 enemy.target = self.player  # Set player as target for AI
+                enemy.set_timer_system(self.timers)
                 self.enemies.append(enemy)
             logger.info("Spawned %d enemies", len(self.enemies))
 
@@ -140,9 +147,16 @@ class GameScreen(BaseScreen):
         self.player.pos.y = self.player.hitbox.y
         self.player.rect.topleft = (int(self.player.pos.x), int(self.player.pos.y))
 
-        # Update enemies
+        # Fire expired hurt/death timeouts
+        self.timers.update(dt)
+
+        # AI pass for every enemy before any of them move
+        for enemy in self.enemies:
+            enemy.update_ai(dt)
+
+        # Move enemies
         for enemy in self.enemies:
-            enemy.update(dt)
+            enemy.update_body(dt)
 
             # Reset collision flags before checking collisions
             enemy.physics.reset_collision_flags()
@@ -158,11 +172,14 @@ class GameScreen(BaseScreen):
             enemy.pos.y = enemy.hitbox.y
             enemy.rect.topleft = (int(enemy.pos.x), int(enemy.pos.y))
 
+        # Hitboxes are final for this frame; both overlap passes share one list
+        hitboxes = [enemy.hitbox for enemy in self.enemies]
+
         # Check enemy-player collisions for damage
-        self._check_enemy_collisions()
+        self._check_enemy_collisions(hitboxes)
         
         # Check player attack hitting enemies
-        self._check_attack_collisions()
+        self._check_attack_collisions(hitboxes)
 
         # Update camera to follow player
         self._update_camera()
@@ -184,9 +201,10 @@ class GameScreen(BaseScreen):
         if self.level_manager.current_level:
             self.level_manager.current_level.render(surface, self.camera_offset)
 
-        # Render enemies with camera offset
-        for enemy in self.enemies:
-            enemy.render(surface, self.camera_offset)
+        # Render enemies with camera offset in one batched call
+        offset = self.camera_offset
+        pairs = [enemy.get_blit_pair(offset) for enemy in self.enemies]
+        surface.blits([pair for pair in pairs if pair is not None], doreturn=False)
 
         # Render player with camera offset
         self.player.render(surface, self.camera_offset)
@@ -198,48 +216,60 @@ class GameScreen(BaseScreen):
         # Render HUD on top
         self.hud.render(surface, self._get_player_data())
 
-    def _check_enemy_collisions(self) -> None:
-        """Check for collisions between player and enemies for damage."""
-        for enemy in self.enemies:
+    def _check_enemy_collisions(self, hitboxes: List[pygame.Rect]) -> None:
+        """
+        Check for collisions between player and enemies for damage.
+
+        Args:
+            hitboxes: Enemy hitboxes, index-aligned with self.enemies.
+        """
+        # One batched overlap test in C; only the hits are visited in Python
+        enemies = self.enemies
+        for index in self.player.hitbox.collidelistall(hitboxes):
+            enemy = enemies[index]
             # Skip dead enemies
             if enemy.is_dead():
                 continue
 
-            # Check if player hitbox overlaps with enemy hitbox
-            if self.player.hitbox.colliderect(enemy.hitbox):
-                # Enemy damages player
-                damage = enemy.get_damage()
-                self.player.take_damage(damage)
-                logger.debug("Player hit by enemy, took %d damage", damage)
+            # Enemy damages player
+            damage = enemy.get_damage()
+            self.player.take_damage(damage)
+            logger.debug("Player hit by enemy, took %d damage", damage)
 
-    def _check_attack_collisions(self) -> None:
-        """Check if player attacks hit enemies."""
+    def _check_attack_collisions(self, hitboxes: List[pygame.Rect]) -> None:
+        """
+        Check if player attacks hit enemies.
+
+        Args:
+            hitboxes: Enemy hitboxes, index-aligned with self.enemies.
+        """
         # Only check if player is in attack state
         if self.player.get_current_state_name() != "attack":
             return
         
         # Get attack state and hitbox
         attack_state = self.player.states.get("attack")
-        if not attack_state or not hasattr(attack_state, 'get_attack_hitbox'):
+        if not isinstance(attack_state, AttackState):
             return
             
         attack_hitbox = attack_state.get_attack_hitbox()
         if not attack_hitbox:
             return
         
-        # Check each enemy
-        for enemy in self.enemies:
+        # Only enemies overlapping the attack hitbox are visited
+        enemies = self.enemies
+        generation = attack_state.attack_generation
+        for index in attack_hitbox.collidelistall(hitboxes):
+            enemy = enemies[index]
             if enemy.is_dead():
                 continue
-                
-            # Check if attack hitbox overlaps with enemy
-            if attack_hitbox.colliderect(enemy.hitbox):
-                # Prevent hitting same enemy multiple times in one attack
-                if enemy not in attack_state.hit_targets:
-                    damage = attack_state.get_damage()
-                    enemy.take_damage(damage)
-                    attack_state.hit_targets.add(enemy)
-                    logger.debug("Attack hit enemy for %d damage", damage)
+
+            # Prevent hitting same enemy multiple times in one attack
+            if enemy.last_hit_generation != generation:
+                damage = attack_state.get_damage()
+                enemy.take_damage(damage)
+                enemy.last_hit_generation = generation
+                logger.debug("Attack hit enemy for %d damage", damage)
 
     def _get_player_data(self) -> dict:
         """
@@ -280,6 +310,9 @@ class GameScreen(BaseScreen):
         Args:
             event: Pygame event to process.
         """
+        # Buffer key-downs so taps between frames still register
+        self.player.input_handler.handle_event(event)
+
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_p:
                 logger.info("Pausing game")
@@ -317,13 +350,12 @@ class GameScreen(BaseScreen):
             pygame.draw.rect(surface, (255, 0, 0), debug_rect, 2)
         
         # Draw collision tiles (yellow) - only visible ones
-        for tile in self.collision_manager.tile_rects:
+        view = pygame.Rect(self.camera_offset.x, self.camera_offset.y, SCREEN_WIDTH, SCREEN_HEIGHT)
+        for tile in self.collision_manager.iter_visible(view):
             debug_rect = tile.copy()
             debug_rect.x -= self.camera_offset.x
             debug_rect.y -= self.camera_offset.y
-            # Only draw if on screen
-            if -50 < debug_rect.x < SCREEN_WIDTH + 50 and -50 < debug_rect.y < SCREEN_HEIGHT + 50:
-                pygame.draw.rect(surface, (255, 255, 0), debug_rect, 1)
+            pygame.draw.rect(surface, (255, 255, 0), debug_rect, 1)
         
         # Draw player state info
         font = pygame.font.Font(None, 24)
@@ -0,0 +1,50 @@
+"""Tests for the float-only utility curves and action evaluators."""
+
+import pytest
+
+from src.systems import ai_utility
+
+
+class TestResponseCurves:
+    """Tests for the response curve functions."""
+
+    def test_linear_clamps_to_unit_range(self) -> None:
+        """Test linear maps the range to 0-1 and clamps outside it."""
+        assert ai_utility.linear(50.0, 0.0, 100.0) == pytest.approx(0.5)
+        assert ai_utility.linear(-10.0, 0.0, 100.0) == 0.0
+        assert ai_utility.linear(150.0, 0.0, 100.0) == 1.0
+
+    def test_linear_degenerate_range_scores_zero(self) -> None:
+        """Test an empty range scores zero instead of dividing by zero."""
+        assert ai_utility.linear(5.0, 10.0, 10.0) == 0.0
+
+    def test_inverse_linear_mirrors_linear(self) -> None:
+        """Test inverse_linear is one minus linear."""
+        assert ai_utility.inverse_linear(25.0, 0.0, 100.0) == pytest.approx(0.75)
+
+
+class TestActionEvaluators:
+    """Tests for the per-action evaluators."""
+
+    def test_chase_between_ranges_scores_high(self) -> None:
+        """Test chase is preferred between attack and detection range."""
+        assert ai_utility.eval_chase(100.0, 200.0, 50.0, 0.5) > 0.7
+
+    def test_chase_outside_detection_scores_zero(self) -> None:
+        """Test chase scores zero when the target is undetected."""
+        assert ai_utility.eval_chase(250.0, 200.0, 50.0, 0.5) == 0.0
+
+    def test_attack_penalized_right_after_attacking(self) -> None:
+        """Test attack utility drops while the attack is recent."""
+        fresh = ai_utility.eval_attack(30.0, 50.0, 0.5, 0.0)
+        rested = ai_utility.eval_attack(30.0, 50.0, 0.5, 1.0)
+
+        assert fresh < rested
+
+    def test_retreat_rises_at_low_health(self) -> None:
+        """Test retreat utility grows as health drops."""
+        assert ai_utility.eval_retreat(15, 100, 0.0) > ai_utility.eval_retreat(80, 100, 0.0)
+
+    def test_predict_ignores_slow_target(self) -> None:
+        """Test predictive movement scores low for a near-stationary target."""
+        assert ai_utility.eval_predict(0.0, 120.0, 200.0, 50.0) == 0.1
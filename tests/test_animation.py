@@ -80,6 +80,32 @@ class TestAnimation:
         assert frame_at_start is sample_frames[0]
         assert frame_after_loop is sample_frames[0]
 
+    def test_get_frame_looping_matches_frame_boundaries(
+        self, sample_frames: list[pygame.Surface]
+    ) -> None:
+        """Test the looping lookup table switches frames on each boundary."""
+        animation = Animation(sample_frames, frame_duration=0.1, loop=True)
+
+        assert animation.get_frame(0.099) is sample_frames[0]
+        assert animation.get_frame(0.3) is sample_frames[3]
+        assert animation.get_frame(0.399) is sample_frames[3]
+        assert animation.get_frame(0.75) is sample_frames[3]
+        assert animation.get_frame(0.85) is sample_frames[0]
+
+    def test_flipped_frames_precomputed(
+        self, sample_frames: list[pygame.Surface]
+    ) -> None:
+        """Test left-facing frames are built at construction by default."""
+        eager = Animation(sample_frames, frame_duration=0.1)
+        lazy = Animation(sample_frames, frame_duration=0.1, precompute_flip=False)
+
+        assert eager.frames_left is not None
+        assert len(eager.frames_left) == len(sample_frames)
+        assert eager.get_flipped_frame(0.0) is eager.frames_left[0]
+        assert lazy.frames_left is None
+        lazy.get_flipped_frame(0.0)
+        assert lazy.frames_left is not None
+
     def test_get_frame_no_loop_stays_at_last(
         self, sample_frames: list[pygame.Surface]
     ) -> None:
@@ -315,6 +341,36 @@ class TestAnimationController:
         assert frame_right.get_at((0, 0)) == (255, 0, 0, 255)  # Red
         assert frame_left.get_at((0, 0)) == (0, 0, 255, 255)  # Blue (flipped)
 
+    def test_get_current_frame_flipped_is_cached(
+        self,
+        controller: AnimationController,
+    ) -> None:
+        """Test repeated left-facing frames reuse the same flipped surface."""
+        frames = [pygame.Surface((32, 32)) for _ in range(2)]
+        controller.add_animation("test", Animation(frames, frame_duration=0.1))
+        controller.play("test")
+        controller.set_facing(False)
+
+        first = controller.get_current_frame()
+        second = controller.get_current_frame()
+        controller.update(0.1)
+        next_frame = controller.get_current_frame()
+
+        assert first is second
+        assert first is not frames[0]
+        assert next_frame is not first
+
+    def test_facing_index_tracks_facing_right(
+        self, controller: AnimationController
+    ) -> None:
+        """Test facing_index and the facing_right property stay in sync."""
+        controller.set_facing(False)
+        assert controller.facing_index == 1
+
+        controller.facing_right = True
+        assert controller.facing_index == 0
+        assert controller.facing_right is True
+
     def test_set_facing(self, controller: AnimationController) -> None:
         """Test set_facing changes facing direction."""
         controller.set_facing(False)
@@ -371,3 +427,11 @@ class TestCreatePlaceholderFrames:
             assert pixel.r == 128
             assert pixel.g == 64
             assert pixel.b == 32
+
+    def test_frames_share_one_surface_by_default(self) -> None:
+        """Test placeholder frames reuse a single surface unless asked not to."""
+        shared = create_placeholder_frames((255, 0, 0))
+        distinct = create_placeholder_frames((255, 0, 0), share=False)
+
+        assert all(frame is shared[0] for frame in shared)
+        assert len({id(frame) for frame in distinct}) == 4
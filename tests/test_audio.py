@@ -3,6 +3,8 @@
 import pytest
 import pygame
 
+from src.core.settings import AUDIO_BUFFER_SIZE, AUDIO_FALLBACK_BUFFER_SIZE, AUDIO_MIXER_CHANNELS
+from src.systems import audio_manager
 from src.systems.audio import AudioManager
 
 
@@ -69,6 +71,52 @@ class TestAudioManagerInitialization:
 
         assert am.get_current_music() is None
 
+    def test_mixer_opened_on_first_playback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the mixer is initialized lazily, not at construction."""
+        calls = []
+        monkeypatch.setattr(pygame.mixer, "get_init", lambda: None)
+        monkeypatch.setattr(pygame.mixer, "init", lambda **kwargs: calls.append(kwargs))
+        monkeypatch.setattr(pygame.mixer, "set_num_channels", lambda count: None)
+        monkeypatch.setattr(pygame.mixer.music, "set_volume", lambda volume: None)
+
+        am = AudioManager()
+        assert calls == []
+
+        assert am._ensure_mixer()
+        am._ensure_mixer()
+        assert len(calls) == 1
+
+    def test_mono_audio_setting_opens_one_channel(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test MONO_AUDIO opens the mixer with a single output channel."""
+        calls = []
+        monkeypatch.setattr(audio_manager, "MONO_AUDIO", True)
+        monkeypatch.setattr(pygame.mixer, "get_init", lambda: None)
+        monkeypatch.setattr(pygame.mixer, "init", lambda **kwargs: calls.append(kwargs))
+        monkeypatch.setattr(pygame.mixer, "set_num_channels", lambda count: None)
+        monkeypatch.setattr(pygame.mixer.music, "set_volume", lambda volume: None)
+
+        assert AudioManager()._ensure_mixer()
+        assert calls[0]["channels"] == 1
+
+    def test_mixer_falls_back_to_larger_buffer(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a rejected low-latency buffer is retried with the fallback size."""
+        buffers = []
+
+        def fake_init(**kwargs: int) -> None:
+            buffers.append(kwargs["buffer"])
+            if kwargs["buffer"] == AUDIO_BUFFER_SIZE:
+                raise pygame.error("buffer underrun")
+
+        channels = []
+        monkeypatch.setattr(pygame.mixer, "get_init", lambda: None)
+        monkeypatch.setattr(pygame.mixer, "init", fake_init)
+        monkeypatch.setattr(pygame.mixer, "set_num_channels", channels.append)
+        monkeypatch.setattr(pygame.mixer.music, "set_volume", lambda volume: None)
+
+        assert AudioManager()._ensure_mixer()
+        assert buffers == [AUDIO_BUFFER_SIZE, AUDIO_FALLBACK_BUFFER_SIZE]
+        assert channels == [AUDIO_MIXER_CHANNELS]
+
 
 class TestAudioManagerMusicPlayback:
     """Tests for AudioManager music playback."""
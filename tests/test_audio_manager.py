@@ -4,7 +4,11 @@ Tests for audio management system.
 Validates music playback, sound effects, and volume control.
 """
 
+import pytest
 import pygame
+
+from src.core.settings import SFX_CACHE_LIMIT
+from src.systems import audio_manager
 from src.systems.audio_manager import AudioManager
 
 
@@ -27,6 +31,13 @@ class TestAudioManagerInitialization:
 
         assert audio1 is audio2
 
+    def test_audio_module_shares_singleton(self) -> None:
+        """Test the legacy audio module exposes the same singleton."""
+        from src.systems import audio
+
+        assert audio.AudioManager is AudioManager
+        assert audio.AudioManager() is AudioManager()
+
 
 class TestMusicPlayback:
     """Test suite for music playback."""
@@ -66,6 +77,21 @@ class TestMusicPlayback:
 
         assert audio.current_music == first_music
 
+    def test_paused_track_resumed_not_reloaded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test replaying the paused current track unpauses instead of reloading."""
+        audio = AudioManager()
+        audio.play_music("menu", loops=0)
+        audio.pause_music()
+        audio._music_paused = True  # get_busy() may be False under the dummy driver
+        loads = []
+        monkeypatch.setattr(pygame.mixer.music, "load", loads.append)
+
+        audio.play_music("menu", loops=0)
+
+        assert loads == []
+        assert audio.current_music == "menu"
+        assert not audio._music_paused
+
 
 class TestSoundEffects:
     """Test suite for sound effects."""
@@ -101,6 +127,59 @@ class TestSoundEffects:
         # Should log warning but not crash
         audio.play_sfx("nonexistent_sound_12345")
 
+    def test_sfx_index_built_once_from_directory(self) -> None:
+        """Test SFX paths come from a single scan of the sfx directory."""
+        audio = AudioManager()
+        audio.sfx_cache.clear()
+        audio._sfx_index = None
+
+        audio.play_sfx("click3")
+        index = audio._sfx_index
+        audio.play_sfx("click4")
+
+        assert index is not None
+        assert audio._sfx_index is index
+        assert index["click3"].endswith("click3.wav")
+        assert "readme" not in index
+
+    def test_sfx_cache_evicts_least_recently_used(self) -> None:
+        """Test the SFX cache stays bounded and keeps recently played sounds."""
+        audio = AudioManager()
+        audio.sfx_cache.clear()
+        audio.set_cache_limit(2)
+
+        try:
+            audio.play_sfx("click1")
+            audio.play_sfx("click2")
+            audio.play_sfx("click1")  # Refresh click1
+            audio.play_sfx("click3")
+
+            assert list(audio.sfx_cache) == ["click1", "click3"]
+        finally:
+            audio.set_cache_limit(SFX_CACHE_LIMIT)
+
+    def test_oversized_sfx_not_decoded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test files above the SFX size limit are refused instead of cached."""
+        audio = AudioManager()
+        audio.sfx_cache.clear()
+        monkeypatch.setattr(audio_manager, "SFX_MAX_FILE_BYTES", 10)
+
+        audio.play_sfx("click5")
+
+        assert not audio.is_sfx_cached("click5")
+
+    def test_preload_sfx_fills_cache_without_playing(self) -> None:
+        """Test preloading caches existing sounds and skips missing ones."""
+        audio = AudioManager()
+        audio.sfx_cache.clear()
+
+        loaded = audio.preload_sfx(["click2", "jump", "nonexistent_sound_12345"])
+
+        assert loaded == 2
+        assert audio.is_sfx_cached("click2")
+        assert audio.is_sfx_cached("jump")
+        assert not audio.is_sfx_cached("nonexistent_sound_12345")
+
 
 class TestVolumeControl:
     """Test suite for volume control."""
@@ -139,6 +218,21 @@ class TestVolumeControl:
         audio.set_sfx_volume(2.0)
         assert audio.sfx_volume == 1.0
 
+    def test_sfx_volume_applied_on_next_play(self) -> None:
+        """Test SFX volume changes reach a cached sound when it next plays."""
+        audio = AudioManager()
+        previous = audio.sfx_volume
+        audio.play_sfx("click1")
+        sound = audio.sfx_cache["click1"]
+
+        try:
+            audio.set_sfx_volume(0.25)
+            audio.play_sfx("click1")
+
+            assert sound.get_volume() == pytest.approx(0.25, abs=0.01)
+        finally:
+            audio.set_sfx_volume(previous)
+
 
 class TestAudioToggle:
     """Test suite for audio enable/disable."""
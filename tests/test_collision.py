@@ -10,6 +10,29 @@ from src.systems.collision import (
 from src.systems.physics import PhysicsBody
 
 
+def _brute_force_resolve(
+    tiles: list, hitbox: pygame.Rect, velocity: pygame.math.Vector2
+) -> pygame.Rect:
+    """Reference resolution that checks every tile."""
+    hitbox.x += int(velocity.x)
+    hits = [tile for tile in tiles if hitbox.colliderect(tile)]
+    if hits:
+        if velocity.x > 0:
+            hitbox.right = min(tile.left for tile in hits)
+        elif velocity.x < 0:
+            hitbox.left = max(tile.right for tile in hits)
+        velocity.x = 0
+    hitbox.y += int(velocity.y)
+    hits = [tile for tile in tiles if hitbox.colliderect(tile)]
+    if hits:
+        if velocity.y > 0:
+            hitbox.bottom = min(tile.top for tile in hits)
+        elif velocity.y < 0:
+            hitbox.top = max(tile.bottom for tile in hits)
+        velocity.y = 0
+    return hitbox
+
+
 class TestCheckAABBCollision:
     """Tests for AABB collision detection function."""
 
@@ -104,6 +127,16 @@ class TestGetCollisionSide:
         # Should return one of the valid sides
         assert side in ["left", "right", "top", "bottom"]
 
+    def test_ties_resolve_in_side_order(self) -> None:
+        """Test equal overlaps pick the earliest of left/right/top/bottom."""
+        moving = pygame.Rect(0, 0, 10, 10)
+        static = pygame.Rect(5, 5, 10, 10)
+
+        assert get_collision_side(moving, static, pygame.math.Vector2(1, 1)) == ("left", 5)
+        assert get_collision_side(moving, static, pygame.math.Vector2(0, 1)) == ("left", 5)
+        assert get_collision_side(moving, static, pygame.math.Vector2(-1, 1)) == ("top", 5)
+        assert get_collision_side(moving, static, pygame.math.Vector2(-1, -1)) == ("right", 15)
+
 
 class TestCollisionManagerInitialization:
     """Tests for CollisionManager initialization."""
@@ -229,6 +262,107 @@ class TestCollisionManagerResolveCollisions:
         assert velocity.y == 5
 
 
+class TestCollisionManagerBroadPhase:
+    """Tests for the tile grid used to narrow collision checks."""
+
+    def test_tile_spanning_cells_registered_in_each(self) -> None:
+        """Test a tile crossing cell borders is found from every cell it covers."""
+        manager = CollisionManager(cell_size=64)
+        tile = pygame.Rect(48, 0, 32, 32)
+        manager.set_tiles([tile])
+
+        assert manager._cell_rects == {(0, 0): [tile], (1, 0): [tile]}
+        assert manager._overlapping(pygame.Rect(50, 0, 10, 10)) == [tile]
+        assert manager._overlapping(pygame.Rect(70, 0, 10, 10)) == [tile]
+        assert manager._overlapping(pygame.Rect(200, 0, 10, 10)) == []
+
+    def test_large_hitboxes_match_brute_force(self) -> None:
+        """Test hitboxes spanning many cells resolve like a full scan, sparse or dense."""
+        floor = [pygame.Rect(x * 32, 608, 32, 32) for x in range(40)]
+        dense = [
+            pygame.Rect(x * 32, y * 32, 32, 32)
+            for x in range(40)
+            for y in range(20)
+            if (x * 5 + y * 3) % 4 == 0
+        ]
+        for tiles in (floor, dense):
+            manager = CollisionManager()
+            manager.set_tiles(tiles)
+            for i in range(100):
+                size = (20 + (i * 13) % 180, 40 + (i * 29) % 400)
+                x, y = (i * 37) % 1100, (i * 53) % 500
+                vx, vy = (i % 9) - 4, (i % 13) - 6
+                expected = _brute_force_resolve(
+                    tiles, pygame.Rect((x, y), size), pygame.math.Vector2(vx, vy)
+                )
+                actual = manager.resolve_collisions(
+                    pygame.Rect((x, y), size), pygame.math.Vector2(vx, vy), PhysicsBody()
+                )
+                assert actual == expected
+
+    def test_snaps_to_nearest_tile_not_first_listed(self) -> None:
+        """Test resolution picks the nearest edge when several tiles overlap."""
+        manager = CollisionManager()
+        # Listed far-to-near; snapping to the first would leave the hitbox in the second
+        manager.set_tiles([pygame.Rect(110, 0, 32, 20), pygame.Rect(100, 20, 32, 20)])
+        physics = PhysicsBody()
+
+        hitbox = manager.resolve_collisions(
+            pygame.Rect(80, 10, 24, 24), pygame.math.Vector2(40, 0), physics
+        )
+
+        assert hitbox.right == 100
+        assert physics.on_wall_right is True
+        assert hitbox.collidelist(manager.tile_rects) == -1
+
+    def test_matches_brute_force_resolution(self) -> None:
+        """Test grid-based resolution matches checking every tile."""
+
+        tiles = [
+            pygame.Rect(x * 32, y * 32, 32, 32)
+            for x in range(20)
+            for y in range(12)
+            if (x * 7 + y * 3) % 5 == 0 or y == 11
+        ]
+        manager = CollisionManager()
+        manager.set_tiles(tiles)
+
+        for i in range(200):
+            x, y = (i * 37) % 600, (i * 53) % 360
+            vx, vy = (i % 9) - 4, (i % 13) - 6
+            expected = _brute_force_resolve(
+                tiles, pygame.Rect(x, y, 24, 30), pygame.math.Vector2(vx, vy)
+            )
+            actual = manager.resolve_collisions(
+                pygame.Rect(x, y, 24, 30), pygame.math.Vector2(vx, vy), PhysicsBody()
+            )
+            assert actual == expected
+
+    def test_iter_visible_matches_full_scan(self) -> None:
+        """Test view culling yields exactly the overlapping tiles, once each."""
+        tiles = [
+            pygame.Rect(x * 32, y * 32, 32 * (1 + x % 3), 32)
+            for x in range(60)
+            for y in range(30)
+            if (x * 7 + y * 3) % 5 == 0
+        ]
+        manager = CollisionManager()
+        manager.set_tiles(tiles)
+
+        for i in range(50):
+            view = pygame.Rect((i * 97) % 1500 - 200, (i * 61) % 700 - 100, 640, 360)
+            expected = [tile for tile in tiles if view.colliderect(tile)]
+            visible = list(manager.iter_visible(view))
+            assert len(visible) == len(expected)
+            assert sorted(map(tuple, visible)) == sorted(map(tuple, expected))
+
+    def test_iter_visible_empty_without_tiles(self) -> None:
+        """Test view culling on an empty manager yields nothing."""
+        manager = CollisionManager()
+
+        assert list(manager.iter_visible(pygame.Rect(0, 0, 1280, 720))) == []
+
+
 class TestCollisionManagerRaycast:
     """Tests for CollisionManager raycast."""
 
@@ -288,3 +422,68 @@ class TestCollisionManagerRaycast:
         result = manager.raycast(start, direction, 200)
 
         assert result is not None
+
+    def test_raycast_returns_entry_point(self) -> None:
+        """Test raycast reports where the ray enters the tile."""
+        manager = CollisionManager()
+        manager.set_tiles([pygame.Rect(100, 50, 32, 32)])
+
+        result = manager.raycast(pygame.math.Vector2(0, 60), pygame.math.Vector2(1, 0), 200)
+
+        assert result is not None
+        assert result[0] == pygame.math.Vector2(100, 60)
+
+    def test_raycast_negative_direction(self) -> None:
+        """Test raycast walks cells toward negative coordinates."""
+        manager = CollisionManager()
+        manager.set_tiles([pygame.Rect(-200, -40, 32, 32), pygame.Rect(-100, 0, 32, 32)])
+
+        result = manager.raycast(pygame.math.Vector2(50, -30), pygame.math.Vector2(-1, 0), 300)
+
+        assert result is not None
+        hit_point, hit_rect = result
+        assert hit_rect == pygame.Rect(-200, -40, 32, 32)
+        assert hit_point == pygame.math.Vector2(-168, -30)
+
+    def test_raycast_picks_nearest_tile_spanning_cells(self) -> None:
+        """Test a wide tile seen in an earlier cell does not hide a nearer one."""
+        manager = CollisionManager(cell_size=64)
+        # The wide tile reaches back into the first cell the ray crosses
+        wide = pygame.Rect(0, 100, 200, 20)
+        near = pygame.Rect(40, 70, 10, 10)
+        manager.set_tiles([wide, near])
+
+        result = manager.raycast(pygame.math.Vector2(10, 0), pygame.math.Vector2(1, 2), 300)
+
+        assert result is not None
+        assert result[1] == near
+
+    def test_raycast_matches_dense_sampling(self) -> None:
+        """Test grid traversal finds the same tile as fine-grained stepping."""
+        tiles = [
+            pygame.Rect(x * 32, y * 32, 32, 32)
+            for x in range(20)
+            for y in range(12)
+            if (x * 7 + y * 3) % 11 == 0
+        ]
+        manager = CollisionManager()
+        manager.set_tiles(tiles)
+
+        for i in range(100):
+            start = pygame.math.Vector2(16 + (i * 37) % 600, 16 + (i * 53) % 360)
+            direction = pygame.math.Vector2(1, 0).rotate(i * 37.3)
+            expected = None
+            for k in range(4000):
+                point = start + direction * (k * 0.1)
+                hit = [
+                    t
+                    for t in tiles
+                    if t.left <= point.x < t.right and t.top <= point.y < t.bottom
+                ]
+                if hit:
+                    expected = hit[0]
+                    break
+
+            result = manager.raycast(start, direction, 400)
+
+            assert (result[1] if result else None) == expected
@@ -5,10 +5,12 @@ Tests for Attack State and Combat System.
 import pytest
 import pygame
 
+from src.core.settings import ENEMY_ATTACK_REACH
 from src.entities.entity import Entity
 from src.entities.player import Player
 from src.states.attack_state import AttackState
 from src.systems.combat import CombatManager
+from src.systems.input_handler import ACTION_BITS
 
 
 class ConcreteEnemy(Entity):
@@ -135,9 +137,9 @@ class TestComboSystem:
         state.update(0.22)
         assert state.can_combo is True
         # Simulate buffering attack input
-        player.input_handler._just_pressed.add("attack")
+        player.input_handler.just_pressed_mask |= ACTION_BITS["attack"]
         state.update(0.01)
-        player.input_handler._just_pressed.clear()
+        player.input_handler.just_pressed_mask = 0
         assert state.combo_buffered is True
         # Complete first attack, should auto-chain to second
         state.update(0.08)
@@ -158,9 +160,9 @@ class TestComboSystem:
             state.update(attack["duration"] * 0.71)
             if expected_num < 3:
                 # Buffer next attack
-                player.input_handler._just_pressed.add("attack")
+                player.input_handler.just_pressed_mask |= ACTION_BITS["attack"]
                 state.update(0.01)
-                player.input_handler._just_pressed.clear()
+                player.input_handler.just_pressed_mask = 0
                 # Complete current attack
                 remaining = attack["duration"] - (attack["duration"] * 0.71 + 0.01)
                 state.update(remaining + 0.01)
@@ -168,7 +170,7 @@ class TestComboSystem:
         # After third attack completes without buffer, should reset
         # Complete attack 3
         state.update(0.01)
-        player.input_handler._just_pressed.clear()
+        player.input_handler.just_pressed_mask = 0
         state.update(0.5)
         # State should have reset attack_number for next time
         assert state.attack_number == 1
@@ -269,7 +271,7 @@ class TestAttackStateTransitions:
         """Test idle transitions to attack on attack input."""
         player = Player((0, 0))
         player.physics.on_ground = True
-        player.input_handler._just_pressed.add("attack")
+        player.input_handler.just_pressed_mask |= ACTION_BITS["attack"]
         next_state = player.current_state.handle_input()
         assert next_state == "attack"
 
@@ -277,7 +279,7 @@ class TestAttackStateTransitions:
         """Test run transitions to attack on attack input."""
         player = Player((0, 0))
         player.change_state("run")
-        player.input_handler._just_pressed.add("attack")
+        player.input_handler.just_pressed_mask |= ACTION_BITS["attack"]
         next_state = player.current_state.handle_input()
         assert next_state == "attack"
 
@@ -343,6 +345,25 @@ class TestCombatManagerEnemies:
         combat.clear_enemies()
         assert len(combat.enemies) == 0
 
+    def test_remove_keeps_remaining_order(self) -> None:
+        """Test removing an enemy keeps the others in insertion order."""
+        combat = CombatManager()
+        enemies = [ConcreteEnemy((x, 100)) for x in (0, 100, 200)]
+        for enemy in enemies:
+            combat.add_enemy(enemy)
+
+        combat.remove_enemy(enemies[1])
+
+        assert combat.enemies == [enemies[0], enemies[2]]
+
+    def test_add_same_enemy_twice_tracks_once(self) -> None:
+        """Test re-adding an enemy does not make it hit or be hit twice."""
+        combat = CombatManager()
+        enemy = ConcreteEnemy((100, 100))
+        combat.add_enemy(enemy)
+        combat.add_enemy(enemy)
+        assert combat.enemies == [enemy]
+
 
 class TestPlayerAttackHitsEnemy:
     """Tests for player attack hitting enemies."""
@@ -391,15 +412,52 @@ class TestPlayerAttackHitsEnemy:
 
         assert enemy.health == 90  # Only hit once
 
-    def test_hit_targets_cleared_on_new_attack(self) -> None:
-        """Test hit targets are cleared when starting new attack."""
+    def test_only_overlapping_enemies_hit(self) -> None:
+        """Test one attack damages every overlapping enemy and nothing else."""
+        combat = CombatManager()
+        player = Player((100, 100))
+        near = [ConcreteEnemy((132, 100)), ConcreteEnemy((140, 100))]
+        far = ConcreteEnemy((600, 100))
+        for enemy in (near[0], far, near[1]):
+            enemy.health = 100
+            combat.add_enemy(enemy)
+        combat.set_player(player)
+
+        player.change_state("attack")
+        combat.update()
+
+        assert [enemy.health for enemy in near] == [90, 90]
+        assert far.health == 100
+        generation = player.current_state.attack_generation
+        assert [enemy.last_hit_generation for enemy in near] == [generation, generation]
+        assert far.last_hit_generation != generation
+
+    def test_hit_generation_advances_on_new_attack(self) -> None:
+        """Test starting a new attack forgets which enemies were already hit."""
         player = Player((100, 100))
         player.change_state("attack")
         state = player.current_state
-        state.hit_targets.add("dummy_target")
+        target = ConcreteEnemy((132, 100))
+        target.last_hit_generation = state.attack_generation
         # Re-enter attack
         state.enter()
-        assert len(state.hit_targets) == 0
+        assert target.last_hit_generation != state.attack_generation
+
+    def test_new_attack_can_hit_same_enemy_again(self) -> None:
+        """Test an enemy hit by one swing takes damage again from the next."""
+        combat = CombatManager()
+        player = Player((100, 100))
+        enemy = ConcreteEnemy((132, 100))
+        enemy.health = 100
+        combat.set_player(player)
+        combat.add_enemy(enemy)
+
+        player.change_state("attack")
+        combat.update()
+        player.current_state.enter()
+        combat.update()
+
+        assert enemy.health == 80
 
 
 class TestEnemyAttackHitsPlayer:
@@ -448,6 +506,27 @@ class TestEnemyAttackHitsPlayer:
 
         assert player.health == 100
 
+    def test_enemies_beyond_attack_reach_not_queried(self) -> None:
+        """Test distant enemies are culled before their attack hitbox is asked for."""
+        queried = []
+
+        class TrackedEnemy(ConcreteEnemy):
+            def get_attack_hitbox(self) -> pygame.Rect | None:
+                queried.append(self)
+                return super().get_attack_hitbox()
+
+        combat = CombatManager()
+        player = Player((100, 100))
+        near = TrackedEnemy((132, 100))
+        far = TrackedEnemy((100 + 32 + ENEMY_ATTACK_REACH + 50, 100))
+        combat.set_player(player)
+        combat.add_enemy(near)
+        combat.add_enemy(far)
+
+        combat.update()
+
+        assert queried == [near]
+
 
 class TestCombatManagerNoPlayer:
     """Tests for CombatManager without player set."""
@@ -3,10 +3,12 @@
 import pytest
 import pygame
 
+from src.core.settings import AI_CULL_DISTANCE, AI_LOD_MID_DISTANCE, AI_LOD_MID_INTERVAL
 from src.entities.enemy import Enemy, SmartEnemy
 from src.entities.entity import Entity
 from src.systems.ai import (
     AIAction,
+    AIBehavior,
     AIContext,
     AIController,
     AIDecisionMaker,
@@ -20,6 +22,7 @@ from src.systems.ai import (
     SmartChaseBehavior,
     UtilityScore,
 )
+from src.systems.timers import TimerSystem
 
 
 class MockEntity(Entity):
@@ -76,6 +79,13 @@ class TestEnemyInitialization:
 
         assert enemy.get_current_behavior_name() == "patrol"
 
+    def test_smart_enemy_behaviors_are_slotted(self) -> None:
+        """Test no registered behavior carries a per-instance __dict__."""
+        enemy = SmartEnemy((0, 0))
+
+        for behavior in enemy.ai_controller.behaviors.values():
+            assert not hasattr(behavior, "__dict__"), behavior.name
+
 
 class TestEnemyPatrol:
     """Tests for Enemy patrol behavior - TC-007-1 and TC-007-2."""
@@ -221,6 +231,45 @@ class TestEnemyAttack:
         assert enemy.velocity.x == 0
 
 
+class TestEnemyAILevelOfDetail:
+    """Tests for distance-based patrol throttling."""
+
+    def test_far_patrol_is_paused(self) -> None:
+        """Test patrol beyond cull distance does not tick and stops moving."""
+        enemy = Enemy((0, 0), patrol_points=[(0, 0), (100, 0)])
+        enemy.target = MockEntity((AI_CULL_DISTANCE + 10, 0))
+        enemy.velocity.x = 5.0
+
+        assert enemy._get_ai_step_dt(1 / 60) is None
+        assert enemy.velocity.x == 0
+
+    def test_mid_range_patrol_ticks_at_reduced_rate(self) -> None:
+        """Test mid-range patrol ticks once per interval with accumulated dt."""
+        enemy = Enemy((0, 0))
+        enemy.target = MockEntity((AI_LOD_MID_DISTANCE + 10, 0))
+
+        steps = [enemy._get_ai_step_dt(0.01) for _ in range(AI_LOD_MID_INTERVAL)]
+        ticks = [step for step in steps if step is not None]
+
+        assert len(ticks) == 1
+        assert ticks[0] == pytest.approx(0.01 * (steps.index(ticks[0]) + 1))
+
+    def test_near_patrol_ticks_every_frame(self) -> None:
+        """Test patrol near the target is not throttled."""
+        enemy = Enemy((0, 0))
+        enemy.target = MockEntity((50, 0))
+
+        assert enemy._get_ai_step_dt(0.01) == pytest.approx(0.01)
+
+    def test_non_patrol_behavior_not_throttled(self) -> None:
+        """Test chase/attack/hurt/death always tick."""
+        enemy = Enemy((0, 0))
+        enemy.target = MockEntity((AI_CULL_DISTANCE + 10, 0))
+        enemy.change_behavior("chase")
+
+        assert enemy._get_ai_step_dt(0.01) == pytest.approx(0.01)
+
+
 class TestEnemyDamage:
     """Tests for Enemy damage handling - TC-007-5 and TC-007-6."""
 
@@ -280,6 +329,146 @@ class TestEnemyDamage:
         assert enemy not in group
 
 
+class TestEnemyRendering:
+    """Tests for batched enemy drawing."""
+
+    @pytest.mark.parametrize("enemy_cls", [Enemy, SmartEnemy])
+    def test_blit_pair_applies_camera_offset(self, enemy_cls: type) -> None:
+        """Test get_blit_pair returns the current frame at its screen position."""
+        enemy = enemy_cls((100, 50))
+        enemy.animation.play("idle")
+
+        pair = enemy.get_blit_pair(pygame.math.Vector2(30, 20))
+
+        assert pair is not None
+        image, screen_pos = pair
+        assert image is enemy.animation.get_current_frame()
+        assert screen_pos == pygame.math.Vector2(70, 30)
+
+    @pytest.mark.parametrize("enemy_cls", [Enemy, SmartEnemy])
+    def test_blits_batch_matches_render(self, enemy_cls: type) -> None:
+        """Test a Surface.blits batch draws the same pixels as render()."""
+        enemy = enemy_cls((10, 10))
+        enemy.animation.play("idle")
+        offset = pygame.math.Vector2(4, 2)
+        expected = pygame.Surface((96, 96))
+        batched = pygame.Surface((96, 96))
+
+        enemy.render(expected, offset)
+        batched.blits([enemy.get_blit_pair(offset)], doreturn=False)
+
+        assert pygame.image.tobytes(batched, "RGB") == pygame.image.tobytes(expected, "RGB")
+
+    def test_blit_pair_none_without_frame(self) -> None:
+        """Test get_blit_pair skips enemies with no animation playing."""
+        enemy = SmartEnemy((0, 0))
+
+        assert enemy.get_blit_pair(pygame.math.Vector2()) is None
+
+
+class TestEnemyScheduledTimeouts:
+    """Tests for hurt/death driven by a TimerSystem."""
+
+    def test_hurt_skips_behavior_update_while_stunned(self) -> None:
+        """Test the hurt behavior is not ticked while its timeout is pending."""
+        timers = TimerSystem()
+        enemy = Enemy((0, 0))
+        enemy.set_timer_system(timers)
+        enemy.take_damage(20)
+        hurt = enemy.behaviors["hurt"]
+        hurt._stun_timer = 0.0
+
+        enemy.update(1 / 60)
+
+        assert enemy.get_current_behavior_name() == "hurt"
+        assert enemy.velocity.x == 0
+
+    def test_hurt_returns_to_patrol_when_timer_fires(self) -> None:
+        """Test the stun ends when the timer system reaches the deadline."""
+        timers = TimerSystem()
+        enemy = Enemy((0, 0))
+        enemy.set_timer_system(timers)
+        enemy.take_damage(20)
+
+        timers.update(enemy.behaviors["hurt"].stun_duration)
+
+        assert enemy.get_current_behavior_name() == "patrol"
+
+    def test_repeat_hurt_restarts_timeout(self) -> None:
+        """Test a second hit cancels the first stun timeout."""
+        timers = TimerSystem()
+        enemy = Enemy((0, 0))
+        enemy.set_timer_system(timers)
+        enemy.take_damage(10)
+        timers.update(0.2)
+        enemy.invulnerable = False
+        enemy.take_damage(10)
+
+        timers.update(0.2)
+
+        assert enemy.get_current_behavior_name() == "hurt"
+
+    def test_death_kills_when_timer_fires(self) -> None:
+        """Test death removes the enemy when its timeout fires."""
+        timers = TimerSystem()
+        group = pygame.sprite.Group()
+        enemy = Enemy((0, 0))
+        group.add(enemy)
+        enemy.set_timer_system(timers)
+
+        enemy.take_damage(100)
+        assert enemy in group
+
+        timers.update(enemy.behaviors["death"].death_duration)
+
+        assert enemy not in group
+        assert enemy._pending_timer is None
+
+    def test_detaching_timer_system_cancels_pending_timeout(self) -> None:
+        """Test removing the timer system mid-stun falls back to the behavior timer."""
+        timers = TimerSystem()
+        enemy = Enemy((0, 0))
+        enemy.set_timer_system(timers)
+        enemy.take_damage(20)
+
+        enemy.set_timer_system(None)
+        enemy.change_behavior("patrol")
+        timers.update(1.0)
+
+        assert enemy._pending_timer is None
+        assert enemy.get_current_behavior_name() == "patrol"
+
+    def test_pending_timeout_holds_enemy_still_each_frame(self) -> None:
+        """Test velocity stays clamped on every frame of a scheduled stun or death."""
+        timers = TimerSystem()
+        enemy = Enemy((0, 0))
+        enemy.set_timer_system(timers)
+        enemy.take_damage(20)
+
+        for _ in range(3):
+            enemy.velocity.x = 5
+            enemy.update(1 / 60)
+            assert enemy.velocity.x == 0
+
+        enemy.invulnerable = False
+        enemy.take_damage(100)
+        enemy.velocity.update(5, 5)
+        enemy.update(1 / 60)
+
+        assert enemy.velocity == pygame.math.Vector2(0, 0)
+
+
+class TestAIBehaviorBase:
+    """Tests for the AIBehavior base class."""
+
+    def test_base_update_raises_not_implemented(self) -> None:
+        """Test a behavior without update() fails loudly when ticked."""
+        behavior = AIBehavior()
+
+        with pytest.raises(NotImplementedError):
+            behavior.update(MockEntity((0, 0)), 1 / 60, None)
+
+
 class TestPatrolBehavior:
     """Tests for PatrolBehavior class."""
 
@@ -316,6 +505,16 @@ class TestPatrolBehavior:
 
         assert result == "chase"
 
+    def test_detects_target_at_exact_range_diagonal(self) -> None:
+        """Test squared-distance check includes targets exactly at range."""
+        behavior = PatrolBehavior([(0, 0)], detection_range=50)
+        entity = MockEntity((0, 0))
+        target = MockEntity((30, 40))
+
+        result = behavior.update(entity, 1 / 60, target)
+
+        assert result == "chase"
+
     def test_empty_patrol_points(self) -> None:
         """Test behavior handles empty patrol points."""
         behavior = PatrolBehavior([])
@@ -387,6 +586,16 @@ class TestChaseBehavior:
 
         assert result == "patrol"
 
+    def test_keeps_chasing_just_inside_lost_range(self) -> None:
+        """Test chase continues while target is within 1.5x detection range."""
+        behavior = ChaseBehavior(detection_range=100)
+        entity = MockEntity((0, 0))
+        target = MockEntity((90, 120))
+
+        result = behavior.update(entity, 1 / 60, target)
+
+        assert result is None
+
 
 class TestAttackBehavior:
     """Tests for AttackBehavior class."""
@@ -473,6 +682,21 @@ class TestAttackBehavior:
         assert first_hitbox is not None
         assert second_hitbox is None
 
+    def test_attack_hitbox_reused_between_attacks(self) -> None:
+        """Test the same Rect is repositioned instead of reallocated."""
+        behavior = AttackBehavior(cooldown=0.0)
+        entity = MockEntity((0, 0))
+        target = MockEntity((30, 0))
+
+        behavior.update(entity, 1 / 60, target)
+        first_hitbox = behavior.get_attack_hitbox()
+        entity.set_position(10, 0)
+        behavior.update(entity, 1 / 60, target)
+        second_hitbox = behavior.get_attack_hitbox()
+
+        assert second_hitbox is first_hitbox
+        assert second_hitbox.left == entity.hitbox.right
+
 
 class TestHurtBehavior:
     """Tests for HurtBehavior class."""
@@ -677,6 +901,11 @@ class TestUtilityScore:
         result = UtilityScore.logistic(0.5, 10.0, 0.5)
         assert result == pytest.approx(0.5, rel=0.1)
 
+    def test_logistic_saturates_without_overflow(self) -> None:
+        """Test extreme inputs clamp to 0 and 1 instead of overflowing."""
+        assert UtilityScore.logistic(-1000.0, 10.0, 0.5) == 0.0
+        assert UtilityScore.logistic(1000.0, 10.0, 0.5) == 1.0
+
 
 class TestAIContext:
     """Tests for AIContext data class."""
@@ -684,11 +913,11 @@ class TestAIContext:
     def test_context_creation(self) -> None:
         """Test AIContext can be created."""
         context = AIContext(
-            entity_pos=pygame.math.Vector2(0, 0),
+            entity_pos=(0, 0),
             entity_health=100,
             entity_max_health=100,
-            target_pos=pygame.math.Vector2(50, 0),
-            target_velocity=pygame.math.Vector2(1, 0),
+            target_pos=(50, 0),
+            target_velocity=(1, 0),
             target_health=80,
             distance_to_target=50.0,
             detection_range=200.0,
@@ -698,6 +927,22 @@ class TestAIContext:
 
         assert context.entity_health == 100
         assert context.distance_to_target == 50.0
+        assert not hasattr(context, "__dict__")
+
+    def test_built_context_snapshots_positions(self) -> None:
+        """Test controller contexts hold tuples, not the entities' vectors."""
+        controller = AIController()
+        entity = MockEntity((0, 0))
+        target = MockEntity((30, 40))
+        target.velocity.x = 2.0
+
+        context = controller._build_context(entity, target)
+        target.pos.x = 500
+
+        assert context.entity_pos == (0, 0)
+        assert context.target_pos == (30, 40)
+        assert context.target_velocity == (2.0, 0)
+        assert context.distance_to_target == 50.0
 
 
 class TestAIDecisionMaker:
@@ -715,7 +960,7 @@ class TestAIDecisionMaker:
         dm = AIDecisionMaker(randomness=0.0)
 
         context = AIContext(
-            entity_pos=pygame.math.Vector2(0, 0),
+            entity_pos=(0, 0),
             entity_health=100,
             entity_max_health=100,
             target_pos=None,
@@ -735,11 +980,11 @@ class TestAIDecisionMaker:
         dm = AIDecisionMaker(randomness=0.0, aggression=0.8)
 
         context = AIContext(
-            entity_pos=pygame.math.Vector2(0, 0),
+            entity_pos=(0, 0),
             entity_health=100,
             entity_max_health=100,
-            target_pos=pygame.math.Vector2(30, 0),
-            target_velocity=pygame.math.Vector2(0, 0),
+            target_pos=(30, 0),
+            target_velocity=(0, 0),
             target_health=80,
             distance_to_target=30.0,
             detection_range=200.0,
@@ -755,11 +1000,11 @@ class TestAIDecisionMaker:
         dm = AIDecisionMaker(randomness=0.0, aggression=0.0)
 
         context = AIContext(
-            entity_pos=pygame.math.Vector2(0, 0),
+            entity_pos=(0, 0),
             entity_health=15,  # Very low health
             entity_max_health=100,
-            target_pos=pygame.math.Vector2(30, 0),
-            target_velocity=pygame.math.Vector2(0, 0),
+            target_pos=(30, 0),
+            target_velocity=(0, 0),
             target_health=80,
             distance_to_target=30.0,
             detection_range=200.0,
@@ -776,11 +1021,11 @@ class TestAIDecisionMaker:
         high_aggression = AIDecisionMaker(randomness=0.0, aggression=0.9)
 
         context = AIContext(
-            entity_pos=pygame.math.Vector2(0, 0),
+            entity_pos=(0, 0),
             entity_health=40,
             entity_max_health=100,
-            target_pos=pygame.math.Vector2(60, 0),
-            target_velocity=pygame.math.Vector2(0, 0),
+            target_pos=(60, 0),
+            target_velocity=(0, 0),
             target_health=80,
             distance_to_target=60.0,
             detection_range=200.0,
@@ -795,6 +1040,51 @@ class TestAIDecisionMaker:
         # Low aggression might retreat
         assert low_action != high_action or low_action in [AIAction.CHASE, AIAction.RETREAT]
 
+    def test_evaluate_action_uses_matching_evaluator(self) -> None:
+        """Test each action is scored by its own evaluator."""
+        dm = AIDecisionMaker(randomness=0.0)
+        context = AIContext(
+            entity_pos=(0, 0),
+            entity_health=100,
+            entity_max_health=100,
+            target_pos=None,
+            target_velocity=None,
+            target_health=None,
+            distance_to_target=float("inf"),
+            detection_range=200.0,
+            attack_range=50.0,
+            time_since_last_attack=1.0,
+        )
+
+        assert dm.evaluate_action(AIAction.PATROL, context) == 0.9
+        assert dm.evaluate_action(AIAction.CHASE, context) == 0.0
+        assert dm.evaluate_action(AIAction.IDLE, context) == 0.1
+
+    def test_fast_path_skips_evaluators(self) -> None:
+        """Test clear-cut contexts are decided without utility scoring."""
+        dm = AIDecisionMaker(randomness=0.0, aggression=0.0)
+        dm._evaluators = ()
+        context = AIContext(
+            entity_pos=(0, 0),
+            entity_health=100,
+            entity_max_health=100,
+            target_pos=(400, 0),
+            target_velocity=(0, 0),
+            target_health=80,
+            distance_to_target=400.0,
+            detection_range=200.0,
+            attack_range=50.0,
+            time_since_last_attack=1.0,
+        )
+
+        assert dm.decide(context) == AIAction.PATROL
+
+        context.distance_to_target = 30.0
+        assert dm.decide(context) == AIAction.ATTACK
+
+        context.entity_health = 10
+        assert dm.decide(context) == AIAction.RETREAT
+
 
 class TestAIController:
     """Tests for AIController central AI manager."""
@@ -838,6 +1128,40 @@ class TestAIController:
         # or stayed still if already at waypoint
         assert controller.current_behavior is not None
 
+    def test_smart_decision_skipped_when_context_unchanged(self) -> None:
+        """Test decide() only runs again once the coarse context changes."""
+        controller = AIController(randomness=0.0)
+        controller.register_behavior(PatrolBehavior([(0, 0)]))
+        calls = []
+        decide = controller.decision_maker.decide
+        controller.decision_maker.decide = lambda context: calls.append(1) or decide(context)
+        entity = SmartEnemy((0, 0))
+        target = MockEntity((150, 0))
+        controller._time_since_attack = 1.0
+
+        controller._make_smart_decision(entity, target)
+        controller._make_smart_decision(entity, target)
+        assert len(calls) == 1
+
+        target.pos.x = 60
+        controller._make_smart_decision(entity, target)
+        assert len(calls) == 2
+
+    def test_action_table_resolves_fallbacks_on_register(self) -> None:
+        """Test action-to-behavior fallbacks follow the registered behaviors."""
+        controller = AIController()
+        index = AIDecisionMaker._ACTION_INDEX
+
+        assert controller._action_to_behavior[index[AIAction.PREDICT]] == "chase"
+        assert controller._action_to_behavior[index[AIAction.RETREAT]] == "patrol"
+
+        controller.register_behavior(SmartChaseBehavior())
+        controller.register_behavior(RetreatBehavior())
+
+        assert controller._action_to_behavior[index[AIAction.PREDICT]] == "smart_chase"
+        assert controller._action_to_behavior[index[AIAction.CHASE]] == "smart_chase"
+        assert controller._action_to_behavior[index[AIAction.RETREAT]] == "retreat"
+
 
 class TestSmartChaseBehavior:
     """Tests for SmartChaseBehavior with prediction."""
@@ -864,6 +1188,21 @@ class TestSmartChaseBehavior:
         # Entity should be moving toward predicted position
         assert entity.velocity.x > 0
 
+    def test_tracks_target_velocity_in_place(self) -> None:
+        """Test target velocity is measured from successive positions."""
+        behavior = SmartChaseBehavior()
+        entity = MockEntity((0, 0))
+        target = MockEntity((100, 0))
+
+        behavior.update(entity, 0.1, target)
+        assert behavior._target_vx == 0.0
+
+        target.pos.x = 110
+        behavior.update(entity, 0.1, target)
+
+        assert behavior._target_vx == pytest.approx(100)
+        assert behavior._last_target_x == 110
+
 
 class TestFlankBehavior:
     """Tests for FlankBehavior."""
@@ -4,7 +4,7 @@ Tests for InputHandler.
 
 import pygame
 
-from src.systems.input_handler import InputHandler, DEFAULT_BINDINGS
+from src.systems.input_handler import ACTION_BITS, DEFAULT_BINDINGS, InputHandler
 
 
 class TestInputHandlerInitialization:
@@ -18,17 +18,17 @@ class TestInputHandlerInitialization:
     def test_initialization_empty_pressed(self):
         """Test input handler starts with no pressed actions."""
         handler = InputHandler()
-        assert len(handler._pressed) == 0
+        assert handler._pressed_mask == 0
 
     def test_initialization_empty_just_pressed(self):
         """Test input handler starts with no just pressed actions."""
         handler = InputHandler()
-        assert len(handler._just_pressed) == 0
+        assert handler.just_pressed_mask == 0
 
     def test_initialization_empty_just_released(self):
         """Test input handler starts with no just released actions."""
         handler = InputHandler()
-        assert len(handler._just_released) == 0
+        assert handler._just_released_mask == 0
 
 
 class TestInputHandlerActions:
@@ -37,35 +37,35 @@ class TestInputHandlerActions:
     def test_is_action_pressed_returns_false_when_not_pressed(self):
         """Test is_action_pressed returns False when action not pressed."""
         handler = InputHandler()
-        assert handler.is_action_pressed("move_left") is False
+        assert handler.is_action_pressed(ACTION_BITS["move_left"]) is False
 
     def test_is_action_pressed_returns_true_when_pressed(self):
         """Test is_action_pressed returns True when action is pressed."""
         handler = InputHandler()
-        handler._pressed.add("move_left")
-        assert handler.is_action_pressed("move_left") is True
+        handler._pressed_mask |= ACTION_BITS["move_left"]
+        assert handler.is_action_pressed(ACTION_BITS["move_left"]) is True
 
     def test_is_action_just_pressed_returns_false_when_not_just_pressed(self):
         """Test is_action_just_pressed returns False when not just pressed."""
         handler = InputHandler()
-        assert handler.is_action_just_pressed("jump") is False
+        assert handler.is_action_just_pressed(ACTION_BITS["jump"]) is False
 
     def test_is_action_just_pressed_returns_true_when_just_pressed(self):
         """Test is_action_just_pressed returns True when just pressed."""
         handler = InputHandler()
-        handler._just_pressed.add("jump")
-        assert handler.is_action_just_pressed("jump") is True
+        handler.just_pressed_mask |= ACTION_BITS["jump"]
+        assert handler.is_action_just_pressed(ACTION_BITS["jump"]) is True
 
     def test_is_action_just_released_returns_false_when_not_released(self):
         """Test is_action_just_released returns False when not just released."""
         handler = InputHandler()
-        assert handler.is_action_just_released("dash") is False
+        assert handler.is_action_just_released(ACTION_BITS["dash"]) is False
 
     def test_is_action_just_released_returns_true_when_just_released(self):
         """Test is_action_just_released returns True when just released."""
         handler = InputHandler()
-        handler._just_released.add("dash")
-        assert handler.is_action_just_released("dash") is True
+        handler._just_released_mask |= ACTION_BITS["dash"]
+        assert handler.is_action_just_released(ACTION_BITS["dash"]) is True
 
 
 class TestInputHandlerHorizontalAxis:
@@ -79,20 +79,20 @@ class TestInputHandlerHorizontalAxis:
     def test_get_horizontal_axis_negative_when_left_pressed(self):
         """Test get_horizontal_axis returns -1 when left pressed."""
         handler = InputHandler()
-        handler._pressed.add("move_left")
+        handler._pressed_mask |= ACTION_BITS["move_left"]
         assert handler.get_horizontal_axis() == -1
 
     def test_get_horizontal_axis_positive_when_right_pressed(self):
         """Test get_horizontal_axis returns 1 when right pressed."""
         handler = InputHandler()
-        handler._pressed.add("move_right")
+        handler._pressed_mask |= ACTION_BITS["move_right"]
         assert handler.get_horizontal_axis() == 1
 
     def test_get_horizontal_axis_zero_when_both_pressed(self):
         """Test get_horizontal_axis returns 0 when both pressed."""
         handler = InputHandler()
-        handler._pressed.add("move_left")
-        handler._pressed.add("move_right")
+        handler._pressed_mask |= ACTION_BITS["move_left"]
+        handler._pressed_mask |= ACTION_BITS["move_right"]
         assert handler.get_horizontal_axis() == 0
 
 
@@ -102,23 +102,23 @@ class TestInputHandlerReset:
     def test_reset_clears_pressed(self):
         """Test reset clears pressed actions."""
         handler = InputHandler()
-        handler._pressed.add("jump")
+        handler._pressed_mask |= ACTION_BITS["jump"]
         handler.reset()
-        assert len(handler._pressed) == 0
+        assert handler._pressed_mask == 0
 
     def test_reset_clears_just_pressed(self):
         """Test reset clears just pressed actions."""
         handler = InputHandler()
-        handler._just_pressed.add("jump")
+        handler.just_pressed_mask |= ACTION_BITS["jump"]
         handler.reset()
-        assert len(handler._just_pressed) == 0
+        assert handler.just_pressed_mask == 0
 
     def test_reset_clears_just_released(self):
         """Test reset clears just released actions."""
         handler = InputHandler()
-        handler._just_released.add("jump")
+        handler._just_released_mask |= ACTION_BITS["jump"]
         handler.reset()
-        assert len(handler._just_released) == 0
+        assert handler._just_released_mask == 0
 
 
 class TestInputHandlerDefaultBindings:
@@ -158,3 +158,107 @@ class TestInputHandlerDefaultBindings:
         """Test pause binding exists."""
         assert "pause" in DEFAULT_BINDINGS
         assert pygame.K_ESCAPE in DEFAULT_BINDINGS["pause"]
+
+
+class TestInputHandlerMasks:
+    """Tests for bitmask input state."""
+
+    def test_action_bits_are_unique_single_bits(self):
+        """Test every action maps to its own single bit."""
+        bits = list(ACTION_BITS.values())
+        assert len(set(bits)) == len(bits)
+        assert all(bit and bit & (bit - 1) == 0 for bit in bits)
+
+    def test_action_bits_cover_default_bindings(self):
+        """Test every default binding has an action bit."""
+        assert set(ACTION_BITS) == set(DEFAULT_BINDINGS)
+
+    def test_just_pressed_mask_drives_is_action_just_pressed(self):
+        """Test is_action_just_pressed reads the just-pressed mask."""
+        handler = InputHandler()
+        handler.just_pressed_mask = ACTION_BITS["dash"] | ACTION_BITS["jump"]
+        assert handler.is_action_just_pressed(ACTION_BITS["dash"]) is True
+        assert handler.is_action_just_pressed(ACTION_BITS["jump"]) is True
+        assert handler.is_action_just_pressed(ACTION_BITS["attack"]) is False
+
+
+class TestInputHandlerEventQueue:
+    """Tests for buffered key-down events."""
+
+    def test_handle_event_tap_registers_on_next_update(self):
+        """Test a key tap released before update still counts as just pressed."""
+        handler = InputHandler()
+        handler.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        handler.update()
+        assert handler.is_action_just_pressed(ACTION_BITS["jump"]) is True
+
+    def test_handle_event_ignores_unbound_keys(self):
+        """Test unbound keys are not queued."""
+        handler = InputHandler()
+        handler.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F12))
+        assert len(handler._event_queue) == 0
+
+    def test_consume_just_pressed_fires_once(self):
+        """Test consume_just_pressed clears the action after returning True."""
+        handler = InputHandler()
+        handler.just_pressed_mask = ACTION_BITS["dash"]
+        assert handler.consume_just_pressed(ACTION_BITS["dash"]) is True
+        assert handler.consume_just_pressed(ACTION_BITS["dash"]) is False
+
+    def test_reset_clears_event_queue(self):
+        """Test reset drops queued events."""
+        handler = InputHandler()
+        handler.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_c))
+        handler.reset()
+        assert len(handler._event_queue) == 0
+
+
+class TestInputHandlerRebind:
+    """Tests for changing key bindings at runtime."""
+
+    def test_rebind_updates_event_lookup(self):
+        """Test rebinding routes the new key and drops the old one."""
+        handler = InputHandler()
+        handler.rebind("jump", [pygame.K_UP])
+
+        handler.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        assert len(handler._event_queue) == 0
+        handler.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP))
+        handler.update()
+        assert handler.is_action_just_pressed(ACTION_BITS["jump"]) is True
+
+    def test_rebind_leaves_default_bindings_untouched(self):
+        """Test rebinding one handler does not leak into DEFAULT_BINDINGS."""
+        handler = InputHandler()
+        handler.rebind("attack", [pygame.K_x])
+        assert DEFAULT_BINDINGS["attack"] == [pygame.K_z, pygame.K_j]
+        assert InputHandler().bindings["attack"] == [pygame.K_z, pygame.K_j]
+
+    def test_update_polls_rebound_keys(self, monkeypatch):
+        """Test held-key polling uses the rebuilt binding table."""
+        handler = InputHandler()
+        handler.rebind("dash", [pygame.K_v])
+
+        class HeldKeys:
+            def __getitem__(self, key):
+                return key == pygame.K_v
+
+        monkeypatch.setattr(pygame.key, "get_pressed", HeldKeys)
+        handler.update()
+        assert handler.is_action_pressed(ACTION_BITS["dash"]) is True
+        assert handler.is_action_pressed(ACTION_BITS["jump"]) is False
+
+    def test_key_shared_by_two_actions_presses_both(self, monkeypatch):
+        """Test one held key drives every action it is bound to."""
+        handler = InputHandler()
+        handler.rebind("dash", [pygame.K_SPACE])
+
+        class HeldKeys:
+            def __getitem__(self, key):
+                return key == pygame.K_SPACE
+
+        monkeypatch.setattr(pygame.key, "get_pressed", HeldKeys)
+        handler.update()
+        assert handler.is_action_pressed(ACTION_BITS["jump"]) is True
+        assert handler.is_action_pressed(ACTION_BITS["dash"]) is True
+        assert handler.is_action_pressed(ACTION_BITS["attack"]) is False
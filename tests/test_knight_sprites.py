@@ -1,10 +1,14 @@
 """Tests for knight sprite loading and animations."""
 
+import json
+import os
+
 import pytest
 import pygame
 
 from src.core.resource_manager import ResourceManager
 from src.systems.animation import Animation
+from src.systems.sprite_loader import SpriteLoader
 
 
 class TestKnightSpriteLoading:
@@ -167,3 +171,100 @@ class TestKnightAnimationPlayback:
                 assert (
                     wrapped_frame is early_frame
                 ), f"{anim_name} doesn't wrap correctly"
+
+
+class TestSpriteSheetFrames:
+    """Tests for splitting a sprite sheet into frames."""
+
+    def _write_sheet(self, tmp_path, width: int, height: int) -> str:
+        """Save a sheet with a red and a blue 16px-wide column."""
+        sheet = pygame.Surface((width, height), pygame.SRCALPHA)
+        sheet.fill((255, 0, 0, 255), pygame.Rect(0, 0, 16, height))
+        sheet.fill((0, 0, 255, 255), pygame.Rect(16, 0, 16, height))
+        path = str(tmp_path / "sheet.png")
+        pygame.image.save(sheet, path)
+        return path
+
+    def test_frames_are_views_into_sheet(self, tmp_path) -> None:
+        """Test frames share the sheet's pixels instead of being copied."""
+        path = self._write_sheet(tmp_path, 32, 16)
+
+        frames = SpriteLoader.load_sprite_sheet(path, 16, 16, 2)
+
+        assert [frame.get_parent() is not None for frame in frames] == [True, True]
+        assert frames[0].get_parent() is frames[1].get_parent()
+        assert frames[0].get_at((0, 0))[:3] == (255, 0, 0)
+        assert frames[1].get_at((0, 0))[:3] == (0, 0, 255)
+
+    def test_copy_frames_returns_standalone_surfaces(self, tmp_path) -> None:
+        """Test copy_frames detaches frames from the sheet."""
+        path = self._write_sheet(tmp_path, 32, 16)
+
+        frames = SpriteLoader.load_sprite_sheet(path, 16, 16, 2, copy_frames=True)
+
+        assert all(frame.get_parent() is None for frame in frames)
+        assert frames[1].get_at((0, 0))[:3] == (0, 0, 255)
+
+    def test_frames_past_sheet_edge_are_clipped(self, tmp_path) -> None:
+        """Test a sheet shorter than declared still yields full-size frames."""
+        path = self._write_sheet(tmp_path, 32, 10)
+
+        frames = SpriteLoader.load_sprite_sheet(path, 16, 16, 3)
+
+        assert [frame.get_size() for frame in frames] == [(16, 16)] * 3
+        assert frames[0].get_at((0, 0))[:3] == (255, 0, 0)
+        assert frames[2].get_at((0, 0)).a == 0
+
+
+class TestSpriteLoaderCache:
+    """Tests for memoized sheet and config loading."""
+
+    def setup_method(self) -> None:
+        """Start each test with empty loader caches."""
+        SpriteLoader.clear_cache()
+
+    def teardown_method(self) -> None:
+        """Drop sheets loaded from temporary files."""
+        SpriteLoader.clear_cache()
+
+    def _write_config(self, tmp_path, frames: int) -> str:
+        """Save a one-animation config and its 32x16 sheet."""
+        pygame.image.save(pygame.Surface((32, 16), pygame.SRCALPHA), str(tmp_path / "idle.png"))
+        path = tmp_path / "config.json"
+        animations = {"idle": {"file": "idle.png", "frames": frames}}
+        path.write_text(json.dumps({"frame_height": 16, "animations": animations}))
+        return str(path)
+
+    def test_repeat_loads_share_one_decoded_sheet(self, tmp_path) -> None:
+        """Test loading a sheet twice decodes it only once."""
+        path = str(tmp_path / "sheet.png")
+        pygame.image.save(pygame.Surface((32, 16), pygame.SRCALPHA), path)
+
+        first = SpriteLoader.load_sprite_sheet(path, 16, 16, 2)
+        second = SpriteLoader.load_sprite_sheet(path, 16, 16, 2)
+
+        assert first[0].get_parent() is second[0].get_parent()
+
+    def test_config_reparsed_after_file_changes(self, tmp_path) -> None:
+        """Test an edited config file is picked up on the next load."""
+        path = self._write_config(tmp_path, frames=2)
+        animations = SpriteLoader.load_animations_from_config(path, str(tmp_path))
+        assert len(animations["idle"].frames) == 2
+
+        self._write_config(tmp_path, frames=4)
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+        animations = SpriteLoader.load_animations_from_config(path, str(tmp_path))
+        assert len(animations["idle"].frames) == 4
+
+    def test_clear_cache_forgets_sheets(self, tmp_path) -> None:
+        """Test clear_cache forces the next load to decode again."""
+        path = str(tmp_path / "sheet.png")
+        pygame.image.save(pygame.Surface((32, 16), pygame.SRCALPHA), path)
+        first = SpriteLoader.load_sprite_sheet(path, 16, 16, 2)
+
+        SpriteLoader.clear_cache()
+
+        second = SpriteLoader.load_sprite_sheet(path, 16, 16, 2)
+        assert second[0].get_parent() is not first[0].get_parent()
@@ -265,6 +265,19 @@ class TestCamera:
         assert camera.offset.x < 0  # Should move left
         assert abs(camera.offset.x - camera.target_offset.x) < abs(camera.target_offset.x)
 
+    def test_lerp_is_framerate_independent(self) -> None:
+        """Test two half-length frames ease as far as one full frame."""
+        coarse = Camera(1280, 720)
+        fine = Camera(1280, 720)
+        target_pos = pygame.math.Vector2(1000, 500)
+
+        coarse.update(target_pos, 1 / 60)
+        fine.update(target_pos, 1 / 120)
+        fine.update(target_pos, 1 / 120)
+
+        assert fine.offset.x == pytest.approx(coarse.offset.x)
+        assert fine.offset.y == pytest.approx(coarse.offset.y)
+
     def test_set_bounds(self) -> None:
         """Test set_bounds sets camera bounds."""
         camera = Camera(1280, 720)
@@ -300,6 +313,15 @@ class TestCamera:
         max_offset = -(3200 - 1280)
         assert camera.offset.x >= max_offset
 
+    def test_bounds_narrower_than_screen_pin_to_right_limit(self) -> None:
+        """Test a level narrower than the screen keeps the old clamp order."""
+        camera = Camera(1280, 720)
+        camera.set_bounds(640, 1440)
+
+        camera.update(pygame.math.Vector2(0, 360), 1 / 60)
+
+        assert camera.offset.x == 640
+
     def test_camera_clamped_at_top_bound(self) -> None:
         """Test camera clamped at top bound."""
         camera = Camera(1280, 720)
@@ -326,6 +348,41 @@ class TestCamera:
         max_offset = -(1440 - 720)
         assert camera.offset.y >= max_offset
 
+    def test_set_screen_size_recenters_and_rebounds(self) -> None:
+        """Test resizing the viewport updates centering and bound limits."""
+        camera = Camera(1280, 720)
+        camera.set_bounds(3200, 1440)
+
+        camera.set_screen_size(640, 360)
+        camera.update(pygame.math.Vector2(1000, 500), 1 / 60)
+
+        assert camera.target_offset.x == -1000 + 320
+        assert camera.target_offset.y == -500 + 180
+        assert camera._max_ox == -(3200 - 640)
+
+    def test_assigning_screen_width_recenters_and_rebounds(self) -> None:
+        """Test setting screen_width directly behaves like set_screen_size."""
+        camera = Camera(1280, 720)
+        camera.set_bounds(3200, 1440)
+
+        camera.screen_width = 640
+        camera.update(pygame.math.Vector2(1000, 500), 1 / 60)
+
+        assert camera.screen_width == 640
+        assert camera.target_offset.x == -1000 + 320
+        assert camera._max_ox == -(3200 - 640)
+
+    def test_unbounded_camera_follows_past_origin(self) -> None:
+        """Test an unbounded camera may scroll to positive offsets."""
+        camera = Camera(1280, 720)
+        camera.offset.x = 100
+        camera.offset.y = 100
+
+        camera.update(pygame.math.Vector2(0, 0), 1 / 60)
+
+        assert camera.offset.x > 100
+        assert camera.offset.y > 100
+
     def test_screen_shake_triggers(self) -> None:
         """TC-009-5: Screen shake changes camera offset."""
         camera = Camera(1280, 720)
@@ -350,6 +407,16 @@ class TestCamera:
         # but we can verify shake was applied
         assert camera.shake_timer < 1.0  # Timer decreased
 
+    def test_screen_shake_offset_within_intensity(self) -> None:
+        """Test every shake frame stays inside the intensity bounds."""
+        camera = Camera(1280, 720)
+        camera.screen_shake(0.5, 10.0)
+
+        for _ in range(40):
+            camera.update(pygame.math.Vector2(0, 0), 1 / 120)
+            assert -10.0 <= camera._shake_ox <= 10.0
+            assert -10.0 <= camera._shake_oy <= 10.0
+
     def test_screen_shake_decays_over_time(self) -> None:
         """Test screen shake timer decreases over time."""
         camera = Camera(1280, 720)
@@ -368,8 +435,8 @@ class TestCamera:
         camera.update(pygame.math.Vector2(0, 0), 0.2)
 
         assert camera.shake_timer == 0.0
-        assert camera._shake_offset.x == 0
-        assert camera._shake_offset.y == 0
+        assert camera._shake_ox == 0
+        assert camera._shake_oy == 0
 
     def test_get_offset_returns_vector2(self) -> None:
         """Test get_offset returns Vector2."""
@@ -384,14 +451,25 @@ class TestCamera:
         camera = Camera(1280, 720)
         camera.offset.x = -100
         camera.offset.y = -50
-        camera._shake_offset.x = 5
-        camera._shake_offset.y = 3
+        camera._shake_ox = 5
+        camera._shake_oy = 3
 
         offset = camera.get_offset()
 
         assert offset.x == -95
         assert offset.y == -47
 
+    def test_get_offset_xy_matches_get_offset(self) -> None:
+        """Test the tuple offset equals the Vector2 offset, shake included."""
+        camera = Camera(1280, 720)
+        camera.offset.x = -100
+        camera.offset.y = -50
+        camera._shake_ox = 5
+        camera._shake_oy = 3
+
+        assert camera.get_offset_xy() == (-95, -47)
+        assert camera.get_offset() == pygame.math.Vector2(camera.get_offset_xy())
+
     def test_world_to_screen_conversion(self) -> None:
         """Test world_to_screen converts coordinates correctly."""
         camera = Camera(1280, 720)
@@ -415,3 +493,24 @@ class TestCamera:
 
         assert world_pos.x == 200  # 100 + 100
         assert world_pos.y == 300  # 250 + 50
+
+    def test_world_to_screen_xy_includes_shake(self) -> None:
+        """Test tuple conversion applies offset and shake, and round-trips."""
+        camera = Camera(1280, 720)
+        camera.offset.x = -100
+        camera.offset.y = -50
+        camera._shake_ox = 2
+
+        assert camera.world_to_screen_xy(200, 300) == (102, 250)
+        assert camera.screen_to_world_xy(102, 250) == (200, 300)
+
+    def test_world_to_screen_batch(self) -> None:
+        """Test batch conversion matches the per-point conversion."""
+        camera = Camera(1280, 720)
+        camera.offset.x = -100
+        camera.offset.y = -50
+
+        xs, ys = camera.world_to_screen_batch([0, 200], [10, 300])
+
+        assert xs == [-100, 100]
+        assert ys == [-40, 250]
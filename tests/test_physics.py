@@ -160,3 +160,59 @@ class TestPhysicsBodyCollisionFlags:
         assert body.on_wall_left is False
         assert body.on_wall_right is False
         assert body.on_ceiling is False
+
+    def test_on_wall_tracks_either_side(self) -> None:
+        """Test on_wall is kept in sync with left/right wall flags."""
+        body = PhysicsBody()
+        assert body.on_wall is False
+
+        body.on_wall_left = True
+        assert body.on_wall is True
+
+        body.on_wall_right = True
+        body.on_wall_left = False
+        assert body.on_wall is True
+
+        body.on_wall_right = False
+        assert body.on_wall is False
+
+    def test_reset_collision_flags_clears_on_wall(self) -> None:
+        """Test reset_collision_flags clears the combined wall flag."""
+        body = PhysicsBody()
+        body.on_wall_right = True
+
+        body.reset_collision_flags()
+
+        assert body.on_wall is False
+
+
+class TestPhysicsBodyStep:
+    """Tests for the combined per-frame physics step."""
+
+    @pytest.mark.parametrize("on_ground", [False, True])
+    @pytest.mark.parametrize("gravity_enabled", [False, True])
+    @pytest.mark.parametrize("friction", [0.0, 0.2])
+    @pytest.mark.parametrize("velocity", [(4.0, 3.0), (0.05, 14.9), (-2.0, -6.0)])
+    def test_step_matches_split_methods(
+        self, on_ground: bool, gravity_enabled: bool, friction: float, velocity: tuple
+    ) -> None:
+        """Test step() gives the same velocity as gravity then friction."""
+        combined, split = PhysicsBody(), PhysicsBody()
+        for body in (combined, split):
+            body.on_ground = on_ground
+            body.gravity_enabled = gravity_enabled
+            body.velocity.update(velocity)
+
+        combined.step(1 / 60, friction)
+        split.apply_gravity(1 / 60)
+        if friction:
+            split.apply_friction(friction, 1 / 60)
+
+        assert combined.velocity == split.velocity
+
+    def test_body_has_no_instance_dict(self) -> None:
+        """Test PhysicsBody uses slots, so typos cannot add stray attributes."""
+        body = PhysicsBody()
+        assert not hasattr(body, "__dict__")
+        with pytest.raises(AttributeError):
+            body.on_grund = True  # type: ignore[attr-defined]
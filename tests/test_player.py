@@ -3,9 +3,13 @@ Tests for Player entity and FSM states.
 """
 
 from src.entities.player import Player
+from src.states.state import STATE_FALL, STATE_IDLE, STATE_RUN, ground_transition
+from src.systems.input_handler import ACTION_BITS
 from src.systems.physics import PhysicsBody
 from src.core.settings import (
+    DASH_DURATION_TICKS,
     DASH_SPEED,
+    FPS,
     JUMP_FORCE,
     WALL_SLIDE_SPEED,
 )
@@ -90,6 +94,12 @@ class TestPlayerStates:
         player = Player((0, 0))
         assert "dash" in player.states
 
+    def test_registered_states_are_slotted(self):
+        """Test no registered state carries a per-instance __dict__."""
+        player = Player((0, 0))
+        for state in player.states.values():
+            assert not hasattr(state, "__dict__"), state.name
+
 
 class TestPlayerStateTransitions:
     """Tests for Player state transitions."""
@@ -124,6 +134,15 @@ class TestPlayerStateTransitions:
         player.change_state("unknown_state")
         assert player.get_current_state_name() == "idle"
 
+    def test_change_state_reuses_state_instances(self):
+        """Test transitions reuse the states built at init."""
+        player = Player((0, 0))
+        dash_state = player.states["dash"]
+        player.change_state("dash")
+        player.change_state("idle")
+        player.change_state("dash")
+        assert player.current_state is dash_state
+
 
 class TestIdleState:
     """Tests for IdleState."""
@@ -195,7 +214,7 @@ class TestFallState:
         player.change_state("fall")
         player.physics.on_ground = True
         # Simulate right input
-        player.input_handler._pressed.add("move_right")
+        player.input_handler._pressed_mask |= ACTION_BITS["move_right"]
         next_state = player.current_state.handle_input()
         assert next_state == "run"
 
@@ -281,6 +300,46 @@ class TestDashState:
         player.change_state("idle")
         assert player.physics.gravity_enabled is True
 
+    def test_update_keeps_dash_velocity(self):
+        """Test dash velocity set on enter persists through updates."""
+        player = Player((0, 0))
+        player.facing_right = True
+        player.change_state("dash")
+        player.update(0.01)
+        assert player.physics.velocity.x == DASH_SPEED
+        assert player.physics.velocity.y == 0
+
+    def test_dash_lasts_duration_ticks_at_frame_rate(self):
+        """Test dash ends after exactly DASH_DURATION_TICKS frames."""
+        player = Player((0, 0))
+        player.change_state("dash")
+        state = player.current_state
+        for _ in range(DASH_DURATION_TICKS - 1):
+            assert state.update(1 / FPS) is None
+        assert state.update(1 / FPS) is not None
+
+    def test_dash_long_frame_consumes_multiple_ticks(self):
+        """Test a frame spanning the whole dash ends it immediately."""
+        player = Player((0, 0))
+        player.change_state("dash")
+        assert player.current_state.update(DASH_DURATION_TICKS / FPS) is not None
+
+
+class TestGroundTransition:
+    """Tests for the shared ground_transition helper."""
+
+    def test_airborne_returns_fall(self):
+        """Test airborne player classifies as fall."""
+        assert ground_transition(False, 1) == STATE_FALL
+
+    def test_grounded_with_input_returns_run(self):
+        """Test grounded player with horizontal input classifies as run."""
+        assert ground_transition(True, -1) == STATE_RUN
+
+    def test_grounded_without_input_returns_idle(self):
+        """Test grounded player without input classifies as idle."""
+        assert ground_transition(True, 0) == STATE_IDLE
+
 
 class TestPlayerAnimations:
     """Tests for Player animations."""
@@ -346,3 +405,22 @@ class TestPlayerUpdate:
         initial_time = player.animation.animation_time
         player.update(1 / 60)
         assert player.animation.animation_time > initial_time
+
+
+class TestTransitionTable:
+    """Tests for table-driven input transitions."""
+
+    def test_dash_takes_priority_over_jump(self):
+        """Test dash wins when dash and jump are pressed together."""
+        player = Player((0, 0))
+        player.physics.on_ground = True
+        player.input_handler.just_pressed_mask = ACTION_BITS["jump"] | ACTION_BITS["dash"]
+        assert player.current_state.handle_input() == "dash"
+
+    def test_jump_ignored_when_airborne(self):
+        """Test jump entry is skipped while not on ground."""
+        player = Player((0, 0))
+        player.change_state("run")
+        player.physics.on_ground = False
+        player.input_handler.just_pressed_mask = ACTION_BITS["jump"]
+        assert player.current_state.handle_input() == "fall"
@@ -0,0 +1,66 @@
+"""Tests for the timer system."""
+
+from src.systems.timers import TimerSystem
+
+
+class TestTimerSystem:
+    """Tests for TimerSystem scheduling and firing."""
+
+    def test_callback_fires_after_delay(self) -> None:
+        """Test a timer fires once its delay has elapsed."""
+        timers = TimerSystem()
+        fired = []
+        timers.schedule(0.1, lambda: fired.append(True))
+
+        timers.update(0.05)
+        assert fired == []
+
+        timers.update(0.05)
+        assert fired == [True]
+
+    def test_callbacks_fire_in_expiry_order(self) -> None:
+        """Test timers expiring on the same frame fire earliest first."""
+        timers = TimerSystem()
+        fired = []
+        timers.schedule(0.3, lambda: fired.append("late"))
+        timers.schedule(0.1, lambda: fired.append("early"))
+
+        assert timers.update(0.5) == 2
+        assert fired == ["early", "late"]
+
+    def test_cancelled_timer_does_not_fire(self) -> None:
+        """Test a cancelled timer is dropped without calling back."""
+        timers = TimerSystem()
+        fired = []
+        timer = timers.schedule(0.1, lambda: fired.append(True))
+
+        timers.cancel(timer)
+        timers.update(1.0)
+
+        assert fired == []
+        assert timer.active is False
+        assert len(timers) == 0
+
+    def test_callback_fires_only_once(self) -> None:
+        """Test a fired timer is not run again on later updates."""
+        timers = TimerSystem()
+        fired = []
+        timer = timers.schedule(0.1, lambda: fired.append(True))
+
+        timers.update(0.2)
+        timers.update(0.2)
+
+        assert fired == [True]
+        assert timer.active is False
+
+    def test_clear_drops_pending_timers(self) -> None:
+        """Test clear() discards timers without firing them."""
+        timers = TimerSystem()
+        fired = []
+        timers.schedule(0.1, lambda: fired.append(True))
+
+        timers.clear()
+        timers.update(1.0)
+
+        assert fired == []
+        assert len(timers) == 0
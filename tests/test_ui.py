@@ -4,6 +4,7 @@ import pytest
 import pygame
 
 from src.core.game import Game
+from src.entities.enemy import Enemy
 from src.ui.widgets import Button, create_button
 from src.ui.hud import HUD
 from src.ui.screens.base_screen import BaseScreen
@@ -180,6 +181,57 @@ class TestHUD:
         # Should not raise exception
         hud.update(player_data)
 
+    def test_hud_reuses_text_surfaces_until_values_change(
+        self, mock_screen: pygame.Surface
+    ) -> None:
+        """Test HUD text is only re-rendered when the displayed value changes."""
+        hud = HUD()
+        player_data = {"health": 80, "max_health": 100, "score": 10, "time": 5.2}
+
+        hud.render(mock_screen, player_data)
+        score_surface = hud._text_cache["score"][1]
+        time_surface = hud._text_cache["time"][1]
+
+        # Same second and score: nothing is re-rendered
+        hud.render(mock_screen, {**player_data, "time": 5.9})
+        assert hud._text_cache["score"][1] is score_surface
+        assert hud._text_cache["time"][1] is time_surface
+
+        hud.render(mock_screen, {**player_data, "score": 20})
+        assert hud._text_cache["score"][1] is not score_surface
+        assert hud._text_cache["score"][0] == "Score: 0020"
+
+    def test_hud_glyph_text_matches_font_render(self) -> None:
+        """Test text assembled from cached glyphs looks like a full render."""
+        hud = HUD()
+        assert hud._use_glyphs is True
+
+        composed = hud._compose("Time: 12:07")
+        rendered = hud.font.render("Time: 12:07", True, (255, 255, 255))
+
+        assert composed.get_size() == rendered.get_size()
+        assert pygame.image.tobytes(composed, "RGBA") == pygame.image.tobytes(rendered, "RGBA")
+
+    def test_hud_chrome_draws_border_and_background(self, mock_screen: pygame.Surface) -> None:
+        """Test the pre-rendered chrome keeps the white border and black bar."""
+        hud = HUD()
+        mock_screen.fill((0, 255, 0))
+        hud.render(mock_screen, {"health": 0, "max_health": 100})
+
+        x, y = hud.health_bar_x, hud.health_bar_y
+        assert mock_screen.get_at((x - 2, y - 2))[:3] == (255, 255, 255)
+        assert mock_screen.get_at((x + 5, y + 5))[:3] == (0, 0, 0)
+
+    def test_hud_health_fill_covers_current_health(self, mock_screen: pygame.Surface) -> None:
+        """Test the red fill spans the health fraction of the bar."""
+        hud = HUD()
+        hud.render(mock_screen, {"health": 50, "max_health": 100})
+
+        x, y = hud.health_bar_x, hud.health_bar_y
+        half = hud.health_bar_width // 2
+        assert mock_screen.get_at((x + half - 1, y + 1))[:3] == (255, 0, 0)
+        assert mock_screen.get_at((x + half, y + 1))[:3] == (0, 0, 0)
+
 
 class TestBaseScreen:
     """Tests for BaseScreen abstract class."""
@@ -383,6 +435,29 @@ class TestGameScreen:
         # Should have changed to PauseScreen
         assert isinstance(game._current_screen, PauseScreen)
 
+    def test_game_screen_updates_with_enemies(self) -> None:
+        """Test a frame update runs the enemy AI pass without errors."""
+        game = Game()
+        screen = GameScreen(game)
+        screen.enemies.append(Enemy((100, 100)))
+
+        screen.update(1 / 60)
+
+    def test_enemy_collisions_only_damage_from_live_overlaps(self) -> None:
+        """Test the batched overlap check skips distant and dead enemies."""
+        game = Game()
+        screen = GameScreen(game)
+        near = Enemy(screen.player.hitbox.topleft)
+        far = Enemy((screen.player.hitbox.x + 1000, screen.player.hitbox.y))
+        dead = Enemy(screen.player.hitbox.topleft)
+        dead.health = 0
+        screen.enemies = [far, dead, near]
+        health = screen.player.health
+
+        screen._check_enemy_collisions([enemy.hitbox for enemy in screen.enemies])
+
+        assert screen.player.health == health - near.get_damage()
+
 
 class TestPauseScreen:
     """Tests for PauseScreen."""
@@ -535,6 +610,23 @@ class TestCreditsScreen:
         # Should not raise exception
         screen.render(mock_screen)
     
+    def test_credits_screen_renders_static_surface(self, mock_screen: pygame.Surface) -> None:
+        """Test render draws the pre-rendered credits without re-rendering text."""
+        game = Game()
+        screen = CreditsScreen(game)
+
+        def fail_render(*args: object, **kwargs: object) -> pygame.Surface:
+            raise AssertionError("credits text re-rendered during render()")
+
+        screen.title_font = screen.text_font = screen.small_font = type(
+            "NoRender", (), {"render": staticmethod(fail_render)}
+        )()
+        mock_screen.fill((255, 0, 255))
+        screen.render(mock_screen)
+
+        expected = screen._static_surface.get_at((0, 0))
+        assert mock_screen.get_at((0, 0)) == expected
+
     def test_credits_screen_back_button(self) -> None:
         """Test Back button returns to menu screen."""
         game = Game()